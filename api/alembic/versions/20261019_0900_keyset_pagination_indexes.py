@@ -0,0 +1,38 @@
+"""keyset pagination indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite (tenant_id, sort key, id) indexes backing cursor pagination
+    op.create_index('ix_appointments_tenant_scheduled_start_id', 'appointments', ['tenant_id', 'scheduled_start', 'id'], unique=False)
+    op.create_index('ix_payments_tenant_created_at_id', 'payments', ['tenant_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_owners_tenant_created_at_id', 'owners', ['tenant_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_pets_tenant_created_at_id', 'pets', ['tenant_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_packages_tenant_created_at_id', 'packages', ['tenant_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_vaccination_records_tenant_expiry_date_id', 'vaccination_records', ['tenant_id', 'expiry_date', 'id'], unique=False)
+    op.create_index('ix_staff_tenant_created_at_id', 'staff', ['tenant_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_resources_tenant_display_order_name_id', 'resources', ['tenant_id', 'display_order', 'name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resources_tenant_display_order_name_id', table_name='resources')
+    op.drop_index('ix_staff_tenant_created_at_id', table_name='staff')
+    op.drop_index('ix_vaccination_records_tenant_expiry_date_id', table_name='vaccination_records')
+    op.drop_index('ix_packages_tenant_created_at_id', table_name='packages')
+    op.drop_index('ix_pets_tenant_created_at_id', table_name='pets')
+    op.drop_index('ix_owners_tenant_created_at_id', table_name='owners')
+    op.drop_index('ix_payments_tenant_created_at_id', table_name='payments')
+    op.drop_index('ix_appointments_tenant_scheduled_start_id', table_name='appointments')
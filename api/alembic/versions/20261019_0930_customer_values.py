@@ -0,0 +1,37 @@
+"""customer values
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('customer_values',
+        sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('lifetime_revenue', sa.Integer(), nullable=False),
+        sa.Column('appointment_count', sa.Integer(), nullable=False),
+        sa.Column('last_visit_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['owner_id'], ['owners.id'], ),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+        sa.PrimaryKeyConstraint('owner_id')
+    )
+    op.create_index('ix_customer_values_tenant_revenue_owner', 'customer_values', ['tenant_id', 'lifetime_revenue', 'owner_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customer_values_tenant_revenue_owner', table_name='customer_values')
+    op.drop_table('customer_values')
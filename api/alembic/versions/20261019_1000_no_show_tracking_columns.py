@@ -0,0 +1,58 @@
+"""no-show tracking columns
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Appointment arrival / completion / no-show tracking
+    op.add_column('appointments', sa.Column('arrived_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('appointments', sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('appointments', sa.Column('is_no_show', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+
+    # Owner reputation counters
+    op.add_column('owners', sa.Column('reputation_score', sa.Integer(), server_default=sa.text('100'), nullable=False))
+    op.add_column('owners', sa.Column('no_show_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('owners', sa.Column('late_cancellation_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('owners', sa.Column('completed_appointment_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('owners', sa.Column('last_reputation_update', sa.DateTime(timezone=True), nullable=True))
+
+    # Backfill from existing appointment history
+    op.execute("UPDATE appointments SET is_no_show = true WHERE status = 'NO_SHOW'")
+    op.execute("""
+        UPDATE owners SET
+            no_show_count = counts.no_shows,
+            completed_appointment_count = counts.completed
+        FROM (
+            SELECT owner_id,
+                   count(*) FILTER (WHERE status = 'NO_SHOW') AS no_shows,
+                   count(*) FILTER (WHERE status = 'COMPLETED') AS completed
+            FROM appointments
+            WHERE deleted_at IS NULL
+            GROUP BY owner_id
+        ) AS counts
+        WHERE owners.id = counts.owner_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('owners', 'last_reputation_update')
+    op.drop_column('owners', 'completed_appointment_count')
+    op.drop_column('owners', 'late_cancellation_count')
+    op.drop_column('owners', 'no_show_count')
+    op.drop_column('owners', 'reputation_score')
+    op.drop_column('appointments', 'is_no_show')
+    op.drop_column('appointments', 'completed_at')
+    op.drop_column('appointments', 'arrived_at')
@@ -0,0 +1,46 @@
+"""job runs
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 10:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('job_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('job_name', sa.String(length=100), nullable=False),
+        sa.Column('scheduled_for', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobrunstatus'), nullable=False),
+        sa.Column('worker_id', sa.String(length=255), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_name', 'scheduled_for', 'tenant_id', name='uq_job_runs_job_slot_tenant')
+    )
+    op.create_index(op.f('ix_job_runs_tenant_id'), 'job_runs', ['tenant_id'], unique=False)
+    op.create_index('ix_job_runs_job_slot_status', 'job_runs', ['job_name', 'scheduled_for', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_runs_job_slot_status', table_name='job_runs')
+    op.drop_index(op.f('ix_job_runs_tenant_id'), table_name='job_runs')
+    op.drop_table('job_runs')
+    sa.Enum(name='jobrunstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,32 @@
+"""reminder due indexes
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 11:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_appointments_reminder_24h_due', 'appointments', ['scheduled_start'], unique=False,
+        postgresql_where=sa.text('reminder_24h_sent_at IS NULL AND deleted_at IS NULL')
+    )
+    op.create_index(
+        'ix_appointments_reminder_2h_due', 'appointments', ['scheduled_start'], unique=False,
+        postgresql_where=sa.text('reminder_2h_sent_at IS NULL AND deleted_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_appointments_reminder_2h_due', table_name='appointments')
+    op.drop_index('ix_appointments_reminder_24h_due', table_name='appointments')
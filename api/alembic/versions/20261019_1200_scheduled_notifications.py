@@ -0,0 +1,82 @@
+"""scheduled notifications
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('scheduled_notifications',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('subject_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('due_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'DISPATCHED', 'CANCELLED', name='schedulednotificationstatus'), nullable=False),
+        sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'subject_id', name='uq_scheduled_notifications_kind_subject')
+    )
+    op.create_index(op.f('ix_scheduled_notifications_tenant_id'), 'scheduled_notifications', ['tenant_id'], unique=False)
+    op.create_index(op.f('ix_scheduled_notifications_subject_id'), 'scheduled_notifications', ['subject_id'], unique=False)
+    op.create_index(
+        'ix_scheduled_notifications_pending_due_at', 'scheduled_notifications', ['due_at'], unique=False,
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+    # Backfill reminders for upcoming appointments not yet reminded
+    op.execute("""
+        INSERT INTO scheduled_notifications (id, tenant_id, kind, subject_id, due_at, status)
+        SELECT gen_random_uuid(), tenant_id, 'reminder_24h', id,
+               greatest(scheduled_start - interval '24 hours', now()), 'PENDING'
+        FROM appointments
+        WHERE status IN ('PENDING', 'CONFIRMED')
+          AND deleted_at IS NULL
+          AND reminder_24h_sent_at IS NULL
+          AND scheduled_start > now() + interval '12 hours'
+    """)
+    op.execute("""
+        INSERT INTO scheduled_notifications (id, tenant_id, kind, subject_id, due_at, status)
+        SELECT gen_random_uuid(), tenant_id, 'reminder_2h', id,
+               greatest(scheduled_start - interval '2 hours', now()), 'PENDING'
+        FROM appointments
+        WHERE status IN ('PENDING', 'CONFIRMED')
+          AND deleted_at IS NULL
+          AND reminder_2h_sent_at IS NULL
+          AND scheduled_start > now()
+    """)
+
+    # Backfill expiry alerts (06:00 UTC on the threshold day) not yet sent;
+    # thresholds already passed are due now
+    for days in (30, 14, 7):
+        op.execute(f"""
+            INSERT INTO scheduled_notifications (id, tenant_id, kind, subject_id, due_at, status)
+            SELECT gen_random_uuid(), tenant_id, 'vaccination_{days}d', id,
+                   greatest(((expiry_date - {days}) + time '06:00') AT TIME ZONE 'UTC', now()), 'PENDING'
+            FROM vaccination_records
+            WHERE deleted_at IS NULL
+              AND reminder_sent_{days}d = false
+              AND expiry_date >= current_date
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scheduled_notifications_pending_due_at', table_name='scheduled_notifications')
+    op.drop_index(op.f('ix_scheduled_notifications_subject_id'), table_name='scheduled_notifications')
+    op.drop_index(op.f('ix_scheduled_notifications_tenant_id'), table_name='scheduled_notifications')
+    op.drop_table('scheduled_notifications')
+    sa.Enum(name='schedulednotificationstatus').drop(op.get_bind(), checkfirst=True)
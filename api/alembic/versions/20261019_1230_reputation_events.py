@@ -0,0 +1,72 @@
+"""reputation events
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 12:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('reputation_events',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('sequence', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('appointment_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('points', sa.Integer(), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+        sa.ForeignKeyConstraint(['owner_id'], ['owners.id'], ),
+        sa.ForeignKeyConstraint(['appointment_id'], ['appointments.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('sequence'),
+        sa.UniqueConstraint('appointment_id', 'event_type', name='uq_reputation_events_appointment_event')
+    )
+    op.create_index(op.f('ix_reputation_events_tenant_id'), 'reputation_events', ['tenant_id'], unique=False)
+    op.create_index('ix_reputation_events_owner_sequence', 'reputation_events', ['owner_id', 'sequence'], unique=False)
+    op.create_index('ix_owners_tenant_reputation_score', 'owners', ['tenant_id', 'reputation_score'], unique=False)
+
+    # Seed the ledger from existing counters so a rebuild reproduces current
+    # scores: completed appointments, then no-shows, then late cancellations,
+    # then an adjustment that lands on the stored score (covers recoveries).
+    # Timestamps keep last_reputation_update, which gates recovery.
+    for event_type, counter, points in (
+        ('completed_appointment', 'completed_appointment_count', 2),
+        ('no_show', 'no_show_count', -20),
+        ('late_cancellation', 'late_cancellation_count', -10),
+    ):
+        op.execute(f"""
+            INSERT INTO reputation_events (id, tenant_id, owner_id, event_type, points, notes, created_at)
+            SELECT gen_random_uuid(), o.tenant_id, o.id, '{event_type}', {points}, 'Backfilled from owner counters',
+                   coalesce(o.last_reputation_update, o.created_at)
+            FROM owners o, generate_series(1, o.{counter})
+            ORDER BY o.id
+        """)
+    op.execute("""
+        INSERT INTO reputation_events (id, tenant_id, owner_id, event_type, points, notes, created_at)
+        SELECT gen_random_uuid(), o.tenant_id, o.id, 'adjustment',
+               o.reputation_score - greatest(0, 100 - 20 * o.no_show_count - 10 * o.late_cancellation_count),
+               'Backfilled to match stored score', coalesce(o.last_reputation_update, o.created_at)
+        FROM owners o
+        WHERE o.reputation_score <> greatest(0, 100 - 20 * o.no_show_count - 10 * o.late_cancellation_count)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_owners_tenant_reputation_score', table_name='owners')
+    op.drop_index('ix_reputation_events_owner_sequence', table_name='reputation_events')
+    op.drop_index(op.f('ix_reputation_events_tenant_id'), table_name='reputation_events')
+    op.drop_table('reputation_events')
@@ -0,0 +1,38 @@
+"""owner unpaid no-show fees
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 13:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('owners', sa.Column('unpaid_no_show_fees', sa.Integer(), server_default=sa.text('0'), nullable=False))
+
+    # Backfill from pending/failed no-show fee payments
+    op.execute("""
+        UPDATE owners o
+        SET unpaid_no_show_fees = p.unpaid
+        FROM (
+            SELECT owner_id, sum(amount) AS unpaid
+            FROM payments
+            WHERE type = 'NO_SHOW_FEE'
+              AND status IN ('PENDING', 'FAILED')
+            GROUP BY owner_id
+        ) p
+        WHERE p.owner_id = o.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('owners', 'unpaid_no_show_fees')
@@ -0,0 +1,38 @@
+"""owner search text
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 13:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('owners', sa.Column(
+        'search_text', sa.Text(),
+        sa.Computed(
+            "lower(first_name || ' ' || last_name || ' ' || email) || ' ' || "
+            "regexp_replace(phone, '[^0-9]', '', 'g')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index(
+        'ix_owners_search_text_trgm', 'owners', ['search_text'], unique=False,
+        postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_owners_search_text_trgm', table_name='owners')
+    op.drop_column('owners', 'search_text')
@@ -0,0 +1,80 @@
+"""search entries
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19 14:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('search_entries',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entity_type', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('subtitle', sa.String(length=500), nullable=True),
+        sa.Column('starts_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('search_text', sa.Text(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('entity_type', 'entity_id', name='uq_search_entries_entity')
+    )
+    op.create_index(op.f('ix_search_entries_tenant_id'), 'search_entries', ['tenant_id'], unique=False)
+    op.create_index(op.f('ix_search_entries_owner_id'), 'search_entries', ['owner_id'], unique=False)
+    op.create_index(
+        'ix_search_entries_search_text_trgm', 'search_entries', ['search_text'], unique=False,
+        postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'}
+    )
+
+    # Backfill (same rows SearchService writes on save)
+    op.execute("""
+        INSERT INTO search_entries (id, tenant_id, entity_type, entity_id, owner_id, title, subtitle, starts_at, search_text)
+        SELECT gen_random_uuid(), tenant_id, 'owner', id, id, first_name || ' ' || last_name, phone, NULL, search_text
+        FROM owners
+        WHERE deleted_at IS NULL
+    """)
+    op.execute("""
+        INSERT INTO search_entries (id, tenant_id, entity_type, entity_id, owner_id, title, subtitle, starts_at, search_text)
+        SELECT gen_random_uuid(), p.tenant_id, 'pet', p.id, p.owner_id, p.name,
+               concat_ws(' · ', coalesce(p.breed, p.species), o.first_name || ' ' || o.last_name), NULL,
+               lower(concat_ws(' ', p.name, p.breed, p.species, p.microchip_number))
+        FROM pets p
+        JOIN owners o ON o.id = p.owner_id
+        WHERE p.is_active AND p.deleted_at IS NULL
+    """)
+    op.execute("""
+        INSERT INTO search_entries (id, tenant_id, entity_type, entity_id, owner_id, title, subtitle, starts_at, search_text)
+        SELECT gen_random_uuid(), a.tenant_id, 'appointment', a.id, a.owner_id, s.name,
+               concat_ws(' · ', o.first_name || ' ' || o.last_name, pn.names), a.scheduled_start,
+               lower(concat_ws(' ', o.first_name || ' ' || o.last_name, pn.names, s.name))
+        FROM appointments a
+        JOIN owners o ON o.id = a.owner_id
+        JOIN services s ON s.id = a.service_id
+        CROSS JOIN LATERAL (
+            SELECT string_agg(p.name, ', ') AS names FROM pets p WHERE p.id = ANY(a.pet_ids)
+        ) pn
+        WHERE a.status IN ('PENDING', 'CONFIRMED')
+          AND a.deleted_at IS NULL
+          AND a.scheduled_start >= now()
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_search_entries_search_text_trgm', table_name='search_entries')
+    op.drop_index(op.f('ix_search_entries_owner_id'), table_name='search_entries')
+    op.drop_index(op.f('ix_search_entries_tenant_id'), table_name='search_entries')
+    op.drop_table('search_entries')
@@ -0,0 +1,31 @@
+"""sms status callbacks
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19 15:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('sms_status_callbacks',
+        sa.Column('provider_sid', sa.String(length=64), nullable=False),
+        sa.Column('status', postgresql.ENUM('QUEUED', 'SENDING', 'SENT', 'DELIVERED', 'UNDELIVERED', 'FAILED', name='smsstatus', create_type=False), nullable=False),
+        sa.Column('error_code', sa.String(length=32), nullable=True),
+        sa.Column('received_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('provider_sid')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sms_status_callbacks')
@@ -0,0 +1,104 @@
+"""
+List endpoint serialization benchmark
+Compares the response_model path with the column-row + orjson fast path
+
+response_model path: ORM objects validated with a precomputed
+TypeAdapter(List[AppointmentResponse]) (from_attributes), dumped to JSON
+types and encoded with the stdlib encoder, as FastAPI does for a route
+returning ORM objects.
+
+Fast path: column rows turned into dicts and encoded by ORJSONResponse
+(src.core.serialization.fast_json_response).
+
+No database is needed; rows are built in memory, so database transfer and
+ORM hydration savings from selecting fewer columns are not included.
+
+Usage:
+    python benchmarks/list_serialization.py [page_size] [iterations]
+"""
+import sys
+import json
+import timeit
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from src.core.serialization import fast_json_response
+from src.models.appointment import Appointment, AppointmentStatus, AppointmentSource
+from src.schemas.appointment import AppointmentResponse
+
+FIELDS = list(AppointmentResponse.model_fields)
+Row = namedtuple("Row", FIELDS)
+
+ADAPTER = TypeAdapter(List[AppointmentResponse])
+
+
+def build_values(page_size: int) -> List[dict]:
+    """Column values for a page of appointments"""
+    tenant_id = uuid.uuid4()
+    start = datetime(2025, 11, 15, 9, 0)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "tenant_id": tenant_id,
+            "owner_id": uuid.uuid4(),
+            "pet_ids": [uuid.uuid4()],
+            "service_id": uuid.uuid4(),
+            "staff_id": uuid.uuid4(),
+            "resource_id": None,
+            "scheduled_start": start + timedelta(minutes=30 * i),
+            "scheduled_end": start + timedelta(minutes=30 * i + 60),
+            "customer_notes": "Please use the side door",
+            "status": AppointmentStatus.CONFIRMED,
+            "source": AppointmentSource.ONLINE,
+            "deposit_required": 1000,
+            "deposit_paid": 1000,
+            "total_amount": 5000,
+            "amount_paid": 0,
+            "vaccination_verified": True,
+            "created_at": start - timedelta(days=3),
+        }
+        for i in range(page_size)
+    ]
+
+
+def response_model_path(objects: List[Appointment]) -> bytes:
+    """Validate ORM objects against the schema, then encode with json"""
+    validated = ADAPTER.validate_python(objects, from_attributes=True)
+    return json.dumps(ADAPTER.dump_python(validated, mode="json")).encode()
+
+
+def fast_path(rows: List[Row]) -> bytes:
+    """Encode column rows directly with orjson"""
+    return fast_json_response(rows, Response()).body
+
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    values = build_values(page_size)
+    objects = [Appointment(**v) for v in values]
+    rows = [Row(**v) for v in values]
+
+    assert json.loads(response_model_path(objects)) and json.loads(fast_path(rows))
+
+    for name, func, data in (
+        ("response_model + json", response_model_path, objects),
+        ("column rows + orjson", fast_path, rows),
+    ):
+        seconds = min(timeit.repeat(lambda: func(data), number=iterations, repeat=3))
+        per_page_us = seconds / iterations * 1_000_000
+        print(f"{name:<24} {per_page_us:>10.1f} us/page ({page_size} rows)")
+
+
+if __name__ == "__main__":
+    main()
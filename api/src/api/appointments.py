@@ -1,26 +1,42 @@
 """
 Appointment API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from uuid import UUID
 import uuid
 
 from ..db.base import get_db
+from ..core.config import settings
 from ..core.dependencies import get_current_user, get_current_tenant, get_public_tenant, require_staff_or_admin
+from ..core.http_cache import conditional_get
+from ..core.pagination import paginate_list
+from ..core.serialization import etag_json_response, fast_json_response, response_columns
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.appointment import Appointment, AppointmentStatus
 from ..models.owner import Owner
 from ..models.service import Service
-from ..schemas.appointment import AppointmentCreate, AppointmentUpdate, AppointmentResponse
+from ..schemas.appointment import AppointmentCreate, AppointmentUpdate, AppointmentResponse, CalendarAppointment
 from ..services.scheduling_service import SchedulingService
 from ..services.appointment_service import AppointmentService
+from ..services.entity_version_service import APPOINTMENTS, SERVICES, STAFF
 
 router = APIRouter()
 
+# List responses select only these columns
+LIST_COLUMNS = response_columns(Appointment, AppointmentResponse)
+
+# Public availability reads: short-lived, and re-tagged each half hour as past slots drop out
+AVAILABILITY_CONDITIONAL_GET = Depends(conditional_get(
+    SERVICES, STAFF, APPOINTMENTS,
+    tenant_dependency=get_public_tenant,
+    max_age=settings.HTTP_CACHE_AVAILABILITY_MAX_AGE_SECONDS,
+    time_bucket=timedelta(minutes=30)
+))
+
 
 @router.post("/", response_model=AppointmentResponse, status_code=status.HTTP_201_CREATED)
 async def create_appointment(
@@ -32,6 +48,7 @@ async def create_appointment(
     Create new appointment (public endpoint for booking widget)
 
     Includes comprehensive validation:
+    - Customer reputation, block and unpaid no-show fee gate
     - Staff/resource availability checking
     - Double-booking prevention with row-level locking
     - Vaccination requirement validation
@@ -53,8 +70,10 @@ async def create_appointment(
 
 @router.get("/", response_model=List[AppointmentResponse])
 async def list_appointments(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     owner_id: UUID = None,
     staff_id: UUID = None,
     status: str = None,
@@ -66,8 +85,11 @@ async def list_appointments(
 ):
     """
     List appointments for current tenant
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (scheduled_start, id).
     """
-    query = db.query(Appointment).filter(Appointment.tenant_id == current_tenant.id)
+    query = db.query(*LIST_COLUMNS).filter(Appointment.tenant_id == current_tenant.id)
 
     if owner_id:
         query = query.filter(Appointment.owner_id == owner_id)
@@ -84,8 +106,45 @@ async def list_appointments(
     if end_date:
         query = query.filter(Appointment.scheduled_end <= end_date)
 
-    appointments = query.order_by(Appointment.scheduled_start).offset(skip).limit(limit).all()
-    return appointments
+    appointments = paginate_list(
+        query, [Appointment.scheduled_start, Appointment.id], response, skip, cursor, limit
+    )
+    return fast_json_response(appointments, response)
+
+
+@router.get("/calendar", response_model=List[CalendarAppointment])
+async def get_calendar(
+    request: Request,
+    response: Response,
+    start: datetime,
+    end: datetime,
+    staff_id: UUID = None,
+    include_cancelled: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    Calendar feed: appointments overlapping [start, end) with owner, pets,
+    service and staff details
+
+    Responses carry an ETag; send it back as If-None-Match to get 304 Not
+    Modified while the calendar is unchanged.
+    """
+    try:
+        appointments = AppointmentService.get_calendar(
+            db, current_tenant, start, end,
+            staff_id=staff_id,
+            include_cancelled=include_cancelled
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    response.headers["Cache-Control"] = "private, no-cache"
+    return etag_json_response(appointments, request, response)
 
 
 @router.get("/{appointment_id}", response_model=AppointmentResponse)
@@ -388,7 +447,7 @@ async def reschedule_appointment(
     return appointment
 
 
-@router.get("/availability/slots", response_model=List[dict])
+@router.get("/availability/slots", response_model=List[dict], dependencies=[AVAILABILITY_CONDITIONAL_GET])
 async def get_available_slots(
     service_id: UUID = Query(..., description="Service ID"),
     date: date = Query(..., description="Date to check"),
@@ -410,7 +469,7 @@ async def get_available_slots(
     return slots
 
 
-@router.get("/availability/next", response_model=dict)
+@router.get("/availability/next", response_model=dict, dependencies=[AVAILABILITY_CONDITIONAL_GET])
 async def get_next_available_slot(
     service_id: UUID = Query(..., description="Service ID"),
     start_date: date = Query(..., description="Start searching from this date"),
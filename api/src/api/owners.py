@@ -1,7 +1,7 @@
 """
 Owner API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -9,13 +9,19 @@ import uuid
 
 from ..db.base import get_db
 from ..core.dependencies import get_current_user, get_current_tenant, get_public_tenant, require_staff_or_admin
+from ..core.pagination import paginate_list
+from ..core.serialization import fast_json_response, response_columns
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.owner import Owner
-from ..schemas.owner import OwnerCreate, OwnerUpdate, OwnerResponse
+from ..schemas.owner import OwnerCreate, OwnerUpdate, OwnerResponse, OwnerSearchResult
+from ..services.owner_service import OwnerService
 
 router = APIRouter()
 
+# List responses select only these columns
+LIST_COLUMNS = response_columns(Owner, OwnerResponse)
+
 
 @router.post("/", response_model=OwnerResponse, status_code=status.HTTP_201_CREATED)
 async def create_owner(
@@ -53,8 +59,10 @@ async def create_owner(
 
 @router.get("/", response_model=List[OwnerResponse])
 async def list_owners(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     search: str = None,
     is_active: bool = None,
     db: Session = Depends(get_db),
@@ -62,23 +70,42 @@ async def list_owners(
 ):
     """
     List all pet owners for current tenant (public endpoint for booking widget search)
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (created_at, id).
     """
-    query = db.query(Owner).filter(Owner.tenant_id == current_tenant.id)
+    query = db.query(*LIST_COLUMNS).filter(Owner.tenant_id == current_tenant.id)
 
     if is_active is not None:
         query = query.filter(Owner.is_active == is_active)
 
     if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            (Owner.first_name.ilike(search_pattern)) |
-            (Owner.last_name.ilike(search_pattern)) |
-            (Owner.email.ilike(search_pattern)) |
-            (Owner.phone.ilike(search_pattern))
-        )
+        query = query.filter(OwnerService.search_condition(search))
+
+    owners = paginate_list(query, [Owner.created_at, Owner.id], response, skip, cursor, limit)
+    return fast_json_response(owners, response)
 
-    owners = query.offset(skip).limit(limit).all()
-    return owners
+
+@router.get("/search", response_model=List[OwnerSearchResult])
+async def search_owners(
+    q: str = Query(..., min_length=3, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    Typeahead owner search by name, email or phone (staff only)
+
+    Phone numbers match on digits regardless of formatting. Results are
+    ranked best match first.
+    """
+    return OwnerService.search_owners(
+        db=db,
+        tenant=current_tenant,
+        search=q,
+        limit=limit
+    )
 
 
 @router.get("/{owner_id}", response_model=OwnerResponse)
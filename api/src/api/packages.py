@@ -1,7 +1,7 @@
 """
 Package API endpoints (punch cards, class credits, memberships)
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -9,6 +9,8 @@ import uuid
 
 from ..db.base import get_db
 from ..core.dependencies import get_current_user, get_current_tenant, require_staff_or_admin
+from ..core.pagination import paginate_list
+from ..core.serialization import fast_json_response, response_columns
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.package import Package, PackageStatus
@@ -17,6 +19,9 @@ from ..schemas.package import PackageCreate, PackageUpdate, PackageResponse
 
 router = APIRouter()
 
+# List responses select only these columns
+LIST_COLUMNS = response_columns(Package, PackageResponse)
+
 
 @router.post("/", response_model=PackageResponse, status_code=status.HTTP_201_CREATED)
 async def create_package(
@@ -57,8 +62,10 @@ async def create_package(
 
 @router.get("/", response_model=List[PackageResponse])
 async def list_packages(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     owner_id: UUID = None,
     type: str = None,
     status: str = None,
@@ -68,8 +75,11 @@ async def list_packages(
 ):
     """
     List packages for current tenant
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (created_at, id), newest first.
     """
-    query = db.query(Package).filter(Package.tenant_id == current_tenant.id)
+    query = db.query(*LIST_COLUMNS).filter(Package.tenant_id == current_tenant.id)
 
     if owner_id:
         query = query.filter(Package.owner_id == owner_id)
@@ -80,8 +90,10 @@ async def list_packages(
     if status:
         query = query.filter(Package.status == status)
 
-    packages = query.order_by(Package.created_at.desc()).offset(skip).limit(limit).all()
-    return packages
+    packages = paginate_list(
+        query, [Package.created_at, Package.id], response, skip, cursor, limit, descending=True
+    )
+    return fast_json_response(packages, response)
 
 
 @router.get("/{package_id}", response_model=PackageResponse)
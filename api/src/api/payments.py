@@ -1,7 +1,7 @@
 """
 Payment API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -9,6 +9,8 @@ import uuid
 
 from ..db.base import get_db
 from ..core.dependencies import get_current_user, get_current_tenant, require_staff_or_admin
+from ..core.pagination import paginate_list
+from ..core.serialization import fast_json_response, response_columns
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.payment import Payment, PaymentStatus
@@ -17,6 +19,9 @@ from ..schemas.payment import PaymentCreate, PaymentUpdate, PaymentResponse
 
 router = APIRouter()
 
+# List responses select only these columns
+LIST_COLUMNS = response_columns(Payment, PaymentResponse)
+
 
 @router.post("/", response_model=PaymentResponse, status_code=status.HTTP_201_CREATED)
 async def create_payment(
@@ -59,8 +64,10 @@ async def create_payment(
 
 @router.get("/", response_model=List[PaymentResponse])
 async def list_payments(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     owner_id: UUID = None,
     appointment_id: UUID = None,
     status: str = None,
@@ -71,8 +78,11 @@ async def list_payments(
 ):
     """
     List payments for current tenant
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (created_at, id), newest first.
     """
-    query = db.query(Payment).filter(Payment.tenant_id == current_tenant.id)
+    query = db.query(*LIST_COLUMNS).filter(Payment.tenant_id == current_tenant.id)
 
     if owner_id:
         query = query.filter(Payment.owner_id == owner_id)
@@ -86,8 +96,10 @@ async def list_payments(
     if type:
         query = query.filter(Payment.type == type)
 
-    payments = query.order_by(Payment.created_at.desc()).offset(skip).limit(limit).all()
-    return payments
+    payments = paginate_list(
+        query, [Payment.created_at, Payment.id], response, skip, cursor, limit, descending=True
+    )
+    return fast_json_response(payments, response)
 
 
 @router.get("/{payment_id}", response_model=PaymentResponse)
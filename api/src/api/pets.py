@@ -1,7 +1,7 @@
 """
 Pet API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -9,6 +9,8 @@ import uuid
 
 from ..db.base import get_db
 from ..core.dependencies import get_current_user, get_current_tenant, get_public_tenant, require_staff_or_admin
+from ..core.pagination import paginate_list
+from ..core.serialization import fast_json_response, response_columns
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.pet import Pet
@@ -17,6 +19,9 @@ from ..schemas.pet import PetCreate, PetUpdate, PetResponse
 
 router = APIRouter()
 
+# List responses select only these columns
+LIST_COLUMNS = response_columns(Pet, PetResponse)
+
 
 @router.post("/", response_model=PetResponse, status_code=status.HTTP_201_CREATED)
 async def create_pet(
@@ -54,8 +59,10 @@ async def create_pet(
 
 @router.get("/", response_model=List[PetResponse])
 async def list_pets(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     owner_id: UUID = None,
     species: str = None,
     is_active: bool = None,
@@ -65,8 +72,11 @@ async def list_pets(
 ):
     """
     List pets for current tenant
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (created_at, id).
     """
-    query = db.query(Pet).filter(Pet.tenant_id == current_tenant.id)
+    query = db.query(*LIST_COLUMNS).filter(Pet.tenant_id == current_tenant.id)
 
     if owner_id:
         query = query.filter(Pet.owner_id == owner_id)
@@ -77,8 +87,8 @@ async def list_pets(
     if is_active is not None:
         query = query.filter(Pet.is_active == is_active)
 
-    pets = query.offset(skip).limit(limit).all()
-    return pets
+    pets = paginate_list(query, [Pet.created_at, Pet.id], response, skip, cursor, limit)
+    return fast_json_response(pets, response)
 
 
 @router.get("/{pet_id}", response_model=PetResponse)
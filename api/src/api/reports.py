@@ -0,0 +1,250 @@
+"""
+Reports API endpoints
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+
+from ..db.base import get_db
+from ..core.dependencies import get_current_tenant, require_staff_or_admin
+from ..core.pagination import NEXT_CURSOR_HEADER
+from ..models.user import User
+from ..models.tenant import Tenant
+from ..services.customer_value_service import CustomerValueService
+from ..services.reporting_service import ReportingService
+from ..services.reputation_service import ReputationService
+from ..services.vaccination_monitoring_service import VaccinationMonitoringService
+
+router = APIRouter()
+
+
+@router.get("/customers/by-value", response_model=List[dict])
+async def list_customers_by_value(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    min_revenue: Optional[int] = Query(None, ge=0, description="Minimum lifetime revenue in cents"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    List customers ranked by lifetime revenue, highest first
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` to fetch
+    the next page.
+    """
+    try:
+        customers, next_cursor = CustomerValueService.list_customers_by_value(
+            db=db,
+            tenant_id=current_tenant.id,
+            cursor=cursor,
+            limit=limit,
+            min_revenue=min_revenue
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return customers
+
+
+@router.get("/customers/high-risk", response_model=List[dict])
+async def list_high_risk_customers(
+    response: Response,
+    min_no_shows: int = Query(2, ge=1),
+    sort_by: str = Query("no_show_count", description="no_show_count, no_show_rate or reputation_score"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    List customers with repeated no-shows, with appointment totals and no-show rate
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` to fetch
+    the next page.
+    """
+    try:
+        customers, next_cursor = ReputationService.list_customer_risk(
+            db=db,
+            tenant_id=current_tenant.id,
+            min_no_shows=min_no_shows,
+            sort_by=sort_by,
+            cursor=cursor,
+            limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return customers
+
+
+@router.get("/customers/by-reputation", response_model=List[dict])
+async def list_customers_by_reputation(
+    response: Response,
+    category: str = Query(..., description="excellent, good, fair, poor or restricted"),
+    sort_by: str = Query("reputation_score", description="no_show_count, no_show_rate or reputation_score"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    List customers in a reputation category, with appointment totals and no-show rate
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` to fetch
+    the next page.
+    """
+    try:
+        customers, next_cursor = ReputationService.list_customer_risk(
+            db=db,
+            tenant_id=current_tenant.id,
+            category=category,
+            sort_by=sort_by,
+            cursor=cursor,
+            limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return customers
+
+
+@router.get("/vaccinations/expiring", response_model=List[dict])
+async def list_expiring_vaccinations(
+    response: Response,
+    days_ahead: int = Query(30, ge=0, le=365),
+    group_by_owner: bool = False,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    List vaccinations expiring within `days_ahead`, soonest first, for outreach
+
+    With group_by_owner, returns one row per owner with all their expiring
+    pets' vaccinations. Pass the X-Next-Cursor header of the previous page as
+    `cursor` to fetch the next page.
+    """
+    try:
+        items, next_cursor = VaccinationMonitoringService.list_expiring_vaccinations(
+            db=db,
+            tenant_id=current_tenant.id,
+            days_ahead=days_ahead,
+            cursor=cursor,
+            limit=limit,
+            group_by_owner=group_by_owner
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return items
+
+
+@router.get("/retention")
+async def get_retention_report(
+    start_date: date,
+    end_date: date,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    Get new, repeat, active, retained and churned customer counts for a period
+    """
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must be on or after start_date"
+        )
+
+    return ReportingService.get_customer_retention_report(
+        db=db,
+        tenant_id=current_tenant.id,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+
+@router.get("/retention/cohorts")
+async def get_cohort_retention_report(
+    start_date: date,
+    end_date: date,
+    months: int = Query(12, ge=1, le=36),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    Get cohort retention table for customers who signed up between start_date and end_date
+
+    Each cohort is a signup month; `retention` lists how many of its customers
+    visited in each month since signup.
+    """
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must be on or after start_date"
+        )
+
+    return ReportingService.get_cohort_retention_report(
+        db=db,
+        tenant_id=current_tenant.id,
+        start_date=start_date,
+        end_date=end_date,
+        months=months
+    )
+
+
+@router.get("/staff/performance", response_model=List[dict])
+async def get_team_performance(
+    start_date: date,
+    end_date: date,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    Get performance metrics for all staff members in a date range
+    """
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must be on or after start_date"
+        )
+
+    return ReportingService.get_team_performance(
+        db=db,
+        tenant_id=current_tenant.id,
+        start_date=start_date,
+        end_date=end_date
+    )
@@ -1,7 +1,7 @@
 """
 Resource API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -9,13 +9,21 @@ import uuid
 
 from ..db.base import get_db
 from ..core.dependencies import get_current_user, get_current_tenant, require_owner
+from ..core.http_cache import conditional_get
+from ..core.pagination import paginate_rows
+from ..core.serialization import fast_json_response
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.resource import Resource
 from ..schemas.resource import ResourceCreate, ResourceUpdate, ResourceResponse
+from ..services.catalog_service import RESOURCE_ORDER, CatalogService
+from ..services.entity_version_service import RESOURCES
 
 router = APIRouter()
 
+# Reads answer If-None-Match from the tenant's resources version
+CONDITIONAL_GET = Depends(conditional_get(RESOURCES, tenant_dependency=get_current_tenant))
+
 
 @router.post("/", response_model=ResourceResponse, status_code=status.HTTP_201_CREATED)
 async def create_resource(
@@ -40,10 +48,12 @@ async def create_resource(
     return resource
 
 
-@router.get("/", response_model=List[ResourceResponse])
+@router.get("/", response_model=List[ResourceResponse], dependencies=[CONDITIONAL_GET])
 async def list_resources(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     type: str = None,
     is_active: bool = None,
     is_bookable: bool = None,
@@ -53,23 +63,27 @@ async def list_resources(
 ):
     """
     List resources for current tenant
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (display_order, name, id).
     """
-    query = db.query(Resource).filter(Resource.tenant_id == current_tenant.id)
+    # Served from the catalog snapshot, already in (display_order, name, id) order
+    resources = CatalogService.get_snapshot(db, current_tenant.id).resources
 
     if type:
-        query = query.filter(Resource.type == type)
+        resources = [r for r in resources if r.type == type]
 
     if is_active is not None:
-        query = query.filter(Resource.is_active == is_active)
+        resources = [r for r in resources if r.is_active == is_active]
 
     if is_bookable is not None:
-        query = query.filter(Resource.is_bookable == is_bookable)
+        resources = [r for r in resources if r.is_bookable == is_bookable]
 
-    resources = query.order_by(Resource.display_order, Resource.name).offset(skip).limit(limit).all()
-    return resources
+    resources = paginate_rows(resources, RESOURCE_ORDER, response, skip, cursor, limit)
+    return fast_json_response(resources, response, ResourceResponse)
 
 
-@router.get("/{resource_id}", response_model=ResourceResponse)
+@router.get("/{resource_id}", response_model=ResourceResponse, dependencies=[CONDITIONAL_GET])
 async def get_resource(
     resource_id: UUID,
     db: Session = Depends(get_db),
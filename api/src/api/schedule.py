@@ -5,11 +5,13 @@ Sprint 2 - Scheduling Engine
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from uuid import UUID
 
 from ..db.session import get_db
 from ..core.dependencies import get_current_tenant
+from ..core.http_cache import conditional_get
+from ..services.entity_version_service import APPOINTMENTS, SERVICES, STAFF
 from ..services.scheduling_service import SchedulingService
 from ..models.tenant import Tenant
 from pydantic import BaseModel
@@ -17,6 +19,13 @@ from pydantic import BaseModel
 
 router = APIRouter()
 
+# Availability reads revalidate from the tenant's versions, re-tagged each half hour
+AVAILABILITY_CONDITIONAL_GET = Depends(conditional_get(
+    SERVICES, STAFF, APPOINTMENTS,
+    tenant_dependency=get_current_tenant,
+    time_bucket=timedelta(minutes=30)
+))
+
 
 # ==================== REQUEST/RESPONSE SCHEMAS ====================
 
@@ -52,7 +61,7 @@ class NextAvailableSlotResponse(BaseModel):
 
 # ==================== ENDPOINTS ====================
 
-@router.get("/available-slots", response_model=List[dict])
+@router.get("/available-slots", response_model=List[dict], dependencies=[AVAILABILITY_CONDITIONAL_GET])
 def get_available_time_slots(
     service_id: UUID,
     date: date,
@@ -171,7 +180,7 @@ def check_resource_availability(
     )
 
 
-@router.get("/next-available", response_model=NextAvailableSlotResponse)
+@router.get("/next-available", response_model=NextAvailableSlotResponse, dependencies=[AVAILABILITY_CONDITIONAL_GET])
 def find_next_available_slot(
     service_id: UUID,
     start_date: Optional[date] = None,
@@ -247,6 +256,7 @@ def get_staff_daily_availability(
     """
     from ..models.staff import Staff
     from ..models.appointment import Appointment, AppointmentStatus
+    from ..models.service import Service
 
     # Get staff member
     staff = db.query(Staff).filter(
@@ -269,7 +279,15 @@ def get_staff_daily_availability(
     start_of_day = datetime.combine(date, datetime.min.time())
     end_of_day = datetime.combine(date, datetime.max.time())
 
-    appointments = db.query(Appointment).filter(
+    # Service name joined in, not lazy loaded per appointment
+    appointments = db.query(
+        Appointment.id,
+        Appointment.scheduled_start,
+        Appointment.scheduled_end,
+        Service.name.label("service_name")
+    ).outerjoin(
+        Service, Service.id == Appointment.service_id
+    ).filter(
         Appointment.staff_id == staff_id,
         Appointment.tenant_id == tenant.id,
         Appointment.scheduled_start >= start_of_day,
@@ -287,7 +305,7 @@ def get_staff_daily_availability(
             "start": appt.scheduled_start.isoformat(),
             "end": appt.scheduled_end.isoformat(),
             "appointment_id": str(appt.id),
-            "service": appt.service.name if appt.service else None
+            "service": appt.service_name
         }
         for appt in appointments
     ]
@@ -326,6 +344,7 @@ def get_resource_daily_availability(
     """
     from ..models.resource import Resource
     from ..models.appointment import Appointment, AppointmentStatus
+    from ..models.service import Service
 
     # Get resource
     resource = db.query(Resource).filter(
@@ -348,7 +367,15 @@ def get_resource_daily_availability(
     start_of_day = datetime.combine(date, datetime.min.time())
     end_of_day = datetime.combine(date, datetime.max.time())
 
-    appointments = db.query(Appointment).filter(
+    # Service name joined in, not lazy loaded per appointment
+    appointments = db.query(
+        Appointment.id,
+        Appointment.scheduled_start,
+        Appointment.scheduled_end,
+        Service.name.label("service_name")
+    ).outerjoin(
+        Service, Service.id == Appointment.service_id
+    ).filter(
         Appointment.resource_id == resource_id,
         Appointment.tenant_id == tenant.id,
         Appointment.scheduled_start >= start_of_day,
@@ -366,7 +393,7 @@ def get_resource_daily_availability(
             "start": appt.scheduled_start.isoformat(),
             "end": appt.scheduled_end.isoformat(),
             "appointment_id": str(appt.id),
-            "service": appt.service.name if appt.service else None
+            "service": appt.service_name
         }
         for appt in appointments
     ]
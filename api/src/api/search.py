@@ -0,0 +1,35 @@
+"""
+Search API endpoints
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ..db.base import get_db
+from ..core.dependencies import get_current_tenant, require_staff_or_admin
+from ..models.user import User
+from ..models.tenant import Tenant
+from ..services.search_service import SearchService
+
+router = APIRouter()
+
+
+@router.get("/")
+async def search(
+    q: str = Query(..., min_length=3, max_length=100),
+    limit: int = Query(SearchService.DEFAULT_LIMIT, ge=1, le=20, description="Results per group"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_staff_or_admin),
+    current_tenant: Tenant = Depends(get_current_tenant)
+):
+    """
+    Search owners, pets (name, breed, microchip) and upcoming appointments at once
+
+    Returns ranked results grouped as owners, pets and appointments.
+    Staff and admins only, as results include owner contact details.
+    """
+    return SearchService.search(
+        db=db,
+        tenant_id=current_tenant.id,
+        search=q,
+        limit=limit
+    )
@@ -1,21 +1,33 @@
 """
 Service API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 import uuid
 
 from ..db.base import get_db
+from ..core.config import settings
 from ..core.dependencies import get_current_user, get_current_tenant, get_public_tenant, require_owner
+from ..core.http_cache import conditional_get
+from ..core.serialization import fast_json_response
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.service import Service
 from ..schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse
+from ..services.catalog_service import CatalogService
+from ..services.entity_version_service import SERVICES
 
 router = APIRouter()
 
+# Public reads: cacheable by browsers and CDNs, revalidated from the services version
+CONDITIONAL_GET = Depends(conditional_get(
+    SERVICES,
+    tenant_dependency=get_public_tenant,
+    max_age=settings.HTTP_CACHE_CATALOG_MAX_AGE_SECONDS
+))
+
 
 @router.post("/", response_model=ServiceResponse, status_code=status.HTTP_201_CREATED)
 async def create_service(
@@ -40,8 +52,9 @@ async def create_service(
     return service
 
 
-@router.get("/", response_model=List[ServiceResponse])
+@router.get("/", response_model=List[ServiceResponse], dependencies=[CONDITIONAL_GET])
 async def list_services(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     category: str = None,
@@ -53,22 +66,22 @@ async def list_services(
     """
     List services for current tenant (public endpoint for booking widget)
     """
-    query = db.query(Service).filter(Service.tenant_id == current_tenant.id)
+    # Served from the catalog snapshot, already in (display_order, name) order
+    services = CatalogService.get_snapshot(db, current_tenant.id).services
 
     if category:
-        query = query.filter(Service.category == category)
+        services = [s for s in services if s.category == category]
 
     if is_active is not None:
-        query = query.filter(Service.is_active == is_active)
+        services = [s for s in services if s.is_active == is_active]
 
     if is_bookable_online is not None:
-        query = query.filter(Service.is_bookable_online == is_bookable_online)
+        services = [s for s in services if s.is_bookable_online == is_bookable_online]
 
-    services = query.order_by(Service.display_order, Service.name).offset(skip).limit(limit).all()
-    return services
+    return fast_json_response(services[skip:skip + limit], response, ServiceResponse)
 
 
-@router.get("/{service_id}", response_model=ServiceResponse)
+@router.get("/{service_id}", response_model=ServiceResponse, dependencies=[CONDITIONAL_GET])
 async def get_service(
     service_id: UUID,
     db: Session = Depends(get_db),
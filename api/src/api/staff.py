@@ -1,7 +1,7 @@
 """
 Staff API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -9,13 +9,21 @@ import uuid
 
 from ..db.base import get_db
 from ..core.dependencies import get_current_user, get_current_tenant, require_owner
+from ..core.http_cache import conditional_get
+from ..core.pagination import paginate_rows
+from ..core.serialization import fast_json_response
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.staff import Staff
 from ..schemas.staff import StaffCreate, StaffUpdate, StaffResponse
+from ..services.catalog_service import STAFF_ORDER, CatalogService
+from ..services.entity_version_service import STAFF
 
 router = APIRouter()
 
+# Reads answer If-None-Match from the tenant's staff version
+CONDITIONAL_GET = Depends(conditional_get(STAFF, tenant_dependency=get_current_tenant))
+
 
 @router.post("/", response_model=StaffResponse, status_code=status.HTTP_201_CREATED)
 async def create_staff(
@@ -40,10 +48,12 @@ async def create_staff(
     return staff
 
 
-@router.get("/", response_model=List[StaffResponse])
+@router.get("/", response_model=List[StaffResponse], dependencies=[CONDITIONAL_GET])
 async def list_staff(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     is_active: bool = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -51,17 +61,21 @@ async def list_staff(
 ):
     """
     List all staff members for current tenant
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (created_at, id).
     """
-    query = db.query(Staff).filter(Staff.tenant_id == current_tenant.id)
+    # Served from the catalog snapshot, already in (created_at, id) order
+    staff_list = CatalogService.get_snapshot(db, current_tenant.id).staff
 
     if is_active is not None:
-        query = query.filter(Staff.is_active == is_active)
+        staff_list = [s for s in staff_list if s.is_active == is_active]
 
-    staff_list = query.offset(skip).limit(limit).all()
-    return staff_list
+    staff_list = paginate_rows(staff_list, STAFF_ORDER, response, skip, cursor, limit)
+    return fast_json_response(staff_list, response, StaffResponse)
 
 
-@router.get("/{staff_id}", response_model=StaffResponse)
+@router.get("/{staff_id}", response_model=StaffResponse, dependencies=[CONDITIONAL_GET])
 async def get_staff(
     staff_id: UUID,
     db: Session = Depends(get_db),
@@ -1,7 +1,7 @@
 """
 Vaccination record API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -9,6 +9,8 @@ import uuid
 
 from ..db.base import get_db
 from ..core.dependencies import get_current_user, get_current_tenant, require_staff_or_admin
+from ..core.pagination import paginate_list
+from ..core.serialization import fast_json_response, response_columns
 from ..models.user import User
 from ..models.tenant import Tenant
 from ..models.vaccination_record import VaccinationRecord
@@ -17,6 +19,9 @@ from ..schemas.vaccination_record import VaccinationRecordCreate, VaccinationRec
 
 router = APIRouter()
 
+# List responses select only these columns
+LIST_COLUMNS = response_columns(VaccinationRecord, VaccinationRecordResponse)
+
 
 @router.post("/", response_model=VaccinationRecordResponse, status_code=status.HTTP_201_CREATED)
 async def create_vaccination_record(
@@ -63,8 +68,10 @@ async def create_vaccination_record(
 
 @router.get("/", response_model=List[VaccinationRecordResponse])
 async def list_vaccination_records(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str = None,
     pet_id: UUID = None,
     type: str = None,
     status: str = None,
@@ -74,8 +81,11 @@ async def list_vaccination_records(
 ):
     """
     List vaccination records for current tenant
+
+    Pass the X-Next-Cursor header of the previous page as `cursor` for
+    keyset pagination over (expiry_date, id), latest expiry first.
     """
-    query = db.query(VaccinationRecord).filter(VaccinationRecord.tenant_id == current_tenant.id)
+    query = db.query(*LIST_COLUMNS).filter(VaccinationRecord.tenant_id == current_tenant.id)
 
     if pet_id:
         query = query.filter(VaccinationRecord.pet_id == pet_id)
@@ -86,8 +96,10 @@ async def list_vaccination_records(
     if status:
         query = query.filter(VaccinationRecord.status == status)
 
-    records = query.order_by(VaccinationRecord.expiry_date.desc()).offset(skip).limit(limit).all()
-    return records
+    records = paginate_list(
+        query, [VaccinationRecord.expiry_date, VaccinationRecord.id], response, skip, cursor, limit, descending=True
+    )
+    return fast_json_response(records, response)
 
 
 @router.get("/{record_id}", response_model=VaccinationRecordResponse)
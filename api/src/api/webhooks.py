@@ -3,12 +3,14 @@ Webhook endpoints for external integrations
 """
 from fastapi import APIRouter, Depends, HTTPException, Request, Header, status
 from sqlalchemy.orm import Session
+from twilio.request_validator import RequestValidator
 import stripe
 import json
 
 from ..db.base import get_db
 from ..core.config import settings
 from ..integrations.stripe_service import StripeService
+from ..integrations.notification_queue import NotificationQueue
 
 router = APIRouter()
 
@@ -63,23 +65,43 @@ async def stripe_webhook(
 @router.post("/twilio")
 async def twilio_webhook(
     request: Request,
+    twilio_signature: str = Header(None, alias="X-Twilio-Signature"),
     db: Session = Depends(get_db)
 ):
     """
     Handle Twilio webhook events (delivery status, replies)
-    TODO Sprint 3: Implement Twilio webhook handling
+
+    Delivery status callbacks update the SMS outbox. The request signature is
+    verified against SMS_STATUS_CALLBACK_URL, the URL Twilio was given.
+    Requests are rejected when validation is not configured, unless
+    SMS_STATUS_CALLBACK_ALLOW_UNSIGNED is set (development only).
     """
     # Get form data (Twilio sends as form-encoded)
     form_data = await request.form()
 
+    if settings.SMS_STATUS_CALLBACK_URL and settings.TWILIO_AUTH_TOKEN:
+        validator = RequestValidator(settings.TWILIO_AUTH_TOKEN)
+        if not validator.validate(settings.SMS_STATUS_CALLBACK_URL, dict(form_data), twilio_signature or ""):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid signature"
+            )
+    elif not settings.SMS_STATUS_CALLBACK_ALLOW_UNSIGNED:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Signature validation not configured"
+        )
+
     # Extract relevant fields
     message_sid = form_data.get("MessageSid")
     message_status = form_data.get("MessageStatus")
-    from_number = form_data.get("From")
-    to_number = form_data.get("To")
-    body = form_data.get("Body")
+    error_code = form_data.get("ErrorCode")
+
+    if message_sid and message_status:
+        updated = NotificationQueue.record_status(db, message_sid, message_status, error_code)
+        db.commit()
+        return {"status": "success" if updated else "ignored"}
 
-    # TODO: Update SMS delivery status in database
     # TODO: Handle customer replies
 
-    return {"status": "success"}
+    return {"status": "ignored"}
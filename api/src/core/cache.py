@@ -0,0 +1,59 @@
+"""
+In-process TTL cache
+
+Entries are grouped (typically by tenant) so that every cached value for a
+group can be dropped at once when its underlying data changes. The cache is
+per process; the TTL bounds how stale other workers can be.
+"""
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
+import time
+
+
+class TTLCache:
+    """Thread-safe cache with per-entry expiry and group invalidation"""
+
+    def __init__(self, ttl_seconds: float, max_entries_per_group: int = 128):
+        """
+        Args:
+            ttl_seconds: Seconds an entry stays valid
+            max_entries_per_group: Oldest entries are evicted beyond this size
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_group = max_entries_per_group
+        self._groups: Dict[Hashable, Dict[Hashable, Tuple[float, Any]]] = {}
+        self._lock = Lock()
+
+    def get(self, group: Hashable, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entries = self._groups.get(group)
+            if not entries or key not in entries:
+                return None
+
+            expires_at, value = entries[key]
+            if expires_at <= time.monotonic():
+                del entries[key]
+                return None
+
+            return value
+
+    def set(self, group: Hashable, key: Hashable, value: Any) -> None:
+        """Cache a value"""
+        with self._lock:
+            entries = self._groups.setdefault(group, {})
+            entries.pop(key, None)
+            entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+            while len(entries) > self.max_entries_per_group:
+                del entries[next(iter(entries))]
+
+    def invalidate(self, group: Hashable) -> None:
+        """Drop every cached value in a group"""
+        with self._lock:
+            self._groups.pop(group, None)
+
+    def clear(self) -> None:
+        """Drop everything"""
+        with self._lock:
+            self._groups.clear()
@@ -59,9 +59,35 @@ class Settings(BaseSettings):
     TWILIO_PHONE_NUMBER: Optional[str] = None
     ENABLE_SMS: bool = False
 
+    # SMS Outbox
+    SMS_TRANSPORT: str = "twilio"  # twilio | fake
+    SMS_STATUS_CALLBACK_URL: Optional[str] = None  # Public URL of /webhooks/twilio
+    SMS_STATUS_CALLBACK_ALLOW_UNSIGNED: bool = False  # Dev only: accept callbacks without signature validation
+    SMS_RATE_PER_SECOND: float = 10.0  # Account-wide send rate
+    SMS_PER_NUMBER_INTERVAL_SECONDS: float = 1.0  # Min spacing between sends to one recipient
+    SMS_WORKER_CONCURRENCY: int = 8
+    SMS_WORKER_BATCH_SIZE: int = 100
+    SMS_MAX_ATTEMPTS: int = 5
+    SMS_RETRY_BASE_SECONDS: int = 30  # Doubles per attempt
+    SMS_SENDING_LEASE_SECONDS: int = 300  # SENDING claims older than this are retried
+
     # Feature Flags
     ENABLE_ANALYTICS: bool = False
     ENABLE_EMAIL: bool = False
+    CUSTOMER_VALUE_MATERIALIZED: bool = False  # Serve customer value reports from customer_values
+
+    # Caching
+    STATS_CACHE_TTL_SECONDS: int = 30
+    HTTP_CACHE_CATALOG_MAX_AGE_SECONDS: int = 60  # Public service listings (browser/CDN)
+    HTTP_CACHE_AVAILABILITY_MAX_AGE_SECONDS: int = 15  # Public availability slots
+    CATALOG_SNAPSHOT_POLL_SECONDS: int = 5  # Per-worker catalog snapshot version check interval
+
+    # Background Tasks
+    TASK_MAX_WORKERS: int = 8  # Tenants processed concurrently per job
+    TASK_TENANT_TIMEOUT_SECONDS: int = 300
+    SCHEDULER_DISTRIBUTED: bool = False  # Claim per-tenant runs via job_runs (multi-replica)
+    JOB_RUN_LEASE_SECONDS: int = 900  # Running claims older than this are reclaimed
+    JOB_RUN_MAX_ATTEMPTS: int = 3
 
     # Rate Limiting
     RATE_LIMIT_MAX: int = 100
@@ -0,0 +1,86 @@
+"""
+HTTP caching for read endpoints
+
+The booking widget polls the service, staff, resource and availability
+endpoints, whose data rarely changes. Those routes declare a conditional_get
+dependency that derives an ETag from the tenant's entity versions (see
+EntityVersionService) before the endpoint runs:
+
+- If-None-Match matching the ETag is answered with 304 Not Modified, without
+  running the endpoint's query
+- Otherwise the ETag and a Cache-Control header are added to the response
+
+Versions are read before the endpoint's data, so a tag can only be older
+than the body it labels, never newer; the worst case is one extra full
+response. Public endpoints are cacheable by browsers and CDNs for a short
+max-age; authenticated ones are private and always revalidated.
+"""
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+
+from ..db.base import get_db
+from ..models.tenant import Tenant
+from ..services.entity_version_service import EntityVersionService
+from .config import settings
+from .dependencies import get_public_tenant
+from .serialization import etag_matches
+
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def conditional_get(
+    *entities: str,
+    tenant_dependency: Callable = get_public_tenant,
+    max_age: Optional[int] = None,
+    time_bucket: Optional[timedelta] = None
+) -> Callable:
+    """
+    Build a route dependency answering conditional GETs from entity versions
+
+    Use the route's own tenant dependency so authentication (and the tenant
+    lookup) runs, once, before a 304 is returned.
+
+    Args:
+        entities: Entity kinds the endpoint's response is built from
+        tenant_dependency: Dependency resolving the request's tenant
+        max_age: Public max-age in seconds; None for private responses
+        time_bucket: Also change the ETag every bucket, for responses that
+            depend on the current time (e.g. availability hides past slots)
+
+    Returns:
+        Dependency for the route's `dependencies` list
+    """
+    if max_age is None:
+        cache_control = PRIVATE_CACHE_CONTROL
+    else:
+        cache_control = f"public, max-age={max_age}"
+
+    async def check_not_modified(
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_db),
+        tenant: Tenant = Depends(tenant_dependency)
+    ) -> None:
+        versions = EntityVersionService.get_versions(db, tenant.id, entities)
+
+        parts = [str(tenant.id), request.url.path, str(sorted(request.query_params.multi_items()))]
+        parts += [f"{entity}:{version}" for entity, version in sorted(versions.items())]
+        if time_bucket:
+            parts.append(str(int(datetime.now().timestamp() // time_bucket.total_seconds())))
+
+        etag = f'W/"{hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if max_age is not None and settings.TENANT_RESOLUTION == "header":
+            # Shared caches must key public responses by tenant
+            headers["Vary"] = settings.TENANT_HEADER_NAME
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+
+    return check_not_modified
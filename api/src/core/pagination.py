@@ -0,0 +1,218 @@
+"""
+Keyset (cursor-based) pagination utilities
+
+Offset pagination gets slower the deeper a client pages and skips/duplicates
+rows when data changes between requests. Keyset pagination instead seeks past
+the last row of the previous page using the sort key, which stays fast at any
+depth when backed by a matching composite index.
+
+Cursors are opaque, URL-safe strings encoding the sort-key values of the last
+row returned. paginate_rows applies the same cursors to rows already held in
+memory (e.g. catalog snapshots).
+"""
+from datetime import datetime, date
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+import base64
+import json
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Date, DateTime, Float, Integer, literal, tuple_
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode sort-key values into an opaque cursor string
+    """
+    serialized = [
+        value.isoformat() if isinstance(value, (datetime, date))
+        else str(value) if isinstance(value, UUID)
+        else value
+        for value in values
+    ]
+    raw = json.dumps(serialized, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> List[Any]:
+    """
+    Decode a cursor back into typed sort-key values for the given columns
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the keys
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("Invalid pagination cursor")
+
+    try:
+        return [_coerce(key, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def paginate_keyset(
+    query: Query,
+    keys: Sequence[Any],
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    descending: bool = False
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Apply keyset pagination to a query
+
+    Args:
+        query: Filtered query (without ORDER BY / OFFSET / LIMIT)
+        keys: Ordered sort-key columns; must end with a unique column (id)
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size
+        descending: Sort direction for all keys
+
+    Returns:
+        Tuple of (rows, next_cursor). next_cursor is None on the last page.
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        key_tuple = tuple_(*keys)
+        value_tuple = tuple_(*[literal(v, type_=k.type) for k, v in zip(keys, values)])
+        query = query.filter(key_tuple < value_tuple if descending else key_tuple > value_tuple)
+
+    order_by = [k.desc() for k in keys] if descending else list(keys)
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, k.key) for k in keys])
+
+    return rows, next_cursor
+
+
+def paginate_list(
+    query: Query,
+    keys: Sequence[Any],
+    response: Response,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    descending: bool = False
+) -> List[Any]:
+    """
+    Paginate a list endpoint query by cursor, falling back to offset
+
+    Offset pagination is kept for existing callers passing `skip`. Otherwise
+    the page is fetched by keyset and the cursor for the following page is
+    returned in the X-Next-Cursor response header.
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid
+    """
+    if skip and not cursor:
+        order_by = [k.desc() for k in keys] if descending else list(keys)
+        return query.order_by(*order_by).offset(skip).limit(limit).all()
+
+    try:
+        rows, next_cursor = paginate_keyset(query, keys, cursor, limit, descending)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return rows
+
+
+def row_sort_key(keys: Sequence[Any]) -> Callable[[Any], Tuple]:
+    """
+    Python sort key ordering rows ascending by sort-key columns, NULLs last
+
+    Strings compare by code point, which may differ from the database
+    collation; in-memory rows must be sorted and sought with this same key.
+    """
+    names = [key.key for key in keys]
+
+    def sort_key(row: Any) -> Tuple:
+        return tuple(_null_last(getattr(row, name)) for name in names)
+
+    return sort_key
+
+
+def paginate_rows(
+    rows: Sequence[Any],
+    keys: Sequence[Any],
+    response: Response,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> List[Any]:
+    """
+    Paginate in-memory rows like paginate_list
+
+    Args:
+        rows: Rows sorted by row_sort_key(keys)
+        keys: Ordered sort-key columns; must end with a unique column (id)
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid
+    """
+    if skip and not cursor:
+        return list(rows[skip:skip + limit])
+
+    start = 0
+    if cursor:
+        try:
+            values = decode_cursor(cursor, keys)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        after = tuple(_null_last(value) for value in values)
+        sort_key = row_sort_key(keys)
+        start = next((i for i, row in enumerate(rows) if sort_key(row) > after), len(rows))
+
+    page = list(rows[start:start + limit])
+    if start + limit < len(rows):
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([getattr(page[-1], k.key) for k in keys])
+
+    return page
+
+
+def _null_last(value: Any) -> Tuple:
+    """Comparable wrapper placing None after every value, as Postgres does ascending"""
+    return (True,) if value is None else (False, value)
+
+
+def _coerce(key: Any, value: Any) -> Any:
+    """Convert a JSON cursor value to the Python type of its column"""
+    if value is None:
+        return None
+
+    column_type = key.type
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, Date):
+        return date.fromisoformat(value)
+    if isinstance(column_type, PGUUID):
+        return UUID(value)
+    if isinstance(column_type, Integer):
+        return int(value)
+    if isinstance(column_type, Float):
+        return float(value)
+    return str(value)
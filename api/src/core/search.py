@@ -0,0 +1,42 @@
+"""
+Search term normalization
+
+Searchable text is stored lowercased with phone numbers reduced to their
+digits and indexed with pg_trgm, so `LIKE '%term%'` and word_similarity
+lookups use a GIN index instead of scanning. Terms are normalized the same
+way before matching; tokens too short to form a trigram are dropped, since
+the index can't narrow them and they would recheck every row.
+"""
+import re
+from typing import List
+
+# Only phone punctuation around the digits, e.g. "(555) 123-4567", "+1 555.123"
+PHONE_TERM = re.compile(r"^[\d\s()+.\-]+$")
+MIN_PHONE_DIGITS = 3
+# pg_trgm extracts no trigrams from shorter strings
+MIN_TOKEN_LENGTH = 3
+
+
+def normalize_search_terms(term: str) -> List[str]:
+    """
+    Split a search string into normalized tokens that must all match
+
+    Phone-like input becomes a single digits-only token; anything else is
+    lowercased and split on whitespace. Tokens shorter than
+    MIN_TOKEN_LENGTH are dropped.
+    """
+    term = (term or "").strip()
+    if not term:
+        return []
+
+    if PHONE_TERM.match(term):
+        digits = re.sub(r"\D", "", term)
+        if len(digits) >= MIN_PHONE_DIGITS:
+            return [digits]
+
+    return [token for token in term.lower().split() if len(token) >= MIN_TOKEN_LENGTH]
+
+
+def normalized_search_text(term: str) -> str:
+    """Normalized tokens joined back into one string, for ranking"""
+    return " ".join(normalize_search_terms(term))
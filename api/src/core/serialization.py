@@ -0,0 +1,114 @@
+"""
+Fast response serialization for list endpoints
+
+Returning ORM objects makes FastAPI hydrate full entities, validate each one
+against the route's response_model (from_attributes) and encode the result
+with the stdlib JSON encoder, which dominates CPU on 100-row pages.
+
+List endpoints instead select only the response schema's columns and return
+the rows as dicts in an ORJSONResponse; orjson encodes UUIDs, datetimes,
+dates and str enums natively. The response_model stays on the route so the
+OpenAPI schema is unchanged. See benchmarks/list_serialization.py.
+
+Queries that must return entities use response_load_only to fetch the same
+columns; heavy JSON/Text columns are also deferred on the models.
+
+Feeds that clients poll (the appointment calendar) use etag_json_response,
+which tags the encoded body and answers a matching If-None-Match with 304.
+"""
+import hashlib
+from typing import Any, List, Optional, Sequence, Type
+
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+
+
+def response_columns(model: Any, schema: Type[BaseModel]) -> List[Any]:
+    """
+    Model column attributes for every field of a response schema, in schema order
+
+    Call once at import time and reuse the list for each request.
+
+    Raises:
+        ValueError: If a schema field has no matching column on the model
+    """
+    column_keys = set(inspect(model).column_attrs.keys())
+    missing = [field for field in schema.model_fields if field not in column_keys]
+    if missing:
+        raise ValueError(f"{schema.__name__} fields without {model.__name__} columns: {', '.join(missing)}")
+
+    return [getattr(model, field) for field in schema.model_fields]
+
+
+def response_load_only(model: Any, schema: Type[BaseModel]):
+    """
+    load_only option limiting an entity query to a response schema's columns
+
+    Other columns still load on first access, one query per object, so use
+    it only where callers read just the response fields.
+    """
+    return load_only(*response_columns(model, schema))
+
+
+def fast_json_response(
+    rows: Sequence[Any],
+    response: Response,
+    schema: Optional[Type[BaseModel]] = None
+) -> ORJSONResponse:
+    """
+    Serialize column rows straight to JSON, bypassing response_model validation
+
+    Rows are emitted whole unless a response schema is given, in which case
+    only its fields are kept (for rows carrying extra columns, such as
+    catalog snapshot rows).
+
+    Headers already set on the endpoint's injected `response` (e.g.
+    X-Next-Cursor) are carried over, since FastAPI does not merge them into
+    a returned Response.
+    """
+    if schema is None:
+        content = [row._asdict() for row in rows]
+    else:
+        fields = list(schema.model_fields)
+        content = [{name: getattr(row, name) for name in fields} for row in rows]
+
+    return ORJSONResponse(content, headers=dict(response.headers))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in if_none_match.split(",")}
+
+
+def etag_json_response(content: Any, request: Request, response: Response) -> Response:
+    """
+    Serialize content with orjson and tag it with a hash of the body
+
+    Returns 304 Not Modified with no body when the request's If-None-Match
+    already holds that tag. Headers set on the injected `response` are
+    carried over either way.
+    """
+    json_response = ORJSONResponse(content, headers=dict(response.headers))
+    etag = f'"{hashlib.sha256(json_response.body).hexdigest()[:32]}"'
+    json_response.headers["ETag"] = etag
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        headers = {
+            key: value for key, value in json_response.headers.items()
+            if key not in ("content-length", "content-type")
+        }
+        return Response(status_code=304, headers=headers)
+
+    return json_response
@@ -1,7 +1,7 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import DDL, create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -27,6 +27,9 @@ SessionLocal = sessionmaker(
 # Create Base class for models
 Base = declarative_base()
 
+# Trigram indexes (owner search) need pg_trgm before tables are created
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -1,7 +1,7 @@
 """
 Database session management
-Re-export get_db from base for backwards compatibility
+Re-export get_db and SessionLocal from base for backwards compatibility
 """
-from .base import get_db
+from .base import get_db, SessionLocal
 
-__all__ = ["get_db"]
+__all__ = ["get_db", "SessionLocal"]
@@ -0,0 +1,222 @@
+"""
+Durable notification queue
+Outbound SMS are written to the sms_outbox table and sent by the SMS worker
+
+Enqueueing joins the caller's transaction, so a message exists exactly when
+the work that produced it commits, and callers never wait on Twilio. Delivery,
+rate limiting and retries happen in src.tasks.sms_worker; Twilio status
+callbacks update delivery state through record_status.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+import logging
+
+from sqlalchemy import case, delete, exists, func, literal, or_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..models.sms_message import SmsMessage, SmsStatus
+from ..models.sms_status_callback import SmsStatusCallback
+
+logger = logging.getLogger(__name__)
+
+# Twilio MessageStatus -> outbox status
+TWILIO_STATUS_MAP = {
+    "accepted": SmsStatus.SENT,
+    "queued": SmsStatus.SENT,
+    "sending": SmsStatus.SENT,
+    "sent": SmsStatus.SENT,
+    "delivered": SmsStatus.DELIVERED,
+    "undelivered": SmsStatus.UNDELIVERED,
+    "failed": SmsStatus.FAILED,
+}
+
+# Callbacks can arrive out of order; never move a message back to an earlier state
+_STATUS_RANK = {
+    SmsStatus.QUEUED: 0,
+    SmsStatus.SENDING: 1,
+    SmsStatus.SENT: 2,
+    SmsStatus.DELIVERED: 3,
+    SmsStatus.UNDELIVERED: 3,
+    SmsStatus.FAILED: 3,
+}
+
+# Parked callbacks whose SID never shows up are dropped after this long
+PENDING_CALLBACK_RETENTION = timedelta(days=1)
+
+
+def _status_rank(column):
+    """SQL expression ranking an SmsStatus column like _STATUS_RANK"""
+    return case(_STATUS_RANK, value=column)
+
+
+class NotificationQueue:
+    """Transactional SMS outbox"""
+
+    @staticmethod
+    def enqueue_sms(
+        db: Session,
+        to_phone: str,
+        message: str,
+        tenant_id: Optional[UUID] = None,
+        dedupe_key: Optional[str] = None
+    ) -> Optional[UUID]:
+        """
+        Queue an SMS for delivery in the caller's transaction
+
+        Args:
+            db: Database session (caller commits)
+            to_phone: Recipient phone number
+            message: Message body
+            tenant_id: Tenant the message belongs to
+            dedupe_key: Messages with an already-queued key are dropped
+
+        Returns:
+            Outbox message ID, or None if deduplicated
+        """
+        stmt = insert(SmsMessage).values(
+            tenant_id=tenant_id,
+            to_phone=to_phone,
+            body=message,
+            dedupe_key=dedupe_key,
+            status=SmsStatus.QUEUED,
+            attempts=0
+        ).on_conflict_do_nothing(
+            index_elements=["dedupe_key"]
+        ).returning(SmsMessage.id)
+
+        return db.execute(stmt).scalar()
+
+    @staticmethod
+    def enqueue_sms_batch(db: Session, messages: List[Dict]) -> int:
+        """
+        Queue many SMS in one statement
+
+        Args:
+            db: Database session (caller commits)
+            messages: Dicts with to_phone, message and optional tenant_id, dedupe_key
+
+        Returns:
+            Number of messages queued (after deduplication)
+        """
+        if not messages:
+            return 0
+
+        stmt = insert(SmsMessage).values([
+            {
+                "tenant_id": m.get("tenant_id"),
+                "to_phone": m["to_phone"],
+                "body": m["message"],
+                "dedupe_key": m.get("dedupe_key"),
+                "status": SmsStatus.QUEUED,
+                "attempts": 0
+            }
+            for m in messages
+        ]).on_conflict_do_nothing(
+            index_elements=["dedupe_key"]
+        ).returning(SmsMessage.id)
+
+        return len(db.execute(stmt).all())
+
+    @staticmethod
+    def record_status(
+        db: Session,
+        provider_sid: str,
+        provider_status: str,
+        error_code: Optional[str] = None
+    ) -> bool:
+        """
+        Apply a Twilio delivery status callback
+
+        Args:
+            db: Database session (caller commits)
+            provider_sid: Twilio MessageSid
+            provider_status: Twilio MessageStatus
+            error_code: Twilio ErrorCode, if any
+
+        A callback can arrive before the SMS worker has stored the message's
+        SID; it is then parked and applied when the worker records the SID
+        (see apply_pending_statuses).
+
+        Returns:
+            True if a message was updated
+        """
+        new_status = TWILIO_STATUS_MAP.get((provider_status or "").lower())
+        if new_status is None:
+            logger.warning(f"Ignoring unknown Twilio status {provider_status!r} for {provider_sid}")
+            return False
+
+        earlier = [s for s, rank in _STATUS_RANK.items() if rank < _STATUS_RANK[new_status]]
+        values = {"status": new_status, "updated_at": datetime.utcnow()}
+        if new_status == SmsStatus.DELIVERED:
+            values["delivered_at"] = datetime.utcnow()
+        if error_code:
+            values["last_error"] = f"Twilio error {error_code}"
+
+        result = db.execute(
+            update(SmsMessage).where(
+                SmsMessage.provider_sid == provider_sid,
+                SmsMessage.status.in_(earlier)
+            ).values(**values).execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            return True
+
+        known = db.query(SmsMessage.id).filter(SmsMessage.provider_sid == provider_sid).first()
+        if not known:
+            stmt = insert(SmsStatusCallback).values(
+                provider_sid=provider_sid,
+                status=new_status,
+                error_code=error_code
+            )
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[SmsStatusCallback.provider_sid],
+                    set_={"status": stmt.excluded.status, "error_code": stmt.excluded.error_code},
+                    where=SmsStatusCallback.status.in_(earlier)
+                )
+            )
+
+        return False
+
+    @staticmethod
+    def apply_pending_statuses(db: Session) -> int:
+        """
+        Apply parked status callbacks to messages whose SID is now stored
+
+        Applied callbacks are removed, as are ones older than
+        PENDING_CALLBACK_RETENTION.
+
+        Args:
+            db: Database session (caller commits)
+
+        Returns:
+            Number of messages updated
+        """
+        callback = SmsStatusCallback
+        result = db.execute(
+            update(SmsMessage).where(
+                SmsMessage.provider_sid == callback.provider_sid,
+                _status_rank(SmsMessage.status) < _status_rank(callback.status)
+            ).values(
+                status=callback.status,
+                delivered_at=case(
+                    (callback.status == SmsStatus.DELIVERED, func.now()),
+                    else_=SmsMessage.delivered_at
+                ),
+                last_error=func.coalesce(literal("Twilio error ") + callback.error_code, SmsMessage.last_error),
+                updated_at=func.now()
+            ).execution_options(synchronize_session=False)
+        )
+
+        db.execute(
+            delete(callback).where(
+                or_(
+                    exists().where(SmsMessage.provider_sid == callback.provider_sid),
+                    callback.received_at < func.now() - PENDING_CALLBACK_RETENTION
+                )
+            ).execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
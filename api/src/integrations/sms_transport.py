@@ -0,0 +1,89 @@
+"""
+SMS transports used by the SMS worker
+Twilio for production, an in-memory fake for local runs and load tests
+"""
+from threading import Lock
+from typing import List, Optional, Tuple
+import random
+import time
+import uuid
+
+from ..core.config import settings
+
+
+class SmsSendError(Exception):
+    """Send failure; retryable errors are retried with backoff"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class TwilioTransport:
+    """Sends through the Twilio REST API"""
+
+    def send(self, to_phone: str, body: str) -> str:
+        """
+        Send one SMS
+
+        Returns:
+            Twilio message SID
+
+        Raises:
+            SmsSendError: retryable for rate limiting (429), 5xx and network errors
+        """
+        from twilio.base.exceptions import TwilioRestException
+        from .twilio_service import TwilioService
+
+        try:
+            result = TwilioService.send_sms(
+                to_phone,
+                body,
+                status_callback=settings.SMS_STATUS_CALLBACK_URL
+            )
+        except TwilioRestException as e:
+            retryable = e.status == 429 or e.status >= 500
+            raise SmsSendError(f"Twilio error {e.code}: {e.msg}", retryable=retryable) from e
+        except Exception as e:
+            raise SmsSendError(str(e)) from e
+
+        return result["sid"]
+
+
+class FakeSmsTransport:
+    """
+    In-memory transport for offline throughput testing
+
+    Simulates provider latency and a random transient failure rate, and
+    keeps every accepted message in `sent`.
+    """
+
+    def __init__(self, latency_seconds: float = 0.05, failure_rate: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+        self.sent: List[Tuple[str, str, str]] = []  # (sid, to_phone, body)
+        self._lock = Lock()
+
+    def send(self, to_phone: str, body: str) -> str:
+        """Pretend to send one SMS and return a fake SID"""
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise SmsSendError("Simulated transient failure")
+
+        sid = f"SMfake{uuid.uuid4().hex}"
+        with self._lock:
+            self.sent.append((sid, to_phone, body))
+
+        return sid
+
+
+def get_transport(name: Optional[str] = None):
+    """Build the transport configured by SMS_TRANSPORT"""
+    name = name or settings.SMS_TRANSPORT
+    if name == "fake":
+        return FakeSmsTransport()
+    if name == "twilio":
+        return TwilioTransport()
+    raise ValueError(f"Unknown SMS transport '{name}'")
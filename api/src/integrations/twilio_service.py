@@ -6,12 +6,16 @@ from twilio.rest import Client
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 from uuid import UUID
+from sqlalchemy import any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
 from ..models.appointment import Appointment
 from ..models.owner import Owner
+from ..models.pet import Pet
 from ..models.tenant import Tenant
+from .notification_queue import NotificationQueue
 
 # Initialize Twilio client
 twilio_client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
@@ -81,20 +85,23 @@ Please update vaccination records before your next appointment.
     def send_sms(
         to_phone: str,
         message: str,
-        from_phone: Optional[str] = None
+        from_phone: Optional[str] = None,
+        status_callback: Optional[str] = None
     ) -> Dict[str, any]:
         """
-        Send an SMS message
+        Send an SMS message immediately
         Returns message SID and status
+
+        Services should use queue_sms; this is the SMS worker's transport call.
         """
         if not from_phone:
             from_phone = settings.TWILIO_PHONE_NUMBER
 
-        message = twilio_client.messages.create(
-            to=to_phone,
-            from_=from_phone,
-            body=message
-        )
+        params = {"to": to_phone, "from_": from_phone, "body": message}
+        if status_callback:
+            params["status_callback"] = status_callback
+
+        message = twilio_client.messages.create(**params)
 
         return {
             "sid": message.sid,
@@ -103,6 +110,28 @@ Please update vaccination records before your next appointment.
             "from": from_phone
         }
 
+    @staticmethod
+    def queue_sms(
+        db: Session,
+        to_phone: str,
+        message: str,
+        tenant_id: Optional[UUID] = None,
+        dedupe_key: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Queue an SMS in the outbox, committed with the caller's transaction
+        Returns outbox message ID and status ("queued" or "duplicate")
+        """
+        message_id = NotificationQueue.enqueue_sms(
+            db, to_phone, message, tenant_id=tenant_id, dedupe_key=dedupe_key
+        )
+
+        return {
+            "id": str(message_id) if message_id else None,
+            "status": "queued" if message_id else "duplicate",
+            "to": to_phone
+        }
+
     @staticmethod
     def render_template(
         template_name: str,
@@ -117,6 +146,23 @@ Please update vaccination records before your next appointment.
 
         return template.format(**variables)
 
+    @staticmethod
+    def get_pet_names(db: Session, appointment: Appointment) -> str:
+        """
+        Comma-separated names of an appointment's pets, in booking order
+
+        Appointments store pet_ids, not a relationship, so the names are
+        fetched with one `id = ANY(:pet_ids)` query.
+        """
+        if not appointment.pet_ids:
+            return "your pet"
+
+        names = dict(db.query(Pet.id, Pet.name).filter(
+            Pet.id == any_(literal(list(appointment.pet_ids), ARRAY(PGUUID(as_uuid=True))))
+        ).all())
+
+        return ", ".join(names[pet_id] for pet_id in appointment.pet_ids if pet_id in names) or "your pet"
+
     @staticmethod
     def send_appointment_confirmation(
         db: Session,
@@ -136,7 +182,7 @@ Please update vaccination records before your next appointment.
             return None
 
         # Get pet names
-        pet_names = ", ".join([pet.name for pet in appointment.pets]) if hasattr(appointment, 'pets') else "your pet"
+        pet_names = TwilioService.get_pet_names(db, appointment)
 
         # Render message
         message = TwilioService.render_template(
@@ -151,8 +197,12 @@ Please update vaccination records before your next appointment.
             }
         )
 
-        # Send SMS
-        return TwilioService.send_sms(owner.phone, message)
+        # Queue SMS
+        return TwilioService.queue_sms(
+            db, owner.phone, message,
+            tenant_id=appointment.tenant_id,
+            dedupe_key=f"appointment_confirmation:{appointment.id}"
+        )
 
     @staticmethod
     def send_appointment_reminder_24h(
@@ -173,7 +223,7 @@ Please update vaccination records before your next appointment.
             return None
 
         # Get pet names
-        pet_names = ", ".join([pet.name for pet in appointment.pets]) if hasattr(appointment, 'pets') else "your pet"
+        pet_names = TwilioService.get_pet_names(db, appointment)
 
         # Render message
         message = TwilioService.render_template(
@@ -187,8 +237,12 @@ Please update vaccination records before your next appointment.
             }
         )
 
-        # Send SMS
-        return TwilioService.send_sms(owner.phone, message)
+        # Queue SMS
+        return TwilioService.queue_sms(
+            db, owner.phone, message,
+            tenant_id=appointment.tenant_id,
+            dedupe_key=f"reminder_24h:{appointment.id}:{appointment.scheduled_start:%Y%m%d%H%M}"
+        )
 
     @staticmethod
     def send_appointment_reminder_2h(
@@ -209,7 +263,7 @@ Please update vaccination records before your next appointment.
             return None
 
         # Get pet names
-        pet_names = ", ".join([pet.name for pet in appointment.pets]) if hasattr(appointment, 'pets') else "your pet"
+        pet_names = TwilioService.get_pet_names(db, appointment)
 
         # Render message
         message = TwilioService.render_template(
@@ -222,8 +276,12 @@ Please update vaccination records before your next appointment.
             }
         )
 
-        # Send SMS
-        return TwilioService.send_sms(owner.phone, message)
+        # Queue SMS
+        return TwilioService.queue_sms(
+            db, owner.phone, message,
+            tenant_id=appointment.tenant_id,
+            dedupe_key=f"reminder_2h:{appointment.id}:{appointment.scheduled_start:%Y%m%d%H%M}"
+        )
 
     @staticmethod
     def send_appointment_cancelled(
@@ -244,7 +302,7 @@ Please update vaccination records before your next appointment.
             return None
 
         # Get pet names
-        pet_names = ", ".join([pet.name for pet in appointment.pets]) if hasattr(appointment, 'pets') else "your pet"
+        pet_names = TwilioService.get_pet_names(db, appointment)
 
         # Render message
         message = TwilioService.render_template(
@@ -257,8 +315,12 @@ Please update vaccination records before your next appointment.
             }
         )
 
-        # Send SMS
-        return TwilioService.send_sms(owner.phone, message)
+        # Queue SMS
+        return TwilioService.queue_sms(
+            db, owner.phone, message,
+            tenant_id=appointment.tenant_id,
+            dedupe_key=f"appointment_cancelled:{appointment.id}"
+        )
 
     @staticmethod
     def send_vaccination_reminder(
@@ -293,8 +355,8 @@ Please update vaccination records before your next appointment.
             }
         )
 
-        # Send SMS
-        return TwilioService.send_sms(owner.phone, message)
+        # Queue SMS
+        return TwilioService.queue_sms(db, owner.phone, message, tenant_id=owner.tenant_id)
 
     @staticmethod
     def get_appointments_needing_reminders(
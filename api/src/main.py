@@ -3,7 +3,7 @@ FastAPI main application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .core.config import settings
 from .middleware.tenant import TenantMiddleware
@@ -19,7 +19,8 @@ app = FastAPI(
     description=settings.DESCRIPTION,
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -29,6 +30,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Tenant middleware
@@ -65,7 +67,7 @@ async def api_root():
 
 
 # Import and include routers
-from .api import auth, staff, owners, pets, services, resources, appointments, packages, payments, vaccination_records, webhooks, schedule, stats
+from .api import auth, staff, owners, pets, services, resources, appointments, packages, payments, vaccination_records, webhooks, schedule, stats, reports, search
 
 # Authentication
 app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
@@ -94,6 +96,12 @@ app.include_router(schedule.router, prefix=f"{settings.API_V1_STR}/schedule", ta
 # Stats
 app.include_router(stats.router, prefix=f"{settings.API_V1_STR}/stats", tags=["stats"])
 
+# Reports
+app.include_router(reports.router, prefix=f"{settings.API_V1_STR}/reports", tags=["reports"])
+
+# Front desk search
+app.include_router(search.router, prefix=f"{settings.API_V1_STR}/search", tags=["search"])
+
 # Packages (punch cards, memberships)
 app.include_router(packages.router, prefix=f"{settings.API_V1_STR}/packages", tags=["packages"])
 
@@ -12,6 +12,14 @@ from .appointment import Appointment, AppointmentStatus, AppointmentSource
 from .package import Package, PackageType, PackageStatus
 from .payment import Payment, PaymentStatus, PaymentType, PaymentMethod
 from .vaccination_record import VaccinationRecord, VaccinationType, VaccinationStatus
+from .customer_value import CustomerValue
+from .job_run import JobRun, JobRunStatus
+from .sms_message import SmsMessage, SmsStatus
+from .sms_status_callback import SmsStatusCallback
+from .scheduled_notification import ScheduledNotification, ScheduledNotificationStatus
+from .reputation_event import ReputationEvent
+from .search_entry import SearchEntry
+from .entity_version import EntityVersion
 
 __all__ = [
     # Models
@@ -26,6 +34,14 @@ __all__ = [
     "Package",
     "Payment",
     "VaccinationRecord",
+    "CustomerValue",
+    "JobRun",
+    "SmsMessage",
+    "SmsStatusCallback",
+    "ScheduledNotification",
+    "ReputationEvent",
+    "SearchEntry",
+    "EntityVersion",
     # Enums
     "TenantStatus",
     "UserRole",
@@ -40,4 +56,7 @@ __all__ = [
     "PaymentMethod",
     "VaccinationType",
     "VaccinationStatus",
+    "JobRunStatus",
+    "SmsStatus",
+    "ScheduledNotificationStatus",
 ]
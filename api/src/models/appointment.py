@@ -1,9 +1,9 @@
 """
 Appointment model for bookings
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Enum as SQLEnum, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -32,6 +32,19 @@ class Appointment(Base):
     Appointment model - represents bookings/appointments
     """
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_appointments_tenant_scheduled_start_id", "tenant_id", "scheduled_start", "id"),
+        # Due-reminder selection (only appointments still awaiting each reminder)
+        Index(
+            "ix_appointments_reminder_24h_due", "scheduled_start",
+            postgresql_where=text("reminder_24h_sent_at IS NULL AND deleted_at IS NULL")
+        ),
+        Index(
+            "ix_appointments_reminder_2h_due", "scheduled_start",
+            postgresql_where=text("reminder_2h_sent_at IS NULL AND deleted_at IS NULL")
+        ),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -51,6 +64,8 @@ class Appointment(Base):
     scheduled_end = Column(DateTime(timezone=True), nullable=False)
     actual_start = Column(DateTime(timezone=True), nullable=True)
     actual_end = Column(DateTime(timezone=True), nullable=True)
+    arrived_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
 
     # Status
     status = Column(SQLEnum(AppointmentStatus), default=AppointmentStatus.PENDING, nullable=False)
@@ -71,12 +86,12 @@ class Appointment(Base):
 
     # Notes and Instructions
     customer_notes = Column(Text, nullable=True)  # Notes from customer
-    staff_notes = Column(Text, nullable=True)  # Internal notes
+    staff_notes = deferred(Column(Text, nullable=True))  # Internal notes
     special_instructions = Column(Text, nullable=True)
 
-    # Photos
-    before_photos = Column(JSON, nullable=True)  # Array of URLs
-    after_photos = Column(JSON, nullable=True)  # Array of URLs
+    # Photos (deferred: loaded together on first access)
+    before_photos = deferred(Column(JSON, nullable=True), group="photos")  # Array of URLs
+    after_photos = deferred(Column(JSON, nullable=True), group="photos")  # Array of URLs
 
     # Vaccination check
     vaccination_verified = Column(Boolean, default=False, nullable=False)
@@ -89,11 +104,12 @@ class Appointment(Base):
     cancelled_by = Column(UUID(as_uuid=True), nullable=True)  # User ID who cancelled
 
     # No-show tracking
+    is_no_show = Column(Boolean, default=False, nullable=False)
     no_show_fee_charged = Column(Integer, default=0, nullable=False)
 
     # Metadata
     tags = Column(JSON, nullable=True)
-    custom_fields = Column(JSON, nullable=True)
+    custom_fields = deferred(Column(JSON, nullable=True))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
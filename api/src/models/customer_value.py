@@ -0,0 +1,43 @@
+"""
+Customer value model - materialized per-owner revenue aggregates
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship, backref
+from sqlalchemy.sql import func
+
+from ..db.base import Base
+
+
+class CustomerValue(Base):
+    """
+    Customer value model - lifetime revenue, visit count and last visit per owner
+
+    One row per owner, refreshed incrementally when the owner's payments or
+    appointments change (see CustomerValueService).
+    """
+    __tablename__ = "customer_values"
+    __table_args__ = (
+        # Customers-by-value ranking
+        Index("ix_customer_values_tenant_revenue_owner", "tenant_id", "lifetime_revenue", "owner_id"),
+    )
+
+    # Primary Key
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("owners.id"), primary_key=True)
+
+    # Tenant (Multi-tenant isolation)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
+
+    # Aggregates
+    lifetime_revenue = Column(Integer, default=0, nullable=False)  # In cents
+    appointment_count = Column(Integer, default=0, nullable=False)
+    last_visit_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Relationships
+    owner = relationship("Owner", backref=backref("customer_value", uselist=False))
+
+    def __repr__(self):
+        return f"<CustomerValue(owner_id={self.owner_id}, lifetime_revenue={self.lifetime_revenue})>"
@@ -0,0 +1,32 @@
+"""
+Entity version model - per-tenant change counters for HTTP caching
+"""
+from sqlalchemy import Column, String, BigInteger, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from ..db.base import Base
+
+
+class EntityVersion(Base):
+    """
+    Entity Version model - how many times a tenant's entities of a kind changed
+
+    Bumped in the writing transaction whenever a versioned entity is saved
+    (see EntityVersionService), so a version read after commit always
+    reflects the data. Read endpoints derive their ETags from these.
+    """
+    __tablename__ = "entity_versions"
+
+    # Primary Key
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), primary_key=True)
+    entity = Column(String(50), primary_key=True)  # services, staff, resources, appointments
+
+    # Counter
+    version = Column(BigInteger, default=1, nullable=False)
+
+    # Timestamps
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<EntityVersion(tenant_id={self.tenant_id}, entity={self.entity}, version={self.version})>"
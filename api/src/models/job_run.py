@@ -0,0 +1,60 @@
+"""
+Job run model - claims and history for distributed scheduled jobs
+"""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, JSON, Enum as SQLEnum, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+import enum
+
+from ..db.base import Base
+
+
+class JobRunStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobRun(Base):
+    """
+    Job run model - one row per (job, scheduled slot, tenant)
+
+    Every scheduler replica enqueues the same rows when a job fires; the
+    unique slot key dedupes them, and workers claim rows with
+    SELECT ... FOR UPDATE SKIP LOCKED so each tenant runs exactly once.
+    """
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        UniqueConstraint("job_name", "scheduled_for", "tenant_id", name="uq_job_runs_job_slot_tenant"),
+        # Claiming pending / stale runs for a slot
+        Index("ix_job_runs_job_slot_status", "job_name", "scheduled_for", "status"),
+    )
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Job slot
+    job_name = Column(String(100), nullable=False)
+    scheduled_for = Column(DateTime(timezone=True), nullable=False)
+
+    # Tenant partition
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False, index=True)
+
+    # Execution state
+    status = Column(SQLEnum(JobRunStatus), default=JobRunStatus.PENDING, nullable=False)
+    worker_id = Column(String(255), nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Outcome
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<JobRun(job_name={self.job_name}, scheduled_for={self.scheduled_for}, tenant_id={self.tenant_id}, status={self.status})>"
@@ -1,9 +1,9 @@
 """
 Owner (pet parent) model
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Index, Computed
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 import uuid
 
@@ -15,6 +15,17 @@ class Owner(Base):
     Owner model - represents pet parents/customers
     """
     __tablename__ = "owners"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_owners_tenant_created_at_id", "tenant_id", "created_at", "id"),
+        # Reputation category filters
+        Index("ix_owners_tenant_reputation_score", "tenant_id", "reputation_score"),
+        # Trigram search (typeahead, list search)
+        Index(
+            "ix_owners_search_text_trgm", "search_text",
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -55,9 +66,27 @@ class Owner(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     is_blocked = Column(Boolean, default=False, nullable=False)  # For no-show repeat offenders
 
+    # Reputation (Sprint 4) - maintained from the reputation_events ledger
+    reputation_score = Column(Integer, default=100, nullable=False)
+    no_show_count = Column(Integer, default=0, nullable=False)
+    late_cancellation_count = Column(Integer, default=0, nullable=False)
+    completed_appointment_count = Column(Integer, default=0, nullable=False)
+    last_reputation_update = Column(DateTime(timezone=True), nullable=True)
+    unpaid_no_show_fees = Column(Integer, default=0, nullable=False)  # Cents, pending/failed no-show fee payments
+
+    # Search - normalized name, email and phone digits (see core.search)
+    search_text = Column(
+        Text,
+        Computed(
+            "lower(first_name || ' ' || last_name || ' ' || email) || ' ' || "
+            "regexp_replace(phone, '[^0-9]', '', 'g')",
+            persisted=True
+        )
+    )
+
     # Metadata
-    notes = Column(Text, nullable=True)
-    tags = Column(JSON, nullable=True)  # ["vip", "regular", "first-time"]
+    notes = deferred(Column(Text, nullable=True))
+    tags = deferred(Column(JSON, nullable=True))  # ["vip", "regular", "first-time"]
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,7 +1,7 @@
 """
 Package model for punch cards, class credits, and memberships
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -30,6 +30,10 @@ class Package(Base):
     Package model - punch cards, class credits, memberships, gift cards
     """
     __tablename__ = "packages"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_packages_tenant_created_at_id", "tenant_id", "created_at", "id"),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
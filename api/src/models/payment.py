@@ -1,9 +1,9 @@
 """
 Payment model for transactions
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -45,6 +45,10 @@ class Payment(Base):
     Payment model - tracks all financial transactions
     """
     __tablename__ = "payments"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_payments_tenant_created_at_id", "tenant_id", "created_at", "id"),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -82,7 +86,7 @@ class Payment(Base):
     card_exp_year = Column(Integer, nullable=True)
 
     # Processing
-    processor_response = Column(JSON, nullable=True)  # Full response from Stripe
+    processor_response = deferred(Column(JSON, nullable=True))  # Full response from Stripe (deferred)
     failure_code = Column(String(100), nullable=True)
     failure_message = Column(Text, nullable=True)
 
@@ -97,7 +101,7 @@ class Payment(Base):
     receipt_email = Column(String(255), nullable=True)
     receipt_url = Column(String(500), nullable=True)
     notes = Column(Text, nullable=True)
-    payment_metadata = Column(JSON, nullable=True)  # Renamed from 'metadata' to avoid SQLAlchemy conflict
+    payment_metadata = deferred(Column(JSON, nullable=True))  # Renamed from 'metadata' to avoid SQLAlchemy conflict
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,7 +1,7 @@
 """
 Pet model
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, Date, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, Date, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -22,6 +22,10 @@ class Pet(Base):
     Pet model - represents dogs, cats, and other pets
     """
     __tablename__ = "pets"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_pets_tenant_created_at_id", "tenant_id", "created_at", "id"),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -0,0 +1,51 @@
+"""
+Reputation event model - append-only ledger of reputation changes
+"""
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, ForeignKey, Text, Identity, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from ..db.base import Base
+
+
+class ReputationEvent(Base):
+    """
+    Reputation Event model - one change to a customer's reputation
+
+    Rows are only ever inserted. The owner's reputation_score and event
+    counters are maintained incrementally alongside each insert (see
+    ReputationService.record_event) and can be rebuilt by replaying the
+    ledger in sequence order.
+    """
+    __tablename__ = "reputation_events"
+    __table_args__ = (
+        # One event of a type per appointment (retried jobs don't double count)
+        UniqueConstraint("appointment_id", "event_type", name="uq_reputation_events_appointment_event"),
+        # Replay / history per owner
+        Index("ix_reputation_events_owner_sequence", "owner_id", "sequence"),
+    )
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Insertion order, used for replay
+    sequence = Column(BigInteger, Identity(), nullable=False, unique=True)
+
+    # Tenant (Multi-tenant isolation)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False, index=True)
+
+    # Customer
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("owners.id"), nullable=False)
+    appointment_id = Column(UUID(as_uuid=True), ForeignKey("appointments.id"), nullable=True)
+
+    # Change
+    event_type = Column(String(50), nullable=False)  # ReputationEventType
+    points = Column(Integer, nullable=False)
+    notes = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<ReputationEvent(owner_id={self.owner_id}, event_type={self.event_type}, points={self.points})>"
@@ -1,7 +1,7 @@
 """
 Resource model for tables, vans, rooms, etc.
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -24,6 +24,10 @@ class Resource(Base):
     Resource model - represents physical resources (grooming tables, mobile vans, training rooms)
     """
     __tablename__ = "resources"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_resources_tenant_display_order_name_id", "tenant_id", "display_order", "name", "id"),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
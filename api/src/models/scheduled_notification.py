@@ -0,0 +1,57 @@
+"""
+Scheduled notification model - precomputed reminder and alert due times
+"""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Index, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+import enum
+
+from ..db.base import Base
+
+
+class ScheduledNotificationStatus(str, enum.Enum):
+    PENDING = "pending"
+    DISPATCHED = "dispatched"
+    CANCELLED = "cancelled"
+
+
+class ScheduledNotification(Base):
+    """
+    Scheduled notification model - one reminder/alert due for a subject
+
+    Rows are written when appointments and vaccination records are saved
+    (see NotificationScheduleService) and dispatched when due_at passes.
+    subject_id is the appointment ID for reminder kinds and the vaccination
+    record ID for vaccination kinds.
+    """
+    __tablename__ = "scheduled_notifications"
+    __table_args__ = (
+        UniqueConstraint("kind", "subject_id", name="uq_scheduled_notifications_kind_subject"),
+        # Dispatcher polling (pending rows only)
+        Index(
+            "ix_scheduled_notifications_pending_due_at", "due_at",
+            postgresql_where=text("status = 'PENDING'")
+        ),
+    )
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Tenant (Multi-tenant isolation)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False, index=True)
+
+    # What and for whom
+    kind = Column(String(50), nullable=False)  # e.g. "reminder_24h", "vaccination_30d"
+    subject_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+
+    # Schedule
+    due_at = Column(DateTime(timezone=True), nullable=False)
+    status = Column(SQLEnum(ScheduledNotificationStatus), default=ScheduledNotificationStatus.PENDING, nullable=False)
+    dispatched_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<ScheduledNotification(kind={self.kind}, subject_id={self.subject_id}, due_at={self.due_at}, status={self.status})>"
@@ -0,0 +1,53 @@
+"""
+Search entry model - per-tenant front desk search index
+"""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from ..db.base import Base
+
+
+class SearchEntry(Base):
+    """
+    Search Entry model - one searchable owner, pet or upcoming appointment
+
+    Rows are written when the indexed entities are saved (see SearchService)
+    so a single trigram-indexed table answers cross-entity searches.
+    search_text is normalized like Owner.search_text (lowercase, phone digits).
+    """
+    __tablename__ = "search_entries"
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", name="uq_search_entries_entity"),
+        # Trigram matching
+        Index(
+            "ix_search_entries_search_text_trgm", "search_text",
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+    )
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Tenant (Multi-tenant isolation)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False, index=True)
+
+    # Indexed entity
+    entity_type = Column(String(20), nullable=False)  # owner, pet, appointment
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    owner_id = Column(UUID(as_uuid=True), nullable=False, index=True)  # The owner, or the entity's owner
+
+    # Display
+    title = Column(String(255), nullable=False)
+    subtitle = Column(String(500), nullable=True)
+    starts_at = Column(DateTime(timezone=True), nullable=True)  # Appointments only
+
+    # Matching
+    search_text = Column(Text, nullable=False)
+
+    # Timestamps
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<SearchEntry(entity_type={self.entity_type}, entity_id={self.entity_id}, title={self.title})>"
@@ -0,0 +1,61 @@
+"""
+SMS message model - durable outbox for outbound SMS
+"""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+import enum
+
+from ..db.base import Base
+
+
+class SmsStatus(str, enum.Enum):
+    QUEUED = "queued"  # Waiting for (re)delivery at next_attempt_at
+    SENDING = "sending"  # Claimed by a worker
+    SENT = "sent"  # Accepted by Twilio
+    DELIVERED = "delivered"  # Confirmed by Twilio status callback
+    UNDELIVERED = "undelivered"
+    FAILED = "failed"
+
+
+class SmsMessage(Base):
+    """
+    SMS message model - one outbound SMS and its delivery state
+
+    Services enqueue rows inside their own transaction (see NotificationQueue);
+    the SMS worker sends them, retries transient failures with backoff, and
+    Twilio status callbacks record final delivery.
+    """
+    __tablename__ = "sms_outbox"
+    __table_args__ = (
+        # Worker polling for due messages
+        Index("ix_sms_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Tenant (nullable for platform messages)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=True, index=True)
+
+    # Message
+    to_phone = Column(String(20), nullable=False)
+    body = Column(Text, nullable=False)
+    dedupe_key = Column(String(255), unique=True, nullable=True)  # e.g. "reminder_24h:<appointment_id>"
+
+    # Delivery state
+    status = Column(SQLEnum(SmsStatus), default=SmsStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    provider_sid = Column(String(64), unique=True, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    delivered_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<SmsMessage(id={self.id}, to_phone={self.to_phone}, status={self.status})>"
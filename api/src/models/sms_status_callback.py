@@ -0,0 +1,32 @@
+"""
+SMS status callback model - delivery callbacks awaiting their outbox message
+"""
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum
+from sqlalchemy.sql import func
+
+from ..db.base import Base
+from .sms_message import SmsStatus
+
+
+class SmsStatusCallback(Base):
+    """
+    SMS Status Callback model - a Twilio status for a SID not yet recorded
+
+    Twilio can report a message before the SMS worker has stored its SID.
+    Such callbacks are parked here and applied once the worker records the
+    SID (see NotificationQueue.apply_pending_statuses).
+    """
+    __tablename__ = "sms_status_callbacks"
+
+    # Primary Key
+    provider_sid = Column(String(64), primary_key=True)
+
+    # Most advanced status reported so far
+    status = Column(SQLEnum(SmsStatus), nullable=False)
+    error_code = Column(String(32), nullable=True)
+
+    # Timestamps
+    received_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<SmsStatusCallback(provider_sid={self.provider_sid}, status={self.status})>"
@@ -1,7 +1,7 @@
 """
 Staff model for groomers, trainers, and other service providers
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Text, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -15,6 +15,10 @@ class Staff(Base):
     Staff model - represents groomers, trainers, and other service providers
     """
     __tablename__ = "staff"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_staff_tenant_created_at_id", "tenant_id", "created_at", "id"),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -1,7 +1,7 @@
 """
 Vaccination record model for tracking pet vaccinations
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Date, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Date, Text, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -35,6 +35,10 @@ class VaccinationRecord(Base):
     Vaccination Record model - tracks pet vaccination history
     """
     __tablename__ = "vaccination_records"
+    __table_args__ = (
+        # Keyset pagination for list endpoints
+        Index("ix_vaccination_records_tenant_expiry_date_id", "tenant_id", "expiry_date", "id"),
+    )
 
     # Primary Key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
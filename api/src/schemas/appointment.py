@@ -43,3 +43,42 @@ class AppointmentResponse(AppointmentBase):
 
     class Config:
         from_attributes = True
+
+
+class CalendarOwner(BaseModel):
+    id: UUID
+    first_name: str
+    last_name: str
+    phone: str
+
+
+class CalendarPet(BaseModel):
+    id: UUID
+    name: str
+    species: str
+    breed: Optional[str] = None
+
+
+class CalendarService(BaseModel):
+    id: UUID
+    name: str
+    duration_minutes: int
+
+
+class CalendarStaff(BaseModel):
+    id: UUID
+    first_name: str
+    last_name: str
+
+
+class CalendarAppointment(BaseModel):
+    id: UUID
+    status: str
+    scheduled_start: datetime
+    scheduled_end: datetime
+    resource_id: Optional[UUID] = None
+    customer_notes: Optional[str] = None
+    owner: CalendarOwner
+    pets: List[CalendarPet]
+    service: CalendarService
+    staff: Optional[CalendarStaff] = None
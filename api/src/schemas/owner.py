@@ -47,3 +47,14 @@ class OwnerResponse(OwnerBase):
 
     class Config:
         from_attributes = True
+
+
+class OwnerSearchResult(BaseModel):
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+
+    class Config:
+        from_attributes = True
@@ -8,6 +8,14 @@ from .service_service import ServiceService
 from .appointment_service import AppointmentService
 from .payment_service import PaymentService
 from .scheduling_service import SchedulingService
+from .customer_value_service import CustomerValueService
+from .stats_service import StatsService
+from .reminder_service import ReminderService
+from .notification_schedule_service import NotificationScheduleService
+from .no_show_service import NoShowService
+from .search_service import SearchService
+from .entity_version_service import EntityVersionService
+from .catalog_service import CatalogService
 
 __all__ = [
     "StaffService",
@@ -17,4 +25,12 @@ __all__ = [
     "AppointmentService",
     "PaymentService",
     "SchedulingService",
+    "CustomerValueService",
+    "StatsService",
+    "ReminderService",
+    "NotificationScheduleService",
+    "NoShowService",
+    "SearchService",
+    "EntityVersionService",
+    "CatalogService",
 ]
@@ -2,23 +2,32 @@
 Appointment service with business logic
 Sprint 2: Scheduling validation and double-booking prevention implemented
 """
+from sqlalchemy import any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
 from uuid import UUID
 import uuid
 
+from ..core.serialization import response_load_only
 from ..models.appointment import Appointment, AppointmentStatus
 from ..models.owner import Owner
+from ..models.pet import Pet
 from ..models.service import Service
+from ..models.staff import Staff
 from ..models.tenant import Tenant
-from ..schemas.appointment import AppointmentCreate, AppointmentUpdate
+from ..schemas.appointment import AppointmentCreate, AppointmentUpdate, AppointmentResponse
+from .catalog_service import CatalogService
+from .reputation_service import ReputationService
 from .scheduling_service import SchedulingService
 
 
 class AppointmentService:
     """Business logic for appointment management"""
 
+    CALENDAR_MAX_DAYS = 62  # Widest range one calendar request may cover
+
     @staticmethod
     def create_appointment(
         db: Session,
@@ -38,11 +47,14 @@ class AppointmentService:
         if not owner:
             raise ValueError("Owner not found")
 
-        # Verify service exists
-        service = db.query(Service).filter(
-            Service.id == appointment_data.service_id,
-            Service.tenant_id == tenant.id
-        ).first()
+        # Reputation gate, from columns already on the loaded owner. Booking
+        # is public, so the reason (score, unpaid fees) is not passed on
+        can_book, _ = ReputationService.check_booking_eligibility(owner)
+        if not can_book:
+            raise ValueError(ReputationService.BOOKING_DENIED_MESSAGE)
+
+        # Verify service exists (from the catalog snapshot)
+        service = CatalogService.get_snapshot(db, tenant.id).service(appointment_data.service_id)
 
         if not service:
             raise ValueError("Service not found")
@@ -110,7 +122,9 @@ class AppointmentService:
         end_date: datetime = None
     ) -> List[Appointment]:
         """List appointments with filters"""
-        query = db.query(Appointment).filter(Appointment.tenant_id == tenant.id)
+        query = db.query(Appointment).options(
+            response_load_only(Appointment, AppointmentResponse)
+        ).filter(Appointment.tenant_id == tenant.id)
 
         if owner_id:
             query = query.filter(Appointment.owner_id == owner_id)
@@ -129,6 +143,137 @@ class AppointmentService:
 
         return query.order_by(Appointment.scheduled_start).offset(skip).limit(limit).all()
 
+    @staticmethod
+    def get_calendar(
+        db: Session,
+        tenant: Tenant,
+        start: datetime,
+        end: datetime,
+        staff_id: UUID = None,
+        include_cancelled: bool = False
+    ) -> List[Dict]:
+        """
+        Appointments overlapping a date range with owner, pets, service and staff
+
+        Runs two queries whatever the number of appointments: one joining
+        owners, services and staff, and one resolving every pet_ids entry
+        with `id = ANY(:ids)`.
+
+        Args:
+            db: Database session
+            tenant: Current tenant
+            start: Range start
+            end: Range end (exclusive)
+            staff_id: Only this staff member's appointments
+            include_cancelled: Also return cancelled appointments
+
+        Returns:
+            Calendar entries (CalendarAppointment shape) ordered by start time
+
+        Raises:
+            ValueError: If the range is empty or wider than CALENDAR_MAX_DAYS
+        """
+        if end <= start:
+            raise ValueError("end must be after start")
+        if end - start > timedelta(days=AppointmentService.CALENDAR_MAX_DAYS):
+            raise ValueError(f"Calendar range cannot exceed {AppointmentService.CALENDAR_MAX_DAYS} days")
+
+        query = db.query(
+            Appointment.id,
+            Appointment.status,
+            Appointment.scheduled_start,
+            Appointment.scheduled_end,
+            Appointment.resource_id,
+            Appointment.customer_notes,
+            Appointment.pet_ids,
+            Owner.id.label("owner_id"),
+            Owner.first_name.label("owner_first_name"),
+            Owner.last_name.label("owner_last_name"),
+            Owner.phone.label("owner_phone"),
+            Service.id.label("service_id"),
+            Service.name.label("service_name"),
+            Service.duration_minutes.label("service_duration_minutes"),
+            Staff.id.label("staff_id"),
+            Staff.first_name.label("staff_first_name"),
+            Staff.last_name.label("staff_last_name")
+        ).join(
+            Owner, Owner.id == Appointment.owner_id
+        ).join(
+            Service, Service.id == Appointment.service_id
+        ).outerjoin(
+            Staff, Staff.id == Appointment.staff_id
+        ).filter(
+            Appointment.tenant_id == tenant.id,
+            Appointment.scheduled_start < end,
+            Appointment.scheduled_end > start,
+            Appointment.deleted_at.is_(None)
+        )
+
+        if staff_id:
+            query = query.filter(Appointment.staff_id == staff_id)
+
+        if not include_cancelled:
+            query = query.filter(Appointment.status != AppointmentStatus.CANCELLED)
+
+        rows = query.order_by(Appointment.scheduled_start, Appointment.id).all()
+
+        pets = AppointmentService.get_pets_by_id(
+            db, tenant, {pet_id for row in rows for pet_id in row.pet_ids}
+        )
+
+        return [
+            {
+                "id": row.id,
+                "status": row.status,
+                "scheduled_start": row.scheduled_start,
+                "scheduled_end": row.scheduled_end,
+                "resource_id": row.resource_id,
+                "customer_notes": row.customer_notes,
+                "owner": {
+                    "id": row.owner_id,
+                    "first_name": row.owner_first_name,
+                    "last_name": row.owner_last_name,
+                    "phone": row.owner_phone
+                },
+                "pets": [pets[pet_id] for pet_id in row.pet_ids if pet_id in pets],
+                "service": {
+                    "id": row.service_id,
+                    "name": row.service_name,
+                    "duration_minutes": row.service_duration_minutes
+                },
+                "staff": {
+                    "id": row.staff_id,
+                    "first_name": row.staff_first_name,
+                    "last_name": row.staff_last_name
+                } if row.staff_id else None
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_pets_by_id(db: Session, tenant: Tenant, pet_ids) -> Dict[UUID, Dict]:
+        """
+        Pets for a set of appointment pet_ids in one query
+
+        The ids are sent as a single array parameter (`id = ANY(:ids)`), so
+        the statement is the same however many pets are requested.
+
+        Returns:
+            Pet id, name, species and breed keyed by pet ID
+        """
+        pet_ids = list(pet_ids)
+        if not pet_ids:
+            return {}
+
+        rows = db.query(
+            Pet.id, Pet.name, Pet.species, Pet.breed
+        ).filter(
+            Pet.tenant_id == tenant.id,
+            Pet.id == any_(literal(pet_ids, ARRAY(PGUUID(as_uuid=True))))
+        ).all()
+
+        return {row.id: row._asdict() for row in rows}
+
     @staticmethod
     def update_appointment(
         db: Session,
@@ -162,7 +307,7 @@ class AppointmentService:
                 start_time=new_start,
                 end_time=new_end,
                 service_id=appointment.service_id,
-                pet_ids=[pet.id for pet in appointment.pets] if hasattr(appointment, 'pets') else [],
+                pet_ids=appointment.pet_ids,
                 staff_id=appointment_data.staff_id or appointment.staff_id,
                 resource_id=appointment.resource_id,
                 exclude_appointment_id=appointment_id  # Exclude this appointment from conflict check
@@ -0,0 +1,196 @@
+"""
+Catalog Service
+Per-tenant snapshot of services, staff and resources held in memory
+
+A tenant's catalog is tiny and rarely changes, yet booking validation, slot
+generation and the catalog list endpoints read it on nearly every request.
+Each worker keeps one immutable CatalogSnapshot per tenant:
+
+- Versioned by the tenant's entity versions (see EntityVersionService)
+- Re-validated with one version query at most every
+  CATALOG_SNAPSHOT_POLL_SECONDS, and reloaded only when a version moved
+- Reloaded early when the session already read newer versions (e.g. for
+  an ETag), so a response is never tagged newer than its body
+- Dropped immediately in the worker that commits a catalog change
+- Bypassed by sessions holding uncommitted catalog changes, so callers see
+  their own writes and uncommitted rows are never shared
+
+Other workers may therefore serve a catalog up to the poll interval old.
+Appointment overlap checks still read (and lock) the database.
+"""
+from dataclasses import dataclass, field
+from itertools import chain
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+from uuid import UUID
+import time
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.pagination import row_sort_key
+from ..models.resource import Resource
+from ..models.service import Service
+from ..models.staff import Staff
+from .entity_version_service import RESOURCES, SERVICES, STAFF, EntityVersionService
+
+# Entity kinds making up the catalog, in version tuple order
+CATALOG_ENTITIES = (SERVICES, STAFF, RESOURCES)
+
+# Row order of each collection, matching the list endpoints
+SERVICE_ORDER = (Service.display_order, Service.name, Service.id)
+STAFF_ORDER = (Staff.created_at, Staff.id)
+RESOURCE_ORDER = (Resource.display_order, Resource.name, Resource.id)
+
+# Session.info key holding tenant IDs with uncommitted catalog changes
+_CHANGED_TENANTS_KEY = "catalog_changed_tenants"
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    A tenant's services, staff and resources at one catalog version
+
+    Rows carry every column (soft-deleted rows included) and are read-only;
+    JSON values such as schedules must not be mutated.
+    """
+    tenant_id: UUID
+    version: Tuple[int, ...]
+    services: Tuple[Row, ...]
+    staff: Tuple[Row, ...]
+    resources: Tuple[Row, ...]
+    _services_by_id: Mapping[UUID, Row] = field(repr=False)
+    _staff_by_id: Mapping[UUID, Row] = field(repr=False)
+    _resources_by_id: Mapping[UUID, Row] = field(repr=False)
+
+    def service(self, service_id: UUID) -> Optional[Row]:
+        """Service by ID, or None"""
+        return self._services_by_id.get(service_id)
+
+    def staff_member(self, staff_id: UUID) -> Optional[Row]:
+        """Staff member by ID, or None"""
+        return self._staff_by_id.get(staff_id)
+
+    def resource(self, resource_id: UUID) -> Optional[Row]:
+        """Resource by ID, or None"""
+        return self._resources_by_id.get(resource_id)
+
+
+# Worker-local snapshots: tenant ID -> (monotonic time last validated, snapshot)
+_snapshots: Dict[UUID, Tuple[float, CatalogSnapshot]] = {}
+_snapshots_lock = Lock()
+
+
+class CatalogService:
+    """Service for per-tenant catalog snapshots"""
+
+    @staticmethod
+    def get_snapshot(db: Session, tenant_id: UUID) -> CatalogSnapshot:
+        """
+        Current catalog snapshot of a tenant
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+
+        Returns:
+            Immutable snapshot, shared with other requests in this worker
+        """
+        if tenant_id in db.info.get(_CHANGED_TENANTS_KEY, ()):
+            return CatalogService._load(db, tenant_id, version=())
+
+        now = time.monotonic()
+        with _snapshots_lock:
+            cached = _snapshots.get(tenant_id)
+
+        if cached and now - cached[0] < settings.CATALOG_SNAPSHOT_POLL_SECONDS:
+            if not CatalogService._behind(db, cached[1]):
+                return cached[1]
+
+        versions = EntityVersionService.get_versions(db, tenant_id, CATALOG_ENTITIES)
+        version = tuple(versions[entity] for entity in CATALOG_ENTITIES)
+
+        if cached and cached[1].version == version:
+            snapshot = cached[1]
+        else:
+            snapshot = CatalogService._load(db, tenant_id, version)
+
+        with _snapshots_lock:
+            _snapshots[tenant_id] = (now, snapshot)
+
+        return snapshot
+
+    @staticmethod
+    def invalidate(tenant_id: UUID) -> None:
+        """Drop this worker's snapshot of a tenant"""
+        with _snapshots_lock:
+            _snapshots.pop(tenant_id, None)
+
+    # ==================== HELPER METHODS ====================
+
+    @staticmethod
+    def _behind(db: Session, snapshot: CatalogSnapshot) -> bool:
+        """Whether the session already read a newer version of any catalog kind"""
+        seen = EntityVersionService.seen_versions(db, snapshot.tenant_id, CATALOG_ENTITIES)
+        return any(
+            seen[entity] > version
+            for entity, version in zip(CATALOG_ENTITIES, snapshot.version)
+            if entity in seen
+        )
+
+    @staticmethod
+    def _load(db: Session, tenant_id: UUID, version: Tuple[int, ...]) -> CatalogSnapshot:
+        """Read a tenant's catalog into a new snapshot (three queries)"""
+        def rows(model, order):
+            loaded = db.execute(
+                select(model.__table__).where(model.tenant_id == tenant_id)
+            ).all()
+            return tuple(sorted(loaded, key=row_sort_key(order)))
+
+        services = rows(Service, SERVICE_ORDER)
+        staff = rows(Staff, STAFF_ORDER)
+        resources = rows(Resource, RESOURCE_ORDER)
+
+        return CatalogSnapshot(
+            tenant_id=tenant_id,
+            version=version,
+            services=services,
+            staff=staff,
+            resources=resources,
+            _services_by_id=MappingProxyType({row.id: row for row in services}),
+            _staff_by_id=MappingProxyType({row.id: row for row in staff}),
+            _resources_by_id=MappingProxyType({row.id: row for row in resources})
+        )
+
+
+# ==================== SNAPSHOT INVALIDATION ====================
+
+_CATALOG_MODELS = (Service, Staff, Resource)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_catalogs(session: Session, flush_context) -> None:
+    """Record tenants whose catalog rows were flushed"""
+    tenant_ids = {
+        obj.tenant_id
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, _CATALOG_MODELS)
+    }
+    if tenant_ids:
+        session.info.setdefault(_CHANGED_TENANTS_KEY, set()).update(tenant_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_catalogs(session: Session) -> None:
+    """Drop this worker's snapshots of tenants whose catalog changed"""
+    for tenant_id in session.info.pop(_CHANGED_TENANTS_KEY, ()):
+        CatalogService.invalidate(tenant_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_catalogs(session: Session) -> None:
+    """Forget catalog changes from a rolled-back transaction"""
+    session.info.pop(_CHANGED_TENANTS_KEY, None)
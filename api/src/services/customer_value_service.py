@@ -0,0 +1,309 @@
+"""
+Customer Value Service
+Per-owner lifetime revenue, appointment count and last visit
+
+Aggregates are computed from payments and appointments with independent
+per-owner subqueries (joining both tables to the owner at once would multiply
+every payment by every appointment). When CUSTOMER_VALUE_MATERIALIZED is
+enabled the aggregates are served from the customer_values table, which is
+refreshed for the affected owners whenever a session commits changes to their
+payments or appointments.
+"""
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, event, func, inspect
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query, Session
+
+from ..core.config import settings
+from ..core.pagination import paginate_keyset
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.customer_value import CustomerValue
+from ..models.owner import Owner
+from ..models.payment import Payment, PaymentStatus
+
+SUCCESSFUL_PAYMENT_STATUSES = [PaymentStatus.SUCCEEDED, PaymentStatus.COMPLETED]
+
+# Session.info key holding owner IDs whose aggregates are stale
+_STALE_OWNERS_KEY = "customer_value_stale_owners"
+
+
+class CustomerValueService:
+    """Service for per-customer value aggregates"""
+
+    @staticmethod
+    def get_lifetime_revenue(
+        db: Session,
+        owner_id: UUID
+    ) -> int:
+        """
+        Get total successful payment amount for an owner
+
+        Args:
+            db: Database session
+            owner_id: Owner ID
+
+        Returns:
+            Lifetime revenue in cents
+        """
+        if settings.CUSTOMER_VALUE_MATERIALIZED:
+            revenue = db.query(CustomerValue.lifetime_revenue).filter(
+                CustomerValue.owner_id == owner_id
+            ).scalar()
+            if revenue is not None:
+                return revenue
+
+        revenue = db.query(func.sum(Payment.amount)).filter(
+            Payment.owner_id == owner_id,
+            Payment.status.in_(SUCCESSFUL_PAYMENT_STATUSES)
+        ).scalar()
+
+        return revenue or 0
+
+    @staticmethod
+    def list_customers_by_value(
+        db: Session,
+        tenant_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        min_revenue: Optional[int] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        List customers ranked by lifetime revenue, highest first
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Page size
+            min_revenue: Only include customers with at least this revenue (cents)
+
+        Returns:
+            Tuple of (customers, next_cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        values = CustomerValueService._values_subquery(db, tenant_id)
+
+        query = db.query(
+            values.c.owner_id,
+            Owner.first_name,
+            Owner.last_name,
+            Owner.email,
+            values.c.lifetime_revenue,
+            values.c.appointment_count,
+            values.c.last_visit_at
+        ).join(
+            Owner, Owner.id == values.c.owner_id
+        ).filter(
+            Owner.deleted_at.is_(None)
+        )
+
+        if min_revenue is not None:
+            query = query.filter(values.c.lifetime_revenue >= min_revenue)
+
+        rows, next_cursor = paginate_keyset(
+            query,
+            [values.c.lifetime_revenue, values.c.owner_id],
+            cursor,
+            limit,
+            descending=True
+        )
+
+        customers = [
+            {
+                "owner_id": str(r.owner_id),
+                "name": f"{r.first_name} {r.last_name}",
+                "email": r.email,
+                "lifetime_revenue": r.lifetime_revenue,
+                "appointment_count": r.appointment_count,
+                "last_visit_at": r.last_visit_at.isoformat() if r.last_visit_at else None
+            }
+            for r in rows
+        ]
+
+        return customers, next_cursor
+
+    @staticmethod
+    def refresh_customer_values(
+        db: Session,
+        owner_ids: Iterable[UUID]
+    ) -> int:
+        """
+        Recompute and upsert materialized aggregates for specific owners
+
+        Runs in the caller's transaction; the caller commits.
+
+        Args:
+            db: Database session
+            owner_ids: Owners whose payments or appointments changed
+
+        Returns:
+            Number of rows upserted
+        """
+        owner_ids = list(owner_ids)
+        if not owner_ids:
+            return 0
+
+        source = CustomerValueService._aggregate_query(db, owner_ids=owner_ids)
+        result = db.execute(CustomerValueService._upsert_statement(source))
+
+        return result.rowcount
+
+    @staticmethod
+    def rebuild_customer_values(
+        db: Session,
+        tenant_id: Optional[UUID] = None
+    ) -> int:
+        """
+        Recompute materialized aggregates for every owner of a tenant (or all tenants)
+
+        Used to backfill customer_values when materialization is first enabled.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID, or None for all tenants
+
+        Returns:
+            Number of rows upserted
+        """
+        source = CustomerValueService._aggregate_query(db, tenant_id=tenant_id)
+        result = db.execute(CustomerValueService._upsert_statement(source))
+        db.commit()
+
+        return result.rowcount
+
+    # ==================== HELPER METHODS ====================
+
+    @staticmethod
+    def _aggregate_query(
+        db: Session,
+        tenant_id: Optional[UUID] = None,
+        owner_ids: Optional[List[UUID]] = None
+    ) -> Query:
+        """
+        Build the live per-owner aggregate query
+
+        Payments and appointments are each grouped by owner in their own
+        subquery before being joined, so neither fans out the other.
+        """
+        revenue = db.query(
+            Payment.owner_id.label("owner_id"),
+            func.sum(Payment.amount).label("lifetime_revenue")
+        ).filter(
+            Payment.status.in_(SUCCESSFUL_PAYMENT_STATUSES)
+        )
+
+        visits = db.query(
+            Appointment.owner_id.label("owner_id"),
+            func.count(Appointment.id).label("appointment_count"),
+            func.max(
+                case(
+                    (Appointment.status == AppointmentStatus.COMPLETED, Appointment.scheduled_start)
+                )
+            ).label("last_visit_at")
+        ).filter(
+            Appointment.deleted_at.is_(None),
+            Appointment.status != AppointmentStatus.CANCELLED
+        )
+
+        if tenant_id is not None:
+            revenue = revenue.filter(Payment.tenant_id == tenant_id)
+            visits = visits.filter(Appointment.tenant_id == tenant_id)
+
+        if owner_ids is not None:
+            revenue = revenue.filter(Payment.owner_id.in_(owner_ids))
+            visits = visits.filter(Appointment.owner_id.in_(owner_ids))
+
+        revenue = revenue.group_by(Payment.owner_id).subquery()
+        visits = visits.group_by(Appointment.owner_id).subquery()
+
+        query = db.query(
+            Owner.id.label("owner_id"),
+            Owner.tenant_id.label("tenant_id"),
+            func.coalesce(revenue.c.lifetime_revenue, 0).label("lifetime_revenue"),
+            func.coalesce(visits.c.appointment_count, 0).label("appointment_count"),
+            visits.c.last_visit_at.label("last_visit_at")
+        ).outerjoin(
+            revenue, revenue.c.owner_id == Owner.id
+        ).outerjoin(
+            visits, visits.c.owner_id == Owner.id
+        )
+
+        if tenant_id is not None:
+            query = query.filter(Owner.tenant_id == tenant_id)
+
+        if owner_ids is not None:
+            query = query.filter(Owner.id.in_(owner_ids))
+
+        return query
+
+    @staticmethod
+    def _values_subquery(db: Session, tenant_id: UUID):
+        """Per-owner aggregates for a tenant, materialized or live"""
+        if settings.CUSTOMER_VALUE_MATERIALIZED:
+            return db.query(
+                CustomerValue.owner_id,
+                CustomerValue.lifetime_revenue,
+                CustomerValue.appointment_count,
+                CustomerValue.last_visit_at
+            ).filter(
+                CustomerValue.tenant_id == tenant_id
+            ).subquery("customer_value")
+
+        return CustomerValueService._aggregate_query(db, tenant_id=tenant_id).subquery("customer_value")
+
+    @staticmethod
+    def _upsert_statement(source: Query):
+        """INSERT ... SELECT aggregates, updating rows that already exist"""
+        stmt = insert(CustomerValue).from_select(
+            ["owner_id", "tenant_id", "lifetime_revenue", "appointment_count", "last_visit_at"],
+            source.statement
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[CustomerValue.owner_id],
+            set_={
+                "lifetime_revenue": stmt.excluded.lifetime_revenue,
+                "appointment_count": stmt.excluded.appointment_count,
+                "last_visit_at": stmt.excluded.last_visit_at,
+                "refreshed_at": func.now()
+            }
+        )
+
+
+# ==================== INCREMENTAL REFRESH ====================
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_customer_values(session: Session, flush_context) -> None:
+    """Record owners whose payments or appointments were flushed"""
+    if not settings.CUSTOMER_VALUE_MATERIALIZED:
+        return
+
+    stale = session.info.setdefault(_STALE_OWNERS_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, (Payment, Appointment)):
+            continue
+        # Include the previous owner if the record was reassigned
+        history = inspect(obj).attrs.owner_id.history
+        stale.update(owner_id for owner_id in chain(history.added, history.unchanged, history.deleted) if owner_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_stale_customer_values(session: Session) -> None:
+    """Refresh aggregates for stale owners in the committing transaction"""
+    if not settings.CUSTOMER_VALUE_MATERIALIZED:
+        return
+
+    session.flush()
+    stale = session.info.pop(_STALE_OWNERS_KEY, None)
+    if stale:
+        CustomerValueService.refresh_customer_values(session, stale)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_customer_values(session: Session) -> None:
+    """Forget stale owners from a rolled-back transaction"""
+    session.info.pop(_STALE_OWNERS_KEY, None)
@@ -0,0 +1,139 @@
+"""
+Entity Version Service
+Per-tenant change counters behind ETags on read endpoints
+
+Features:
+- One counter per tenant and entity kind (services, staff, resources, appointments)
+- Bumped in the writing transaction by a flush hook on the versioned models
+- Core (bulk) writes bump explicitly via EntityVersionService.bump
+"""
+from typing import Dict, Iterable, Tuple
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from ..models.appointment import Appointment
+from ..models.entity_version import EntityVersion
+from ..models.resource import Resource
+from ..models.service import Service
+from ..models.staff import Staff
+
+# Entity kinds
+SERVICES = "services"
+STAFF = "staff"
+RESOURCES = "resources"
+APPOINTMENTS = "appointments"
+
+# Kind per versioned model
+VERSIONED_MODELS = {
+    Service: SERVICES,
+    Staff: STAFF,
+    Resource: RESOURCES,
+    Appointment: APPOINTMENTS,
+}
+
+# Session.info key holding the versions a session has read
+_SEEN_VERSIONS_KEY = "entity_versions_seen"
+
+
+class EntityVersionService:
+    """Service for per-tenant entity version counters"""
+
+    @staticmethod
+    def get_versions(db: Session, tenant_id: UUID, entities: Iterable[str]) -> Dict[str, int]:
+        """
+        Current versions of a tenant's entity kinds, in one query
+
+        Kinds never written have version 0. The versions are remembered on
+        the session (see seen_versions).
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            entities: Entity kinds
+
+        Returns:
+            Version keyed by entity kind
+        """
+        entities = list(entities)
+        versions = dict(db.execute(
+            select(EntityVersion.entity, EntityVersion.version).where(
+                EntityVersion.tenant_id == tenant_id,
+                EntityVersion.entity.in_(entities)
+            )
+        ).all())
+
+        versions = {entity: versions.get(entity, 0) for entity in entities}
+        db.info.setdefault(_SEEN_VERSIONS_KEY, {}).update(
+            {(tenant_id, entity): version for entity, version in versions.items()}
+        )
+
+        return versions
+
+    @staticmethod
+    def seen_versions(db: Session, tenant_id: UUID, entities: Iterable[str]) -> Dict[str, int]:
+        """
+        Versions this session last read with get_versions, without a query
+
+        Lets in-memory caches serve data at least as new as the versions a
+        request already used (e.g. for its ETag).
+
+        Returns:
+            Version keyed by entity kind, for the kinds read so far
+        """
+        seen = db.info.get(_SEEN_VERSIONS_KEY, {})
+        return {
+            entity: seen[(tenant_id, entity)]
+            for entity in entities
+            if (tenant_id, entity) in seen
+        }
+
+    @staticmethod
+    def bump(db, changes: Iterable[Tuple[UUID, str]]) -> None:
+        """
+        Increment the versions of changed (tenant, entity kind) pairs
+
+        Runs in the caller's transaction, so the new versions become visible
+        together with the writes they describe. Rows are locked in a fixed
+        order to avoid deadlocks between concurrent writers.
+
+        Args:
+            db: Database session or connection
+            changes: (tenant_id, entity kind) pairs
+        """
+        changes = sorted(set(changes), key=lambda change: (str(change[0]), change[1]))
+        if not changes:
+            return
+
+        stmt = insert(EntityVersion).values([
+            {"tenant_id": tenant_id, "entity": entity, "version": 1}
+            for tenant_id, entity in changes
+        ])
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[EntityVersion.tenant_id, EntityVersion.entity],
+                set_={
+                    "version": EntityVersion.version + 1,
+                    "updated_at": func.now()
+                }
+            )
+        )
+
+
+# ==================== VERSIONING ON SAVE ====================
+
+@event.listens_for(Session, "after_flush")
+def _bump_entity_versions(session: Session, flush_context) -> None:
+    """Bump versions for versioned entities saved or deleted in this flush"""
+    changes = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        entity = VERSIONED_MODELS.get(type(obj))
+        if entity is None:
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        changes.add((obj.tenant_id, entity))
+
+    if changes:
+        EntityVersionService.bump(session.connection(), changes)
@@ -10,16 +10,25 @@ Features:
 - Integration with reputation scoring
 """
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from itertools import chain
+from typing import Iterable, List, Dict, Tuple, Optional
+from sqlalchemy import case, event, func, insert, inspect, select, update
 from sqlalchemy.orm import Session
 from uuid import UUID
+import logging
 import uuid
 
 from ..models.appointment import Appointment, AppointmentStatus
 from ..models.owner import Owner
 from ..models.tenant import Tenant
-from ..models.payment import Payment, PaymentStatus, PaymentType
+from ..models.payment import Payment, PaymentStatus, PaymentType, PaymentMethod
 from ..integrations.twilio_service import TwilioService
+from ..integrations.notification_queue import NotificationQueue
+from .entity_version_service import APPOINTMENTS, EntityVersionService
+from .reputation_service import ReputationEventType, ReputationService
+from .stats_service import daily_stats_cache
+
+logger = logging.getLogger(__name__)
 
 
 class NoShowService:
@@ -37,6 +46,9 @@ class NoShowService:
         4: 7500,   # Fourth+ no-show: $75
     }
 
+    # Fee payments still owed (counted in Owner.unpaid_no_show_fees)
+    UNPAID_FEE_STATUSES = (PaymentStatus.PENDING, PaymentStatus.FAILED)
+
     @staticmethod
     def detect_no_shows(
         db: Session,
@@ -130,12 +142,14 @@ class NoShowService:
 
                     appointment.no_show_fee_charged = fee_amount
 
-                    # Update owner no-show count
-                    owner.no_show_count = (owner.no_show_count or 0) + 1
-
                     # Send SMS notification
                     NoShowService.send_no_show_notification(db, appointment, fee_amount)
 
+            # Update owner no-show count and reputation
+            ReputationService.record_event(
+                db, appointment.owner_id, ReputationEventType.NO_SHOW, appointment_id=appointment.id
+            )
+
             db.commit()
             return True, None
 
@@ -143,6 +157,156 @@ class NoShowService:
             db.rollback()
             return False, str(e)
 
+    @staticmethod
+    def mark_no_shows_batch(
+        db: Session,
+        tenant_id: UUID,
+        grace_period_minutes: int = DEFAULT_GRACE_PERIOD_MINUTES,
+        apply_fee: bool = True
+    ) -> Dict[str, int]:
+        """
+        Detect and mark all no-shows for a tenant in one transaction
+
+        Appointments are marked with a single UPDATE ... RETURNING. Escalating
+        fees are assigned with a window function that numbers each owner's new
+        no-shows on top of their existing count, fee payments are bulk
+        inserted (refreshing the owners' unpaid fee balances), and the
+        no-shows are recorded in the reputation ledger with one UPDATE of
+        owner counts and scores.
+        SMS notifications are written to the outbox in the same transaction.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            grace_period_minutes: Grace period after scheduled time
+            apply_fee: Whether to apply no-show fees
+
+        Returns:
+            Summary of processing
+        """
+        results = {
+            "total_detected": 0,
+            "fees_applied": 0,
+            "notifications_sent": 0,
+            "errors": 0
+        }
+
+        cutoff_time = datetime.utcnow() - timedelta(minutes=grace_period_minutes)
+
+        try:
+            marked = update(Appointment).where(
+                Appointment.tenant_id == tenant_id,
+                Appointment.status.in_([AppointmentStatus.CONFIRMED, AppointmentStatus.PENDING]),
+                Appointment.scheduled_start < cutoff_time,
+                Appointment.arrived_at.is_(None),
+                Appointment.is_no_show == False,
+                Appointment.deleted_at.is_(None)
+            ).values(
+                status=AppointmentStatus.NO_SHOW,
+                is_no_show=True,
+                updated_at=func.now()
+            ).returning(
+                Appointment.id,
+                Appointment.owner_id,
+                Appointment.scheduled_start
+            ).cte("marked")
+
+            # Owner's running no-show number, counting this batch in schedule order
+            ranked = select(
+                marked.c.id,
+                marked.c.owner_id,
+                marked.c.scheduled_start,
+                Owner.first_name,
+                Owner.phone,
+                Owner.sms_opted_in,
+                (
+                    Owner.no_show_count +
+                    func.row_number().over(
+                        partition_by=marked.c.owner_id,
+                        order_by=(marked.c.scheduled_start, marked.c.id)
+                    )
+                ).label("no_show_number")
+            ).join(
+                Owner, Owner.id == marked.c.owner_id
+            ).subquery("ranked")
+
+            rows = db.execute(
+                select(
+                    ranked,
+                    NoShowService._penalty_for(ranked.c.no_show_number).label("fee_amount")
+                )
+            ).all()
+
+            if rows:
+                # Core update bypasses the flush listener
+                EntityVersionService.bump(db, [(tenant_id, APPOINTMENTS)])
+
+                if apply_fee:
+                    db.execute(insert(Payment), [
+                        {
+                            "id": uuid.uuid4(),
+                            "tenant_id": tenant_id,
+                            "owner_id": r.owner_id,
+                            "appointment_id": r.id,
+                            "type": PaymentType.NO_SHOW_FEE,
+                            "method": PaymentMethod.OTHER,
+                            "status": PaymentStatus.PENDING,
+                            "amount": r.fee_amount,
+                            "net_amount": r.fee_amount,
+                            "description": f"No-show fee for appointment {r.id}"
+                        }
+                        for r in rows
+                    ])
+                    db.execute(update(Appointment), [
+                        {"id": r.id, "no_show_fee_charged": r.fee_amount}
+                        for r in rows
+                    ])
+                    # Core insert bypasses the flush listener
+                    NoShowService.refresh_unpaid_fees(db, {r.owner_id for r in rows})
+
+                ReputationService.record_events_batch(db, [
+                    {
+                        "tenant_id": tenant_id,
+                        "owner_id": r.owner_id,
+                        "appointment_id": r.id,
+                        "event_type": ReputationEventType.NO_SHOW
+                    }
+                    for r in rows
+                ])
+
+                if apply_fee:
+                    results["notifications_sent"] = NotificationQueue.enqueue_sms_batch(db, [
+                        {
+                            "tenant_id": tenant_id,
+                            "to_phone": r.phone,
+                            "message": NoShowService._format_no_show_message(
+                                r.first_name, r.scheduled_start, r.fee_amount
+                            ),
+                            "dedupe_key": f"no_show:{r.id}"
+                        }
+                        for r in rows
+                        if r.sms_opted_in
+                    ])
+
+            db.commit()
+
+        except Exception:
+            db.rollback()
+            logger.error(f"No-show batch failed for tenant {tenant_id}", exc_info=True)
+            results["errors"] = 1
+            results["notifications_sent"] = 0
+            return results
+
+        if rows:
+            daily_stats_cache.invalidate(tenant_id)
+
+        results["total_detected"] = len(rows)
+
+        if apply_fee:
+            results["fees_applied"] = len(rows)
+
+        return results
+
     @staticmethod
     def calculate_no_show_penalty(
         db: Session,
@@ -203,19 +367,11 @@ class NoShowService:
         # Calculate total fees
         total_fees = sum(appt.no_show_fee_charged or 0 for appt in no_shows)
 
-        # Get unpaid fees
-        unpaid_fees_query = db.query(Payment).filter(
-            Payment.owner_id == owner_id,
-            Payment.type == PaymentType.NO_SHOW_FEE,
-            Payment.status.in_([PaymentStatus.PENDING, PaymentStatus.FAILED])
-        )
-        unpaid_fees = sum(p.amount for p in unpaid_fees_query.all())
-
         return {
             "owner_id": str(owner_id),
             "total_no_shows": len(no_shows),
             "total_fees_charged": total_fees,
-            "unpaid_fees": unpaid_fees,
+            "unpaid_fees": owner.unpaid_no_show_fees,
             "last_no_show": no_shows[0].scheduled_start.isoformat() if no_shows else None,
             "no_show_rate": NoShowService.calculate_no_show_rate(db, owner_id),
             "recent_no_shows": [
@@ -275,24 +431,21 @@ class NoShowService:
             fee_amount: Fee charged in cents
 
         Returns:
-            SMS result or None
+            Queued SMS result or None
         """
         owner = db.query(Owner).filter(Owner.id == appointment.owner_id).first()
         if not owner or not owner.sms_opted_in:
             return None
 
-        # Format fee for display
-        fee_display = f"${fee_amount / 100:.2f}"
-
-        message = f"""
-Hi {owner.first_name}, you missed your appointment on {appointment.scheduled_start.strftime('%B %d at %I:%M %p')}.
-
-A no-show fee of {fee_display} has been applied to your account.
-
-To avoid future fees, please cancel at least 24 hours in advance.
-        """.strip()
+        message = NoShowService._format_no_show_message(
+            owner.first_name, appointment.scheduled_start, fee_amount
+        )
 
-        return TwilioService.send_sms(owner.phone, message)
+        return TwilioService.queue_sms(
+            db, owner.phone, message,
+            tenant_id=appointment.tenant_id,
+            dedupe_key=f"no_show:{appointment.id}"
+        )
 
     @staticmethod
     def process_daily_no_show_detection(
@@ -302,7 +455,8 @@ To avoid future fees, please cancel at least 24 hours in advance.
         """
         Daily no-show detection task
 
-        Should be run by scheduler once per day
+        Should be run by scheduler once per day. Uses the set-based batch
+        path (mark_no_shows_batch).
 
         Args:
             db: Database session
@@ -311,26 +465,7 @@ To avoid future fees, please cancel at least 24 hours in advance.
         Returns:
             Summary of processing
         """
-        no_shows = NoShowService.detect_no_shows(db, tenant_id)
-
-        results = {
-            "total_detected": len(no_shows),
-            "fees_applied": 0,
-            "notifications_sent": 0,
-            "errors": 0
-        }
-
-        for appointment in no_shows:
-            success, error = NoShowService.mark_as_no_show(db, appointment.id)
-
-            if success:
-                results["fees_applied"] += 1
-                if appointment.owner.sms_opted_in if hasattr(appointment, 'owner') else False:
-                    results["notifications_sent"] += 1
-            else:
-                results["errors"] += 1
-
-        return results
+        return NoShowService.mark_no_shows_batch(db, tenant_id)
 
     @staticmethod
     def waive_no_show_fee(
@@ -388,6 +523,9 @@ To avoid future fees, please cancel at least 24 hours in advance.
         """
         Get list of high-risk customers (multiple no-shows)
 
+        No-show rates come from the same grouped query as the owners (see
+        ReputationService.list_customer_risk for the paginated report).
+
         Args:
             db: Database session
             tenant_id: Tenant ID
@@ -396,27 +534,121 @@ To avoid future fees, please cancel at least 24 hours in advance.
         Returns:
             List of high-risk customers
         """
-        owners = db.query(Owner).filter(
-            Owner.tenant_id == tenant_id,
-            Owner.no_show_count >= min_no_shows,
-            Owner.deleted_at.is_(None)
+        customers = ReputationService.customer_risk_subquery(tenant_id, min_no_shows=min_no_shows)
+
+        # Highest no-show count first
+        rows = db.query(customers).order_by(
+            customers.c.no_show_count.desc(),
+            customers.c.id.desc()
         ).all()
 
-        result = []
-        for owner in owners:
-            no_show_rate = NoShowService.calculate_no_show_rate(db, owner.id)
+        return [
+            {
+                "owner_id": str(r.id),
+                "name": f"{r.first_name} {r.last_name}",
+                "email": r.email,
+                "phone": r.phone,
+                "no_show_count": r.no_show_count,
+                "no_show_rate": r.no_show_rate,
+                "reputation_score": r.reputation_score,
+                "total_appointments": r.total_appointments
+            }
+            for r in rows
+        ]
 
-            result.append({
-                "owner_id": str(owner.id),
-                "name": f"{owner.first_name} {owner.last_name}",
-                "email": owner.email,
-                "phone": owner.phone,
-                "no_show_count": owner.no_show_count,
-                "no_show_rate": no_show_rate,
-                "reputation_score": owner.reputation_score if hasattr(owner, 'reputation_score') else None
-            })
+    @staticmethod
+    def refresh_unpaid_fees(db, owner_ids: Iterable[UUID]) -> None:
+        """
+        Recompute owners' stored unpaid no-show fee balance
+
+        The balance is read by the booking gate
+        (ReputationService.check_booking_eligibility) without touching
+        payments. Called on flush for ORM payment changes and directly after
+        bulk inserts.
+
+        Args:
+            db: Database session or connection
+            owner_ids: Owners whose no-show fee payments changed
+        """
+        owner_ids = list(owner_ids)
+        if not owner_ids:
+            return
+
+        unpaid = select(
+            func.coalesce(func.sum(Payment.amount), 0)
+        ).where(
+            Payment.owner_id == Owner.id,
+            Payment.type == PaymentType.NO_SHOW_FEE,
+            Payment.status.in_(NoShowService.UNPAID_FEE_STATUSES)
+        ).scalar_subquery()
+
+        db.execute(
+            update(Owner)
+            .where(Owner.id.in_(owner_ids))
+            .values(unpaid_no_show_fees=unpaid)
+            .execution_options(synchronize_session=False)
+        )
+
+    # ==================== HELPER METHODS ====================
+
+    @staticmethod
+    def _penalty_for(no_show_number):
+        """SQL CASE mapping an owner's no-show number to its PENALTY_SCHEDULE fee"""
+        schedule = NoShowService.PENALTY_SCHEDULE
+        top_tier = max(schedule)
+
+        return case(
+            *[(no_show_number == tier, schedule[tier]) for tier in sorted(schedule) if tier < top_tier],
+            else_=schedule[top_tier]
+        )
+
+    @staticmethod
+    def _format_no_show_message(first_name: str, scheduled_start: datetime, fee_amount: int) -> str:
+        """Render the no-show fee SMS"""
+        # Format fee for display
+        fee_display = f"${fee_amount / 100:.2f}"
+
+        return f"""
+Hi {first_name}, you missed your appointment on {scheduled_start.strftime('%B %d at %I:%M %p')}.
+
+A no-show fee of {fee_display} has been applied to your account.
+
+To avoid future fees, please cancel at least 24 hours in advance.
+        """.strip()
 
-        # Sort by no-show count (highest first)
-        result.sort(key=lambda x: x["no_show_count"], reverse=True)
 
-        return result
+# ==================== UNPAID FEE BALANCE ====================
+
+def _history_values(state, attr: str) -> set:
+    """Current and previous values of an attribute in this flush"""
+    history = state.attrs[attr].history
+    return set(chain(history.added, history.unchanged, history.deleted))
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_unpaid_no_show_fees(session: Session, flush_context) -> None:
+    """Refresh unpaid fee balances of owners whose no-show fee payments were flushed"""
+    owner_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Payment):
+            continue
+        state = inspect(obj)
+        if PaymentType.NO_SHOW_FEE not in _history_values(state, "type"):
+            continue
+        if obj in session.dirty and not any(
+            state.attrs[attr].history.has_changes() for attr in ("status", "amount", "type", "owner_id")
+        ):
+            continue
+        # Include the previous owner if the payment was reassigned
+        owner_ids.update(owner_id for owner_id in _history_values(state, "owner_id") if owner_id)
+
+    if not owner_ids:
+        return
+
+    NoShowService.refresh_unpaid_fees(session.connection(), owner_ids)
+
+    # Loaded owners reload the new balance on next access
+    for owner_id in owner_ids:
+        owner = session.identity_map.get(session.identity_key(Owner, owner_id))
+        if owner is not None:
+            session.expire(owner, ["unpaid_no_show_fees"])
@@ -0,0 +1,269 @@
+"""
+Notification Schedule Service
+Precomputed due times for appointment reminders and vaccination alerts
+
+When an appointment or vaccination record is flushed, its reminder/alert due
+times are written to scheduled_notifications in the same transaction. The
+dispatcher then only reads rows whose due_at has passed (partial index on
+pending rows), instead of scanning appointments and vaccination records for
+time windows.
+"""
+from datetime import datetime, time, timedelta, timezone
+from itertools import chain
+from typing import Dict, Iterable, List
+from uuid import UUID
+import uuid
+
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.scheduled_notification import ScheduledNotification, ScheduledNotificationStatus
+from ..models.vaccination_record import VaccinationRecord
+from .reminder_service import REMINDER_KINDS, ReminderService
+from .vaccination_monitoring_service import VaccinationMonitoringService
+
+# Appointment reminder kinds -> ReminderService kind
+APPOINTMENT_KINDS = {f"reminder_{name}": name for name in REMINDER_KINDS}
+
+# Vaccination alert kinds -> days before expiry
+VACCINATION_KINDS = {f"vaccination_{days}d": days for days in VaccinationMonitoringService.ALERT_THRESHOLDS}
+
+# Time of day (UTC) vaccination alerts go out
+VACCINATION_ALERT_TIME = time(hour=6)
+
+ACTIVE_APPOINTMENT_STATUSES = (AppointmentStatus.PENDING, AppointmentStatus.CONFIRMED)
+
+
+class NotificationScheduleService:
+    """Service for scheduling and dispatching reminders and alerts"""
+
+    DEFAULT_BATCH_SIZE = 500
+
+    @staticmethod
+    def appointment_due_times(appointment: Appointment, now: datetime) -> Dict[str, datetime]:
+        """
+        Reminder due times for an appointment
+
+        A reminder whose lead time has already passed is due now, unless the
+        appointment is within that reminder's min_lead.
+
+        Returns:
+            Due time (naive UTC) by kind
+        """
+        if appointment.status not in ACTIVE_APPOINTMENT_STATUSES or appointment.deleted_at is not None:
+            return {}
+
+        start = _as_naive_utc(appointment.scheduled_start)
+        due_times = {}
+        for kind, name in APPOINTMENT_KINDS.items():
+            reminder = REMINDER_KINDS[name]
+            if start - now > reminder.min_lead:
+                due_times[kind] = max(start - reminder.lead, now)
+
+        return due_times
+
+    @staticmethod
+    def vaccination_due_times(record: VaccinationRecord, now: datetime) -> Dict[str, datetime]:
+        """
+        Alert due times for a vaccination record
+
+        Thresholds already passed (e.g. a record saved 10 days before
+        expiry) are caught up with one alert due now, for the most urgent
+        of them; an expired record gets none.
+
+        Returns:
+            Due time (naive UTC) by kind
+        """
+        if record.deleted_at is not None or record.expiry_date < now.date():
+            return {}
+
+        due_times, passed = {}, []
+        for kind, days in VACCINATION_KINDS.items():
+            due_at = datetime.combine(record.expiry_date - timedelta(days=days), VACCINATION_ALERT_TIME)
+            if due_at > now:
+                due_times[kind] = due_at
+            else:
+                passed.append((days, kind))
+
+        if passed:
+            due_times[min(passed)[1]] = now
+
+        return due_times
+
+    @staticmethod
+    def reschedule(
+        connection,
+        subjects: Iterable,
+        kinds: Iterable[str],
+        due_times_for
+    ) -> None:
+        """
+        Replace the pending notifications of subjects with fresh due times
+
+        Pending rows of the given kinds are cancelled, then current due times
+        are upserted. A row already dispatched is re-armed only if its due
+        time moved (e.g. the appointment was rescheduled).
+
+        Args:
+            connection: Connection of the flushing session
+            subjects: Appointments or vaccination records
+            kinds: Notification kinds handled for these subjects
+            due_times_for: Function subject -> {kind: due_at}
+        """
+        subjects = list(subjects)
+        if not subjects:
+            return
+
+        table = ScheduledNotification.__table__
+        connection.execute(
+            table.update().where(
+                table.c.subject_id.in_([s.id for s in subjects]),
+                table.c.kind.in_(list(kinds)),
+                table.c.status == ScheduledNotificationStatus.PENDING
+            ).values(status=ScheduledNotificationStatus.CANCELLED)
+        )
+
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "tenant_id": subject.tenant_id,
+                "kind": kind,
+                "subject_id": subject.id,
+                "due_at": due_at,
+                "status": ScheduledNotificationStatus.PENDING
+            }
+            for subject in subjects
+            for kind, due_at in due_times_for(subject).items()
+        ]
+        if not rows:
+            return
+
+        stmt = insert(table).values(rows)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_scheduled_notifications_kind_subject",
+                set_={
+                    "due_at": stmt.excluded.due_at,
+                    "status": ScheduledNotificationStatus.PENDING,
+                    "dispatched_at": None
+                },
+                where=(table.c.status != ScheduledNotificationStatus.DISPATCHED) |
+                      (table.c.due_at != stmt.excluded.due_at)
+            )
+        )
+
+    @staticmethod
+    def dispatch_due(db: Session, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Dispatch every notification whose due time has passed
+
+        Due rows are claimed with FOR UPDATE SKIP LOCKED and marked dispatched
+        in the same transaction that queues their SMS, one batch at a time.
+
+        Args:
+            db: Database session
+            batch_size: Notifications claimed per transaction
+
+        Returns:
+            Summary of dispatched notifications
+        """
+        results = {
+            "claimed": 0,
+            "reminders_sent": 0,
+            "alerts_sent": 0
+        }
+
+        while True:
+            due = select(ScheduledNotification.id).where(
+                ScheduledNotification.status == ScheduledNotificationStatus.PENDING,
+                ScheduledNotification.due_at <= func.now()
+            ).order_by(
+                ScheduledNotification.due_at
+            ).limit(batch_size).with_for_update(skip_locked=True)
+
+            claimed = db.execute(
+                update(ScheduledNotification).where(
+                    ScheduledNotification.id.in_(due.scalar_subquery())
+                ).values(
+                    status=ScheduledNotificationStatus.DISPATCHED,
+                    dispatched_at=func.now()
+                ).returning(
+                    ScheduledNotification.kind,
+                    ScheduledNotification.subject_id
+                ).execution_options(synchronize_session=False)
+            ).all()
+
+            if not claimed:
+                db.commit()
+                break
+
+            reminders: Dict[str, List[UUID]] = {}
+            record_ids = set()
+            for r in claimed:
+                if r.kind in APPOINTMENT_KINDS:
+                    reminders.setdefault(APPOINTMENT_KINDS[r.kind], []).append(r.subject_id)
+                elif r.kind in VACCINATION_KINDS:
+                    record_ids.add(r.subject_id)
+
+            for kind, appointment_ids in reminders.items():
+                results["reminders_sent"] += ReminderService.dispatch_reminders(db, kind, appointment_ids)
+
+            # The alert sent is the most urgent threshold reached, whichever kind came due
+            results["alerts_sent"] += VaccinationMonitoringService.dispatch_alerts(db, list(record_ids))
+
+            db.commit()
+            results["claimed"] += len(claimed)
+
+        return results
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC (the repo's utcnow convention)"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# ==================== SCHEDULING ON SAVE ====================
+
+def _changed(obj, *attrs: str) -> bool:
+    """Whether any of the attributes changed in this flush"""
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+@event.listens_for(Session, "after_flush")
+def _schedule_notifications(session: Session, flush_context) -> None:
+    """Recompute due times for appointments and vaccination records saved in this flush"""
+    now = datetime.utcnow()
+
+    appointments, records = [], []
+    for obj in chain(session.new, session.dirty):
+        if isinstance(obj, Appointment):
+            if obj in session.new or _changed(obj, "scheduled_start", "status", "deleted_at"):
+                appointments.append(obj)
+        elif isinstance(obj, VaccinationRecord):
+            if obj in session.new or _changed(obj, "expiry_date", "deleted_at"):
+                records.append(obj)
+
+    # Hard-deleted subjects: cancel whatever is pending
+    deleted = [obj for obj in session.deleted if isinstance(obj, (Appointment, VaccinationRecord))]
+
+    if not (appointments or records or deleted):
+        return
+
+    connection = session.connection()
+    NotificationScheduleService.reschedule(
+        connection, appointments, APPOINTMENT_KINDS,
+        lambda a: NotificationScheduleService.appointment_due_times(a, now)
+    )
+    NotificationScheduleService.reschedule(
+        connection, records, VACCINATION_KINDS,
+        lambda v: NotificationScheduleService.vaccination_due_times(v, now)
+    )
+    NotificationScheduleService.reschedule(
+        connection, deleted, list(APPOINTMENT_KINDS) + list(VACCINATION_KINDS),
+        lambda _: {}
+    )
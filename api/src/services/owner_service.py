@@ -1,14 +1,17 @@
 """
 Owner service with business logic
 """
+from sqlalchemy import and_, false, func, true
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 import uuid
 
+from ..core.serialization import response_load_only
+from ..core.search import normalize_search_terms, normalized_search_text
 from ..models.owner import Owner
 from ..models.tenant import Tenant
-from ..schemas.owner import OwnerCreate, OwnerUpdate
+from ..schemas.owner import OwnerCreate, OwnerUpdate, OwnerResponse
 
 
 class OwnerService:
@@ -99,22 +102,69 @@ class OwnerService:
         is_active: bool = None
     ) -> List[Owner]:
         """List owners with filters and search"""
-        query = db.query(Owner).filter(Owner.tenant_id == tenant.id)
+        query = db.query(Owner).options(
+            response_load_only(Owner, OwnerResponse)
+        ).filter(Owner.tenant_id == tenant.id)
 
         if is_active is not None:
             query = query.filter(Owner.is_active == is_active)
 
         if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                (Owner.first_name.ilike(search_pattern)) |
-                (Owner.last_name.ilike(search_pattern)) |
-                (Owner.email.ilike(search_pattern)) |
-                (Owner.phone.ilike(search_pattern))
-            )
+            query = query.filter(OwnerService.search_condition(search))
 
         return query.order_by(Owner.last_name, Owner.first_name).offset(skip).limit(limit).all()
 
+    @staticmethod
+    def search_condition(search: str):
+        """Filter matching every normalized search token, served by the search_text trigram index"""
+        tokens = normalize_search_terms(search)
+        if not tokens:
+            # Nothing the index can narrow on, so match nothing rather than scan
+            return false()
+
+        return and_(true(), *[
+            Owner.search_text.contains(token, autoescape=True)
+            for token in tokens
+        ])
+
+    @staticmethod
+    def search_owners(
+        db: Session,
+        tenant: Tenant,
+        search: str,
+        limit: int = 10
+    ) -> List:
+        """
+        Typeahead search over name, email and phone
+
+        Only active, non-deleted owners are returned. Every token of at
+        least three characters must match; results are ranked by word
+        similarity so word-prefix matches ("joh" -> "John") come first.
+        """
+        tokens = normalize_search_terms(search)
+        if not tokens:
+            return []
+
+        rank = func.word_similarity(normalized_search_text(search), Owner.search_text)
+
+        return db.query(
+            Owner.id,
+            Owner.first_name,
+            Owner.last_name,
+            Owner.email,
+            Owner.phone
+        ).filter(
+            Owner.tenant_id == tenant.id,
+            Owner.is_active == True,
+            Owner.deleted_at.is_(None),
+            OwnerService.search_condition(search)
+        ).order_by(
+            rank.desc(),
+            Owner.last_name,
+            Owner.first_name,
+            Owner.id
+        ).limit(limit).all()
+
     @staticmethod
     def update_owner(
         db: Session,
@@ -7,10 +7,11 @@ from typing import List, Optional
 from uuid import UUID
 import uuid
 
+from ..core.serialization import response_load_only
 from ..models.payment import Payment, PaymentStatus, PaymentType
 from ..models.owner import Owner
 from ..models.tenant import Tenant
-from ..schemas.payment import PaymentCreate, PaymentUpdate
+from ..schemas.payment import PaymentCreate, PaymentUpdate, PaymentResponse
 from ..integrations.stripe_service import StripeService
 
 
@@ -77,7 +78,9 @@ class PaymentService:
         type: str = None
     ) -> List[Payment]:
         """List payments with filters"""
-        query = db.query(Payment).filter(Payment.tenant_id == tenant.id)
+        query = db.query(Payment).options(
+            response_load_only(Payment, PaymentResponse)
+        ).filter(Payment.tenant_id == tenant.id)
 
         if owner_id:
             query = query.filter(Payment.owner_id == owner_id)
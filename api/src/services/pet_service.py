@@ -6,10 +6,11 @@ from typing import List, Optional
 from uuid import UUID
 import uuid
 
+from ..core.serialization import response_load_only
 from ..models.pet import Pet
 from ..models.owner import Owner
 from ..models.tenant import Tenant
-from ..schemas.pet import PetCreate, PetUpdate
+from ..schemas.pet import PetCreate, PetUpdate, PetResponse
 
 
 class PetService:
@@ -68,7 +69,9 @@ class PetService:
         is_active: bool = None
     ) -> List[Pet]:
         """List pets with filters"""
-        query = db.query(Pet).filter(Pet.tenant_id == tenant.id)
+        query = db.query(Pet).options(
+            response_load_only(Pet, PetResponse)
+        ).filter(Pet.tenant_id == tenant.id)
 
         if owner_id:
             query = query.filter(Pet.owner_id == owner_id)
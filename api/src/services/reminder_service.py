@@ -0,0 +1,198 @@
+"""
+Reminder Service
+Idempotent appointment reminders across all tenants
+
+Reminders come due through scheduled_notifications (see
+NotificationScheduleService). Due appointments are claimed by stamping
+reminder_24h_sent_at / reminder_2h_sent_at in a single UPDATE ... RETURNING
+(FOR UPDATE SKIP LOCKED, so concurrent dispatchers split the work), joined
+with owners, tenants, services and pets to render messages, and written to
+the SMS outbox in the same transaction. A reminder is therefore queued
+exactly once per appointment. Rescheduling an appointment clears its stamps
+so the new time is reminded.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import any_, event, func, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.base import NEVER_SET, NO_VALUE
+
+from ..integrations.notification_queue import NotificationQueue
+from ..integrations.twilio_service import TwilioService
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.owner import Owner
+from ..models.pet import Pet
+from ..models.service import Service
+from ..models.tenant import Tenant
+
+
+@dataclass(frozen=True)
+class ReminderKind:
+    """A reminder sent `lead` before the appointment"""
+    name: str
+    template: str
+    lead: timedelta
+    min_lead: timedelta  # Too close to the appointment for this reminder
+    sent_at_column: str
+
+
+REMINDER_KINDS = {
+    "24h": ReminderKind(
+        name="24h",
+        template="appointment_reminder_24h",
+        lead=timedelta(hours=24),
+        min_lead=timedelta(hours=12),
+        sent_at_column="reminder_24h_sent_at"
+    ),
+    "2h": ReminderKind(
+        name="2h",
+        template="appointment_reminder_2h",
+        lead=timedelta(hours=2),
+        min_lead=timedelta(0),
+        sent_at_column="reminder_2h_sent_at"
+    ),
+}
+
+
+def reminder_dedupe_key(kind: str, appointment_id: UUID, scheduled_start: datetime) -> str:
+    """Outbox dedupe key; includes the start time so a rescheduled appointment is reminded again"""
+    return f"reminder_{kind}:{appointment_id}:{scheduled_start:%Y%m%d%H%M}"
+
+
+class ReminderService:
+    """Service for appointment reminders"""
+
+    @staticmethod
+    def dispatch_reminders(
+        db: Session,
+        kind: str,
+        appointment_ids: List[UUID]
+    ) -> int:
+        """
+        Claim and queue reminders for specific appointments
+
+        Used by the notification dispatcher once a reminder's due time has
+        passed, so the lead window is not checked again. Appointments that
+        are no longer eligible (cancelled, already reminded, starting within
+        min_lead, owner opted out, tenant inactive) are skipped. The caller
+        commits.
+
+        Args:
+            db: Database session
+            kind: "24h" or "2h"
+            appointment_ids: Appointments whose reminder is due
+
+        Returns:
+            Number of messages queued
+
+        Raises:
+            ValueError: If the reminder kind is unknown
+        """
+        reminder = REMINDER_KINDS.get(kind)
+        if not reminder:
+            raise ValueError(f"Unknown reminder kind '{kind}'")
+        if not appointment_ids:
+            return 0
+
+        now = datetime.utcnow()
+        sent_at = getattr(Appointment, reminder.sent_at_column)
+
+        due = select(Appointment.id).join(
+            Owner, Owner.id == Appointment.owner_id
+        ).join(
+            Tenant, Tenant.id == Appointment.tenant_id
+        ).where(
+            Appointment.id.in_(appointment_ids),
+            sent_at.is_(None),
+            Appointment.scheduled_start > now + reminder.min_lead,
+            Appointment.status.in_([AppointmentStatus.CONFIRMED, AppointmentStatus.PENDING]),
+            Appointment.deleted_at.is_(None),
+            Owner.sms_opted_in == True,
+            Tenant.is_active == True,
+            Tenant.deleted_at.is_(None)
+        ).with_for_update(of=Appointment, skip_locked=True)
+
+        claimed = update(Appointment).where(
+            Appointment.id.in_(due.scalar_subquery())
+        ).values(
+            {sent_at: func.now()}
+        ).returning(
+            Appointment.id,
+            Appointment.tenant_id,
+            Appointment.owner_id,
+            Appointment.service_id,
+            Appointment.pet_ids,
+            Appointment.scheduled_start
+        ).cte("claimed")
+
+        pet_names = select(
+            func.string_agg(Pet.name, ", ")
+        ).where(
+            Pet.id == any_(claimed.c.pet_ids)
+        ).scalar_subquery()
+
+        rows = db.execute(
+            select(
+                claimed.c.id,
+                claimed.c.tenant_id,
+                claimed.c.scheduled_start,
+                Owner.phone,
+                Tenant.business_name,
+                Tenant.address_line1,
+                Tenant.city,
+                Tenant.state,
+                Service.name.label("service_name"),
+                pet_names.label("pet_names")
+            ).join(
+                Owner, Owner.id == claimed.c.owner_id
+            ).join(
+                Tenant, Tenant.id == claimed.c.tenant_id
+            ).outerjoin(
+                Service, Service.id == claimed.c.service_id
+            )
+        ).all()
+
+        if not rows:
+            return 0
+
+        return NotificationQueue.enqueue_sms_batch(db, [
+            {
+                "tenant_id": r.tenant_id,
+                "to_phone": r.phone,
+                "message": ReminderService._render(reminder, r),
+                "dedupe_key": reminder_dedupe_key(reminder.name, r.id, r.scheduled_start)
+            }
+            for r in rows
+        ])
+
+    @staticmethod
+    def _render(reminder: ReminderKind, row) -> str:
+        """Render a reminder message from a claimed row"""
+        return TwilioService.render_template(
+            reminder.template,
+            {
+                "pet_names": row.pet_names or "your pet",
+                "time": row.scheduled_start.strftime("%I:%M %p"),
+                "business_name": row.business_name,
+                "service_name": row.service_name or "service",
+                "address": (
+                    f"{row.address_line1}, {row.city}, {row.state}"
+                    if row.address_line1 else row.business_name
+                )
+            }
+        )
+
+
+# ==================== RESCHEDULING ====================
+
+@event.listens_for(Appointment.scheduled_start, "set", active_history=True)
+def _reset_reminders_on_reschedule(target: Appointment, value, oldvalue, initiator) -> None:
+    """Clear reminder stamps when an appointment moves"""
+    if oldvalue in (NO_VALUE, NEVER_SET) or oldvalue == value:
+        return
+
+    target.reminder_24h_sent_at = None
+    target.reminder_2h_sent_at = None
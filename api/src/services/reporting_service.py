@@ -9,10 +9,10 @@ Features:
 - Staff performance metrics
 - Export functionality (CSV, PDF, Excel)
 """
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, distinct, extract
 from uuid import UUID
 from decimal import Decimal
 
@@ -22,6 +22,7 @@ from ..models.owner import Owner
 from ..models.staff import Staff
 from ..models.service import Service
 from ..models.tenant import Tenant
+from .customer_value_service import CustomerValueService
 
 
 class ReportingService:
@@ -246,12 +247,9 @@ class ReportingService:
 
         Returns total revenue from customer
         """
-        total = db.query(func.sum(Payment.amount)).filter(
-            Payment.owner_id == owner_id,
-            Payment.status.in_([PaymentStatus.SUCCEEDED, PaymentStatus.COMPLETED])
-        ).scalar()
+        total = CustomerValueService.get_lifetime_revenue(db, owner_id)
 
-        return Decimal(total or 0) / 100  # Convert cents to dollars
+        return Decimal(total) / 100  # Convert cents to dollars
 
     @staticmethod
     def get_top_customers(
@@ -264,36 +262,24 @@ class ReportingService:
 
         Returns list of top customers
         """
-        results = db.query(
-            Owner.id,
-            Owner.first_name,
-            Owner.last_name,
-            Owner.email,
-            func.sum(Payment.amount).label('total_spent'),
-            func.count(Appointment.id).label('appointment_count')
-        ).join(
-            Appointment, Appointment.owner_id == Owner.id
-        ).join(
-            Payment, Payment.owner_id == Owner.id
-        ).filter(
-            Owner.tenant_id == tenant_id,
-            Payment.status.in_([PaymentStatus.SUCCEEDED, PaymentStatus.COMPLETED])
-        ).group_by(
-            Owner.id, Owner.first_name, Owner.last_name, Owner.email
-        ).order_by(
-            func.sum(Payment.amount).desc()
-        ).limit(limit).all()
+        customers, _ = CustomerValueService.list_customers_by_value(
+            db=db,
+            tenant_id=tenant_id,
+            limit=limit,
+            min_revenue=1
+        )
 
         return [
             {
-                "owner_id": str(r.id),
-                "name": f"{r.first_name} {r.last_name}",
-                "email": r.email,
-                "total_spent": r.total_spent or 0,
-                "appointment_count": r.appointment_count,
-                "average_transaction": (r.total_spent // r.appointment_count) if r.appointment_count > 0 else 0
+                "owner_id": c["owner_id"],
+                "name": c["name"],
+                "email": c["email"],
+                "total_spent": c["lifetime_revenue"],
+                "appointment_count": c["appointment_count"],
+                "last_visit_at": c["last_visit_at"],
+                "average_transaction": (c["lifetime_revenue"] // c["appointment_count"]) if c["appointment_count"] > 0 else 0
             }
-            for r in results
+            for c in customers
         ]
 
     @staticmethod
@@ -306,36 +292,185 @@ class ReportingService:
         """
         Calculate customer retention metrics
 
+        All counts come from one query over a per-owner visit summary CTE.
+        Visits are non-cancelled appointments up to the end of the period.
+
+        - new: signed up during the period
+        - repeat: more than one visit
+        - active: visited during the period
+        - retained: visited before the period and again during it
+        - churned: visited before the period but not during it
+
         Returns retention statistics
         """
-        # New customers in period
-        new_customers = db.query(Owner).filter(
+        period_start = datetime.combine(start_date, time.min)
+        period_end = datetime.combine(end_date + timedelta(days=1), time.min)
+
+        in_period = Appointment.scheduled_start >= period_start
+        before_period = Appointment.scheduled_start < period_start
+
+        owner_visits = db.query(
+            Owner.id.label("owner_id"),
+            Owner.created_at.label("created_at"),
+            func.count(Appointment.id).label("total_visits"),
+            func.count(Appointment.id).filter(in_period).label("period_visits"),
+            func.count(Appointment.id).filter(before_period).label("prior_visits")
+        ).outerjoin(
+            Appointment, and_(
+                Appointment.owner_id == Owner.id,
+                Appointment.deleted_at.is_(None),
+                Appointment.status != AppointmentStatus.CANCELLED,
+                Appointment.scheduled_start < period_end
+            )
+        ).filter(
             Owner.tenant_id == tenant_id,
-            func.date(Owner.created_at) >= start_date,
-            func.date(Owner.created_at) <= end_date
-        ).count()
+            Owner.deleted_at.is_(None)
+        ).group_by(Owner.id, Owner.created_at).cte("owner_visits")
 
-        # Repeat customers (> 1 appointment)
-        repeat_customers = db.query(Owner.id).join(
-            Appointment
+        visited_before = owner_visits.c.prior_visits > 0
+        visited_during = owner_visits.c.period_visits > 0
+
+        r = db.query(
+            func.count().label("total_customers"),
+            func.count().filter(and_(
+                owner_visits.c.created_at >= period_start,
+                owner_visits.c.created_at < period_end
+            )).label("new_customers"),
+            func.count().filter(owner_visits.c.total_visits > 1).label("repeat_customers"),
+            func.count().filter(visited_during).label("active_customers"),
+            func.count().filter(and_(visited_before, visited_during)).label("retained_customers"),
+            func.count().filter(and_(visited_before, ~visited_during)).label("churned_customers")
+        ).select_from(owner_visits).one()
+
+        returning_base = r.retained_customers + r.churned_customers
+
+        return {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "new_customers": r.new_customers,
+            "repeat_customers": r.repeat_customers,
+            "active_customers": r.active_customers,
+            "retained_customers": r.retained_customers,
+            "churned_customers": r.churned_customers,
+            "total_customers": r.total_customers,
+            "repeat_rate": round((r.repeat_customers / r.total_customers * 100), 2) if r.total_customers > 0 else 0,
+            "retention_rate": round((r.retained_customers / returning_base * 100), 2) if returning_base > 0 else 0,
+            "churn_rate": round((r.churned_customers / returning_base * 100), 2) if returning_base > 0 else 0
+        }
+
+    @staticmethod
+    def get_cohort_retention_report(
+        db: Session,
+        tenant_id: UUID,
+        start_date: date,
+        end_date: date,
+        months: int = 12
+    ) -> Dict:
+        """
+        Get cohort retention by signup month
+
+        Customers are grouped by the month they signed up. For each cohort,
+        reports how many customers visited in each following month
+        (month 0 = signup month).
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            start_date: First signup date included in cohorts
+            end_date: Last signup date included in cohorts
+            months: Number of months to track each cohort
+
+        Returns:
+            Cohort table dictionary
+        """
+        signup_start = datetime.combine(start_date, time.min)
+        signup_end = datetime.combine(end_date + timedelta(days=1), time.min)
+
+        cohort_month = func.date_trunc("month", Owner.created_at)
+        cohorts = db.query(
+            Owner.id.label("owner_id"),
+            cohort_month.label("cohort_month")
         ).filter(
             Owner.tenant_id == tenant_id,
-            Appointment.deleted_at.is_(None)
-        ).group_by(Owner.id).having(
-            func.count(Appointment.id) > 1
-        ).count()
+            Owner.deleted_at.is_(None),
+            Owner.created_at >= signup_start,
+            Owner.created_at < signup_end
+        ).cte("cohorts")
+
+        cohort_sizes = db.query(
+            cohorts.c.cohort_month,
+            func.count().label("customers")
+        ).group_by(cohorts.c.cohort_month).cte("cohort_sizes")
+
+        activity_month = func.date_trunc("month", Appointment.scheduled_start)
+        month_offset = (
+            (extract("year", activity_month) - extract("year", cohorts.c.cohort_month)) * 12 +
+            (extract("month", activity_month) - extract("month", cohorts.c.cohort_month))
+        ).label("month_offset")
+
+        cohort_visits = db.query(
+            cohorts.c.cohort_month,
+            cohorts.c.owner_id,
+            month_offset
+        ).join(
+            Appointment, Appointment.owner_id == cohorts.c.owner_id
+        ).filter(
+            Appointment.deleted_at.is_(None),
+            Appointment.status != AppointmentStatus.CANCELLED,
+            Appointment.scheduled_start >= cohorts.c.cohort_month
+        ).cte("cohort_visits")
+
+        activity = db.query(
+            cohort_visits.c.cohort_month,
+            cohort_visits.c.month_offset,
+            func.count(distinct(cohort_visits.c.owner_id)).label("active_customers")
+        ).filter(
+            cohort_visits.c.month_offset < months
+        ).group_by(
+            cohort_visits.c.cohort_month, cohort_visits.c.month_offset
+        ).cte("activity")
 
-        # Total customers
-        total_customers = db.query(Owner).filter(
-            Owner.tenant_id == tenant_id,
-            Owner.deleted_at.is_(None)
-        ).count()
+        results = db.query(
+            cohort_sizes.c.cohort_month,
+            cohort_sizes.c.customers,
+            activity.c.month_offset,
+            activity.c.active_customers
+        ).outerjoin(
+            activity, activity.c.cohort_month == cohort_sizes.c.cohort_month
+        ).order_by(
+            cohort_sizes.c.cohort_month, activity.c.month_offset
+        ).all()
+
+        # Pivot rows into one dense retention curve per cohort
+        sizes = {}
+        active = {}
+        for r in results:
+            sizes[r.cohort_month] = r.customers
+            if r.month_offset is not None:
+                active[(r.cohort_month, int(r.month_offset))] = r.active_customers
+
+        today = date.today()
+        cohort_rows = []
+        for month, size in sizes.items():
+            elapsed = (today.year - month.year) * 12 + (today.month - month.month)
+            cohort_rows.append({
+                "cohort": month.strftime("%Y-%m"),
+                "customers": size,
+                "retention": [
+                    {
+                        "month": offset,
+                        "active_customers": active.get((month, offset), 0),
+                        "retention_rate": round((active.get((month, offset), 0) / size * 100), 2)
+                    }
+                    for offset in range(min(months, elapsed + 1))
+                ]
+            })
 
         return {
-            "new_customers": new_customers,
-            "repeat_customers": repeat_customers,
-            "total_customers": total_customers,
-            "repeat_rate": round((repeat_customers / total_customers * 100), 2) if total_customers > 0 else 0
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "months": months,
+            "cohorts": cohort_rows
         }
 
     # ==================== STAFF REPORTS ====================
@@ -381,6 +516,110 @@ class ReportingService:
             "average_revenue_per_appointment": revenue // total if total > 0 else 0
         }
 
+    @staticmethod
+    def get_team_performance(
+        db: Session,
+        tenant_id: UUID,
+        start_date: date,
+        end_date: date
+    ) -> List[Dict]:
+        """
+        Get performance metrics for every staff member of a tenant
+
+        Appointment and revenue totals are each grouped by staff in their own
+        subquery and joined to staff in a single query.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            start_date: Report start date
+            end_date: Report end date
+
+        Returns:
+            List of per-staff performance dictionaries, highest revenue first
+        """
+        period_start = datetime.combine(start_date, time.min)
+        period_end = datetime.combine(end_date + timedelta(days=1), time.min)
+
+        in_period = and_(
+            Appointment.tenant_id == tenant_id,
+            Appointment.scheduled_start >= period_start,
+            Appointment.scheduled_start < period_end,
+            Appointment.deleted_at.is_(None)
+        )
+
+        booked_minutes = func.sum(
+            extract("epoch", Appointment.scheduled_end - Appointment.scheduled_start) / 60
+        ).filter(Appointment.status != AppointmentStatus.CANCELLED)
+
+        appointment_totals = db.query(
+            Appointment.staff_id.label("staff_id"),
+            func.count(Appointment.id).label("total_appointments"),
+            func.count(Appointment.id).filter(
+                Appointment.status == AppointmentStatus.COMPLETED
+            ).label("completed_appointments"),
+            func.count(Appointment.id).filter(
+                Appointment.status == AppointmentStatus.NO_SHOW
+            ).label("no_shows"),
+            booked_minutes.label("booked_minutes")
+        ).filter(in_period).group_by(Appointment.staff_id).subquery()
+
+        revenue_totals = db.query(
+            Appointment.staff_id.label("staff_id"),
+            func.sum(Payment.amount).label("total_revenue")
+        ).join(
+            Payment, Payment.appointment_id == Appointment.id
+        ).filter(
+            in_period,
+            Payment.status.in_([PaymentStatus.SUCCEEDED, PaymentStatus.COMPLETED])
+        ).group_by(Appointment.staff_id).subquery()
+
+        results = db.query(
+            Staff.id,
+            Staff.first_name,
+            Staff.last_name,
+            Staff.schedule,
+            func.coalesce(appointment_totals.c.total_appointments, 0).label("total_appointments"),
+            func.coalesce(appointment_totals.c.completed_appointments, 0).label("completed_appointments"),
+            func.coalesce(appointment_totals.c.no_shows, 0).label("no_shows"),
+            func.coalesce(appointment_totals.c.booked_minutes, 0).label("booked_minutes"),
+            func.coalesce(revenue_totals.c.total_revenue, 0).label("total_revenue")
+        ).outerjoin(
+            appointment_totals, appointment_totals.c.staff_id == Staff.id
+        ).outerjoin(
+            revenue_totals, revenue_totals.c.staff_id == Staff.id
+        ).filter(
+            Staff.tenant_id == tenant_id,
+            Staff.deleted_at.is_(None)
+        ).order_by(
+            func.coalesce(revenue_totals.c.total_revenue, 0).desc(),
+            Staff.last_name,
+            Staff.first_name
+        ).all()
+
+        team = []
+        for r in results:
+            total = r.total_appointments
+            booked = int(r.booked_minutes)
+            scheduled = ReportingService._get_scheduled_minutes(r.schedule, start_date, end_date)
+
+            team.append({
+                "staff_id": str(r.id),
+                "name": f"{r.first_name} {r.last_name}",
+                "total_appointments": total,
+                "completed_appointments": r.completed_appointments,
+                "completion_rate": round((r.completed_appointments / total * 100), 2) if total > 0 else 0,
+                "no_shows": r.no_shows,
+                "no_show_rate": round((r.no_shows / total * 100), 2) if total > 0 else 0,
+                "total_revenue": r.total_revenue,
+                "average_ticket": r.total_revenue // r.completed_appointments if r.completed_appointments > 0 else 0,
+                "booked_minutes": booked,
+                "scheduled_minutes": scheduled,
+                "utilization_rate": round((booked / scheduled * 100), 2) if scheduled > 0 else 0
+            })
+
+        return team
+
     # ==================== HELPER METHODS ====================
 
     @staticmethod
@@ -394,3 +633,44 @@ class ReportingService:
             return dt.strftime("%Y-%m")
         else:
             return dt.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _get_scheduled_minutes(schedule: Optional[dict], start_date: date, end_date: date) -> int:
+        """
+        Get working minutes in a date range from a staff schedule
+
+        Uses the same format as SchedulingService._is_time_in_schedule;
+        break time is excluded.
+        """
+        if not schedule:
+            return 0
+
+        minutes_by_day = {}
+        for day_name, day_schedule in schedule.items():
+            if not day_schedule or day_schedule.get("available") is False:
+                continue
+            try:
+                minutes = ReportingService._minutes_between(day_schedule["start"], day_schedule["end"])
+            except (KeyError, ValueError):
+                continue
+            for break_period in day_schedule.get("breaks") or []:
+                try:
+                    minutes -= ReportingService._minutes_between(break_period["start"], break_period["end"])
+                except (KeyError, ValueError):
+                    continue
+            minutes_by_day[day_name.lower()] = max(minutes, 0)
+
+        total = 0
+        current = start_date
+        while current <= end_date:
+            total += minutes_by_day.get(current.strftime("%A").lower(), 0)
+            current += timedelta(days=1)
+
+        return total
+
+    @staticmethod
+    def _minutes_between(start: str, end: str) -> int:
+        """Minutes between two HH:MM times"""
+        start_time = datetime.strptime(start, "%H:%M")
+        end_time = datetime.strptime(end, "%H:%M")
+        return int((end_time - start_time).total_seconds() // 60)
@@ -7,16 +7,20 @@ Features:
 - Event-based score updates
 - Booking restriction enforcement
 - Score recovery over time
-- Audit trail of reputation events
+- Audit trail of reputation events (append-only reputation_events ledger)
 """
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, and_, bindparam, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
 from uuid import UUID
 import uuid
 
+from ..core.pagination import paginate_keyset
 from ..models.owner import Owner
 from ..models.appointment import Appointment, AppointmentStatus
+from ..models.reputation_event import ReputationEvent
 from ..models.tenant import Tenant
 
 
@@ -27,6 +31,8 @@ class ReputationEventType:
     ON_TIME_ARRIVAL = "on_time_arrival"
     COMPLETED_APPOINTMENT = "completed_appointment"
     EARLY_CANCELLATION = "early_cancellation"
+    RECOVERY = "recovery"  # Good behavior over time (points vary)
+    ADJUSTMENT = "adjustment"  # Manual or backfill correction (points vary)
 
     # Point values
     POINTS = {
@@ -37,6 +43,21 @@ class ReputationEventType:
         EARLY_CANCELLATION: 0,  # No penalty if cancelled early
     }
 
+    # Owner counter incremented by each event type
+    COUNTERS = {
+        NO_SHOW: "no_show_count",
+        LATE_CANCELLATION: "late_cancellation_count",
+        COMPLETED_APPOINTMENT: "completed_appointment_count",
+    }
+
+
+# Ledger rebuild state key per counted event type
+_REBUILD_COUNTERS = {
+    ReputationEventType.NO_SHOW: "new_no_shows",
+    ReputationEventType.LATE_CANCELLATION: "new_late_cancellations",
+    ReputationEventType.COMPLETED_APPOINTMENT: "new_completed",
+}
+
 
 class ReputationService:
     """Service for managing customer reputation scores"""
@@ -46,7 +67,26 @@ class ReputationService:
     MAX_SCORE = 100
     DEFAULT_SCORE = 100
     BOOKING_THRESHOLD = 30  # Minimum score to book
+    BOOKING_DENIED_MESSAGE = "This appointment can't be booked online. Please contact us to book."
     LATE_CANCELLATION_HOURS = 24  # Hours before appointment
+    RECOVERY_CHUNK_SIZE = 5000  # Owners per recovery UPDATE
+    REBUILD_CHUNK_SIZE = 1000  # Owners per ledger rebuild write
+
+    # Score ranges of the get_score_category labels
+    CATEGORY_RANGES = {
+        "excellent": (90, 100),
+        "good": (70, 89),
+        "fair": (50, 69),
+        "poor": (30, 49),
+        "restricted": (0, 29)
+    }
+
+    # Customer risk list sorts: column -> descending
+    CUSTOMER_RISK_SORTS = {
+        "no_show_count": True,
+        "no_show_rate": True,
+        "reputation_score": False
+    }
 
     @staticmethod
     def calculate_reputation_score(
@@ -114,34 +154,171 @@ class ReputationService:
         Returns:
             Tuple of (old_score, new_score)
         """
-        owner = db.query(Owner).filter(Owner.id == owner_id).first()
-        if not owner:
-            raise ValueError("Owner not found")
+        scores = ReputationService.record_event(db, owner_id, event_type, appointment_id, notes)
+        db.commit()
 
-        # Calculate old score
-        old_score = owner.reputation_score if hasattr(owner, 'reputation_score') else ReputationService.DEFAULT_SCORE
+        return scores
 
-        # Update counters
-        if event_type == ReputationEventType.NO_SHOW:
-            owner.no_show_count = (owner.no_show_count or 0) + 1
-        elif event_type == ReputationEventType.LATE_CANCELLATION:
-            owner.late_cancellation_count = (owner.late_cancellation_count or 0) + 1
-        elif event_type == ReputationEventType.COMPLETED_APPOINTMENT:
-            owner.completed_appointment_count = (owner.completed_appointment_count or 0) + 1
+    @staticmethod
+    def record_event(
+        db: Session,
+        owner_id: UUID,
+        event_type: str,
+        appointment_id: Optional[UUID] = None,
+        notes: Optional[str] = None,
+        points: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Append an event to the ledger and apply it to the owner (caller commits)
 
-        # Recalculate score
-        new_score = ReputationService.calculate_reputation_score(db, owner_id)
-        owner.reputation_score = new_score
-        owner.last_reputation_update = datetime.utcnow()
+        The owner's score and counter are updated in place with one UPDATE,
+        so the stored score is always current. An event already recorded for
+        the same appointment is ignored.
 
-        # Log the event (if reputation_events table exists)
-        # This would require a new model - ReputationEvent
-        # For now, we just update the score
+        Args:
+            db: Database session
+            owner_id: Owner ID
+            event_type: Type of event (from ReputationEventType)
+            appointment_id: Related appointment ID
+            notes: Optional notes
+            points: Points for variable events (default: ReputationEventType.POINTS)
 
-        db.commit()
+        Returns:
+            Tuple of (old_score, new_score)
+
+        Raises:
+            ValueError: If the owner does not exist or the points are unknown
+        """
+        if points is None:
+            if event_type not in ReputationEventType.POINTS:
+                raise ValueError(f"Points required for event type '{event_type}'")
+            points = ReputationEventType.POINTS[event_type]
+
+        inserted = db.execute(
+            insert(ReputationEvent).from_select(
+                ["id", "tenant_id", "owner_id", "appointment_id", "event_type", "points", "notes"],
+                select(
+                    literal(uuid.uuid4(), ReputationEvent.id.type),
+                    Owner.tenant_id,
+                    Owner.id,
+                    literal(appointment_id, ReputationEvent.appointment_id.type),
+                    literal(event_type),
+                    literal(points),
+                    literal(notes, ReputationEvent.notes.type)
+                ).where(Owner.id == owner_id)
+            ).on_conflict_do_nothing(
+                index_elements=["appointment_id", "event_type"]
+            ).returning(ReputationEvent.id)
+        ).first()
+
+        if inserted is None:
+            score = db.query(Owner.reputation_score).filter(Owner.id == owner_id).scalar()
+            if score is None:
+                raise ValueError("Owner not found")
+            return score, score  # Already recorded
+
+        previous = aliased(Owner)
+        values = {
+            "reputation_score": ReputationService._bounded(Owner.reputation_score + points),
+            "last_reputation_update": func.now()
+        }
+        counter = ReputationEventType.COUNTERS.get(event_type)
+        if counter:
+            values[counter] = getattr(Owner, counter) + 1
+
+        old_score, new_score = db.execute(
+            update(Owner).where(
+                Owner.id == owner_id,
+                previous.id == Owner.id
+            ).values(values).returning(
+                previous.reputation_score,
+                Owner.reputation_score
+            ).execution_options(synchronize_session=False)
+        ).one()
+
+        ReputationService._expire_owner(db, owner_id)
 
         return old_score, new_score
 
+    @staticmethod
+    def record_events_batch(db: Session, events: List[Dict]) -> int:
+        """
+        Append many events and apply them with one UPDATE per batch (caller commits)
+
+        Args:
+            db: Database session
+            events: Dicts with tenant_id, owner_id, event_type and optional
+                appointment_id, notes, points
+
+        Returns:
+            Number of events recorded (after deduplication)
+        """
+        if not events:
+            return 0
+
+        inserted = db.execute(
+            insert(ReputationEvent).values([
+                {
+                    "id": uuid.uuid4(),
+                    "tenant_id": e["tenant_id"],
+                    "owner_id": e["owner_id"],
+                    "appointment_id": e.get("appointment_id"),
+                    "event_type": e["event_type"],
+                    "points": e.get("points", ReputationEventType.POINTS.get(e["event_type"])),
+                    "notes": e.get("notes")
+                }
+                for e in events
+            ]).on_conflict_do_nothing(
+                index_elements=["appointment_id", "event_type"]
+            ).returning(
+                ReputationEvent.owner_id,
+                ReputationEvent.event_type,
+                ReputationEvent.points
+            )
+        ).all()
+
+        if not inserted:
+            return 0
+
+        totals: Dict[UUID, Dict[str, int]] = {}
+        for e in inserted:
+            owner_totals = totals.setdefault(e.owner_id, {
+                "points": 0, "no_show_count": 0, "late_cancellation_count": 0, "completed_appointment_count": 0
+            })
+            owner_totals["points"] += e.points
+            counter = ReputationEventType.COUNTERS.get(e.event_type)
+            if counter:
+                owner_totals[counter] += 1
+
+        # Owners are updated in id order, the lock order rebuild_from_ledger uses
+        table = Owner.__table__
+        db.execute(
+            table.update().where(
+                table.c.id == bindparam("owner_id")
+            ).values(
+                reputation_score=ReputationService._bounded(table.c.reputation_score + bindparam("points")),
+                no_show_count=table.c.no_show_count + bindparam("new_no_shows"),
+                late_cancellation_count=table.c.late_cancellation_count + bindparam("new_late_cancellations"),
+                completed_appointment_count=table.c.completed_appointment_count + bindparam("new_completed"),
+                last_reputation_update=func.now()
+            ),
+            [
+                {
+                    "owner_id": owner_id,
+                    "points": t["points"],
+                    "new_no_shows": t["no_show_count"],
+                    "new_late_cancellations": t["late_cancellation_count"],
+                    "new_completed": t["completed_appointment_count"]
+                }
+                for owner_id, t in sorted(totals.items())
+            ]
+        )
+
+        for owner_id in totals:
+            ReputationService._expire_owner(db, owner_id)
+
+        return len(inserted)
+
     @staticmethod
     def can_book_appointment(
         db: Session,
@@ -150,6 +327,9 @@ class ReputationService:
         """
         Check if customer can book appointments
 
+        Reads the stored gate columns (kept current by the ledger and by
+        no-show fee payments) by primary key.
+
         Args:
             db: Database session
             owner_id: Owner ID
@@ -157,20 +337,55 @@ class ReputationService:
         Returns:
             Tuple of (can_book, reason_if_not)
         """
-        owner = db.query(Owner).filter(Owner.id == owner_id).first()
-        if not owner:
+        owner = db.query(
+            Owner.reputation_score,
+            Owner.is_blocked,
+            Owner.unpaid_no_show_fees
+        ).filter(Owner.id == owner_id).first()
+        if owner is None:
             return False, "Customer not found"
 
-        # Check reputation score
-        score = ReputationService.calculate_reputation_score(db, owner_id)
+        return ReputationService.check_booking_eligibility(owner)
+
+    @staticmethod
+    def check_booking_eligibility(owner) -> Tuple[bool, Optional[str]]:
+        """
+        Check an already-loaded owner against the booking gate
+
+        Only reads precomputed columns, so callers holding the owner row
+        (e.g. AppointmentService.create_appointment) pay no extra queries.
+        The reason reveals the customer's score and balance; show it to
+        staff only (public callers get BOOKING_DENIED_MESSAGE).
+
+        Args:
+            owner: Owner (or row) with reputation_score, is_blocked and unpaid_no_show_fees
+
+        Returns:
+            Tuple of (can_book, reason_if_not)
+        """
+        if owner.is_blocked:
+            return False, "Customer is blocked from booking"
+
+        can_book, reason = ReputationService.check_booking_score(owner.reputation_score)
+        if not can_book:
+            return can_book, reason
+
+        if owner.unpaid_no_show_fees:
+            return False, f"Unpaid no-show fees (${owner.unpaid_no_show_fees / 100:.2f}) must be paid before booking"
+
+        return True, None
 
+    @staticmethod
+    def check_booking_score(score: int) -> Tuple[bool, Optional[str]]:
+        """
+        Check a reputation score against the booking threshold
+
+        Returns:
+            Tuple of (can_book, reason_if_not)
+        """
         if score < ReputationService.BOOKING_THRESHOLD:
             return False, f"Reputation score too low ({score}/100). Minimum required: {ReputationService.BOOKING_THRESHOLD}"
 
-        # Check for unpaid no-show fees
-        # (This would integrate with Payment model)
-        # For now, just check score
-
         return True, None
 
     @staticmethod
@@ -181,6 +396,9 @@ class ReputationService:
         """
         Get comprehensive reputation summary for a customer
 
+        The owner's stored score and counters and their appointment totals
+        come from a single query.
+
         Args:
             db: Database session
             owner_id: Owner ID
@@ -188,25 +406,31 @@ class ReputationService:
         Returns:
             Dictionary with reputation details
         """
-        owner = db.query(Owner).filter(Owner.id == owner_id).first()
-        if not owner:
-            return {"error": "Owner not found"}
-
-        score = ReputationService.calculate_reputation_score(db, owner_id)
-        can_book, reason = ReputationService.can_book_appointment(db, owner_id)
-
-        # Get total appointments
-        total_appointments = db.query(Appointment).filter(
+        appointments = select(
+            func.count().label("total"),
+            func.count().filter(Appointment.status == AppointmentStatus.COMPLETED).label("completed")
+        ).where(
             Appointment.owner_id == owner_id,
             Appointment.deleted_at.is_(None)
-        ).count()
+        ).subquery()
+
+        row = db.query(
+            Owner.reputation_score,
+            Owner.no_show_count,
+            Owner.late_cancellation_count,
+            Owner.completed_appointment_count,
+            Owner.last_reputation_update,
+            Owner.is_blocked,
+            Owner.unpaid_no_show_fees,
+            appointments.c.total,
+            appointments.c.completed
+        ).filter(Owner.id == owner_id).first()
+
+        if not row:
+            return {"error": "Owner not found"}
 
-        # Get completed appointments
-        completed_appointments = db.query(Appointment).filter(
-            Appointment.owner_id == owner_id,
-            Appointment.status == AppointmentStatus.COMPLETED,
-            Appointment.deleted_at.is_(None)
-        ).count()
+        score = row.reputation_score
+        can_book, reason = ReputationService.check_booking_eligibility(row)
 
         return {
             "owner_id": str(owner_id),
@@ -214,14 +438,154 @@ class ReputationService:
             "score_category": ReputationService.get_score_category(score),
             "can_book": can_book,
             "restriction_reason": reason,
-            "no_show_count": owner.no_show_count or 0,
-            "late_cancellation_count": owner.late_cancellation_count or 0,
-            "completed_appointment_count": owner.completed_appointment_count or 0,
-            "total_appointments": total_appointments,
-            "completion_rate": round((completed_appointments / total_appointments * 100), 2) if total_appointments > 0 else 0,
-            "last_update": owner.last_reputation_update.isoformat() if hasattr(owner, 'last_reputation_update') and owner.last_reputation_update else None
+            "no_show_count": row.no_show_count or 0,
+            "late_cancellation_count": row.late_cancellation_count or 0,
+            "completed_appointment_count": row.completed_appointment_count or 0,
+            "total_appointments": row.total,
+            "completion_rate": round((row.completed / row.total * 100), 2) if row.total > 0 else 0,
+            "last_update": row.last_reputation_update.isoformat() if row.last_reputation_update else None
         }
 
+    @staticmethod
+    def get_reputation_history(
+        db: Session,
+        owner_id: UUID,
+        limit: int = 50
+    ) -> List[Dict]:
+        """
+        Get a customer's most recent reputation events
+
+        Args:
+            db: Database session
+            owner_id: Owner ID
+            limit: Maximum number of events
+
+        Returns:
+            Events, newest first
+        """
+        events = db.query(ReputationEvent).filter(
+            ReputationEvent.owner_id == owner_id
+        ).order_by(ReputationEvent.sequence.desc()).limit(limit).all()
+
+        return [
+            {
+                "event_type": e.event_type,
+                "points": e.points,
+                "appointment_id": str(e.appointment_id) if e.appointment_id else None,
+                "notes": e.notes,
+                "created_at": e.created_at.isoformat()
+            }
+            for e in events
+        ]
+
+    @staticmethod
+    def rebuild_from_ledger(
+        db: Session,
+        tenant_id: Optional[UUID] = None,
+        chunk_size: int = REBUILD_CHUNK_SIZE
+    ) -> Dict[str, int]:
+        """
+        Recompute scores and counters by replaying the ledger
+
+        Owners are processed in chunks in id order. Each chunk's owner rows
+        are locked (SELECT ... FOR UPDATE) before its events are read, so an
+        event recorded concurrently either committed first and is replayed,
+        or its owner UPDATE waits and applies on top of the rebuilt row.
+        Events are folded per owner, applying each event's points within the
+        score bounds, and written back with one executemany UPDATE per chunk;
+        owners without events are reset to the defaults. Each chunk is
+        committed, releasing its locks.
+
+        Args:
+            db: Database session
+            tenant_id: Limit to one tenant (default: all tenants)
+            chunk_size: Owners locked and written per chunk
+
+        Returns:
+            Counts of owners rebuilt and events replayed
+        """
+        results = {"owners_rebuilt": 0, "owners_reset": 0, "events_replayed": 0}
+
+        owners = Owner.__table__
+        write = owners.update().where(
+            owners.c.id == bindparam("owner_id")
+        ).values(
+            reputation_score=bindparam("new_score"),
+            no_show_count=bindparam("new_no_shows"),
+            late_cancellation_count=bindparam("new_late_cancellations"),
+            completed_appointment_count=bindparam("new_completed"),
+            last_reputation_update=bindparam("new_last_update")
+        )
+
+        events = select(
+            ReputationEvent.owner_id,
+            ReputationEvent.event_type,
+            ReputationEvent.points,
+            ReputationEvent.created_at
+        ).order_by(ReputationEvent.owner_id, ReputationEvent.sequence)
+
+        last_owner_id = None
+        while True:
+            chunk = select(Owner.id).order_by(Owner.id).limit(chunk_size).with_for_update()
+            if tenant_id:
+                chunk = chunk.where(Owner.tenant_id == tenant_id)
+            if last_owner_id:
+                chunk = chunk.where(Owner.id > last_owner_id)
+
+            owner_ids = db.execute(chunk).scalars().all()
+            if not owner_ids:
+                break
+            last_owner_id = owner_ids[-1]
+
+            states = {
+                owner_id: {
+                    "owner_id": owner_id,
+                    "new_score": ReputationService.DEFAULT_SCORE,
+                    "new_no_shows": 0,
+                    "new_late_cancellations": 0,
+                    "new_completed": 0,
+                    "new_last_update": None
+                }
+                for owner_id in owner_ids
+            }
+            replayed = set()
+
+            stream = db.connection().execution_options(yield_per=chunk_size).execute(
+                events.where(ReputationEvent.owner_id.in_(owner_ids))
+            )
+            for event in stream:
+                state = states[event.owner_id]
+                state["new_score"] = max(
+                    ReputationService.MIN_SCORE,
+                    min(state["new_score"] + event.points, ReputationService.MAX_SCORE)
+                )
+                counter = _REBUILD_COUNTERS.get(event.event_type)
+                if counter:
+                    state[counter] += 1
+                state["new_last_update"] = event.created_at
+                replayed.add(event.owner_id)
+                results["events_replayed"] += 1
+
+            db.execute(write, list(states.values()))
+            results["owners_rebuilt"] += len(replayed)
+            results["owners_reset"] += len(owner_ids) - len(replayed)
+
+            db.commit()
+
+        return results
+
+    @staticmethod
+    def _bounded(score):
+        """Clamp a score expression to [MIN_SCORE, MAX_SCORE]"""
+        return func.greatest(ReputationService.MIN_SCORE, func.least(score, ReputationService.MAX_SCORE))
+
+    @staticmethod
+    def _expire_owner(db: Session, owner_id: UUID) -> None:
+        """Expire a loaded Owner after a Core UPDATE so it reloads the new values"""
+        owner = db.identity_map.get(db.identity_key(Owner, owner_id))
+        if owner is not None:
+            db.expire(owner)
+
     @staticmethod
     def get_score_category(score: int) -> str:
         """
@@ -265,40 +629,136 @@ class ReputationService:
         Returns:
             Summary of scores updated
         """
+        results = ReputationService.recover_scores(
+            db,
+            tenant_id=tenant_id,
+            days_since_last_event=days_since_last_event,
+            recovery_points=recovery_points
+        )
+
+        return {
+            "customers_checked": results["customers_checked"],
+            "scores_improved": results["scores_improved"]
+        }
+
+    @staticmethod
+    def recover_scores(
+        db: Session,
+        tenant_id: Optional[UUID] = None,
+        days_since_last_event: int = 90,
+        recovery_points: int = 5,
+        chunk_size: int = RECOVERY_CHUNK_SIZE,
+        start_after: Optional[UUID] = None
+    ) -> Dict:
+        """
+        Apply score recovery with set-based UPDATEs, chunk by chunk
+
+        Eligible owners (below the max score, last updated before the cutoff)
+        are walked in owner ID order, chunk_size at a time. Each chunk is one
+        UPDATE ... WHERE NOT EXISTS (recent no-show), logged to the ledger as
+        recovery events, and committed on its own. Recovered owners get a fresh last_reputation_update, so a rerun
+        after an interruption skips them; start_after resumes the walk past
+        an owner ID explicitly.
+
+        Args:
+            db: Database session
+            tenant_id: Limit to one tenant (default: all active tenants)
+            days_since_last_event: Days of good behavior required
+            recovery_points: Points to add for recovery
+            chunk_size: Owners examined per UPDATE
+            start_after: Owner ID to resume after
+
+        Returns:
+            Counts of customers checked and improved, overall and per tenant,
+            and the last owner ID processed
+        """
         cutoff_date = datetime.utcnow() - timedelta(days=days_since_last_event)
 
-        # Find owners with low scores and old last update
-        owners = db.query(Owner).filter(
-            Owner.tenant_id == tenant_id,
+        eligible = [
             Owner.reputation_score < ReputationService.MAX_SCORE,
             Owner.last_reputation_update < cutoff_date,
             Owner.deleted_at.is_(None)
-        ).all()
+        ]
+        if tenant_id:
+            eligible.append(Owner.tenant_id == tenant_id)
+        else:
+            eligible.append(Owner.tenant_id.in_(
+                select(Tenant.id).where(Tenant.is_active == True, Tenant.deleted_at.is_(None))
+            ))
+
+        recent_no_show = select(Appointment.id).where(
+            Appointment.owner_id == Owner.id,
+            Appointment.is_no_show == True,
+            Appointment.scheduled_start >= cutoff_date
+        ).exists()
+
+        results = {
+            "customers_checked": 0,
+            "scores_improved": 0,
+            "chunks": 0,
+            "last_owner_id": start_after,
+            "tenant_results": {}
+        }
 
-        updated_count = 0
-        for owner in owners:
-            # Only apply recovery if no recent negative events
-            recent_no_shows = db.query(Appointment).filter(
-                Appointment.owner_id == owner.id,
-                Appointment.is_no_show == True,
-                Appointment.scheduled_start >= cutoff_date
-            ).count()
-
-            if recent_no_shows == 0:
-                # Apply recovery
-                old_score = owner.reputation_score
-                new_score = min(old_score + recovery_points, ReputationService.MAX_SCORE)
-                owner.reputation_score = new_score
-                owner.last_reputation_update = datetime.utcnow()
-                updated_count += 1
-
-        if updated_count > 0:
+        last_id = start_after
+        while True:
+            chunk = select(Owner.id).where(*eligible)
+            if last_id is not None:
+                chunk = chunk.where(Owner.id > last_id)
+            chunk = chunk.order_by(Owner.id).limit(chunk_size).subquery()
+
+            # Last ID of the chunk and its size (Postgres has no max(uuid))
+            row = db.execute(
+                select(chunk.c.id, func.count().over()).order_by(chunk.c.id.desc()).limit(1)
+            ).first()
+            if row is None:
+                break
+            chunk_end, checked = row
+
+            in_chunk = [Owner.id <= chunk_end]
+            if last_id is not None:
+                in_chunk.append(Owner.id > last_id)
+
+            improved = db.execute(
+                update(Owner).where(
+                    *eligible,
+                    *in_chunk,
+                    ~recent_no_show
+                ).values(
+                    reputation_score=func.least(
+                        Owner.reputation_score + recovery_points, ReputationService.MAX_SCORE
+                    ),
+                    last_reputation_update=func.now()
+                ).returning(
+                    Owner.id,
+                    Owner.tenant_id
+                ).execution_options(synchronize_session=False)
+            ).all()
+
+            if improved:
+                db.execute(insert(ReputationEvent), [
+                    {
+                        "id": uuid.uuid4(),
+                        "tenant_id": r.tenant_id,
+                        "owner_id": r.id,
+                        "event_type": ReputationEventType.RECOVERY,
+                        "points": recovery_points,
+                        "notes": f"No no-shows in {days_since_last_event} days"
+                    }
+                    for r in improved
+                ])
             db.commit()
 
-        return {
-            "customers_checked": len(owners),
-            "scores_improved": updated_count
-        }
+            for r in improved:
+                key = str(r.tenant_id)
+                results["tenant_results"][key] = results["tenant_results"].get(key, 0) + 1
+
+            results["customers_checked"] += checked
+            results["scores_improved"] += len(improved)
+            results["chunks"] += 1
+            results["last_owner_id"] = last_id = chunk_end
+
+        return results
 
     @staticmethod
     def get_customers_by_reputation(
@@ -317,37 +777,132 @@ class ReputationService:
         Returns:
             List of customers in category
         """
-        # Define score ranges for categories
-        ranges = {
-            "excellent": (90, 100),
-            "good": (70, 89),
-            "fair": (50, 69),
-            "poor": (30, 49),
-            "restricted": (0, 29)
-        }
-
-        if category.lower() not in ranges:
+        if category.lower() not in ReputationService.CATEGORY_RANGES:
             return []
 
-        min_score, max_score = ranges[category.lower()]
+        customers = ReputationService.customer_risk_subquery(tenant_id, category=category)
+        rows = db.query(customers).order_by(customers.c.reputation_score, customers.c.id).all()
+
+        return [
+            {
+                "owner_id": str(r.id),
+                "name": f"{r.first_name} {r.last_name}",
+                "email": r.email,
+                "reputation_score": r.reputation_score,
+                "category": category.capitalize(),
+                "no_shows": r.no_show_count or 0,
+                "late_cancellations": r.late_cancellation_count or 0,
+                "total_appointments": r.total_appointments,
+                "no_show_rate": r.no_show_rate
+            }
+            for r in rows
+        ]
 
-        owners = db.query(Owner).filter(
+    @staticmethod
+    def list_customer_risk(
+        db: Session,
+        tenant_id: UUID,
+        category: Optional[str] = None,
+        min_no_shows: Optional[int] = None,
+        sort_by: str = "no_show_count",
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        List customers with appointment totals and no-show rate, paginated
+
+        Owner details, total and no-show appointment counts and the rate come
+        from one grouped query, sorted and paginated by keyset in the
+        database. Backs the high-risk and by-reputation customer reports.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            category: Only customers in this reputation category
+            min_no_shows: Only customers with at least this many no-shows
+            sort_by: One of CUSTOMER_RISK_SORTS
+            cursor: Cursor from the previous page
+            limit: Page size
+
+        Returns:
+            Tuple of (customers, next_cursor)
+
+        Raises:
+            ValueError: If the category, sort or cursor is invalid
+        """
+        if sort_by not in ReputationService.CUSTOMER_RISK_SORTS:
+            raise ValueError(f"Invalid sort: {sort_by}")
+        if category and category.lower() not in ReputationService.CATEGORY_RANGES:
+            raise ValueError(f"Invalid reputation category: {category}")
+
+        customers = ReputationService.customer_risk_subquery(
+            tenant_id, category=category, min_no_shows=min_no_shows
+        )
+
+        rows, next_cursor = paginate_keyset(
+            db.query(customers),
+            [customers.c[sort_by], customers.c.id],
+            cursor,
+            limit,
+            descending=ReputationService.CUSTOMER_RISK_SORTS[sort_by]
+        )
+
+        items = [
+            {
+                "owner_id": str(r.id),
+                "name": f"{r.first_name} {r.last_name}",
+                "email": r.email,
+                "phone": r.phone,
+                "reputation_score": r.reputation_score,
+                "category": ReputationService.get_score_category(r.reputation_score),
+                "no_show_count": r.no_show_count,
+                "late_cancellation_count": r.late_cancellation_count,
+                "total_appointments": r.total_appointments,
+                "no_show_appointments": r.no_show_appointments,
+                "no_show_rate": r.no_show_rate
+            }
+            for r in rows
+        ]
+
+        return items, next_cursor
+
+    @staticmethod
+    def customer_risk_subquery(
+        tenant_id: UUID,
+        category: Optional[str] = None,
+        min_no_shows: Optional[int] = None
+    ):
+        """Owners with their appointment totals and no-show rate (percentage), grouped in one pass"""
+        total = func.count(Appointment.id)
+        no_shows = func.count(Appointment.id).filter(Appointment.is_no_show == True)
+        rate = cast(func.round(100.0 * no_shows / func.nullif(total, 0), 2), Float)
+
+        query = select(
+            Owner.id,
+            Owner.first_name,
+            Owner.last_name,
+            Owner.email,
+            Owner.phone,
+            Owner.reputation_score,
+            Owner.no_show_count,
+            Owner.late_cancellation_count,
+            total.label("total_appointments"),
+            no_shows.label("no_show_appointments"),
+            func.coalesce(rate, 0.0).label("no_show_rate")
+        ).outerjoin(
+            Appointment, and_(
+                Appointment.owner_id == Owner.id,
+                Appointment.deleted_at.is_(None)
+            )
+        ).where(
             Owner.tenant_id == tenant_id,
-            Owner.reputation_score >= min_score,
-            Owner.reputation_score <= max_score,
             Owner.deleted_at.is_(None)
-        ).all()
+        ).group_by(Owner.id)
 
-        result = []
-        for owner in owners:
-            result.append({
-                "owner_id": str(owner.id),
-                "name": f"{owner.first_name} {owner.last_name}",
-                "email": owner.email,
-                "reputation_score": owner.reputation_score,
-                "category": category.capitalize(),
-                "no_shows": owner.no_show_count or 0,
-                "late_cancellations": owner.late_cancellation_count or 0
-            })
+        if category:
+            min_score, max_score = ReputationService.CATEGORY_RANGES[category.lower()]
+            query = query.where(Owner.reputation_score.between(min_score, max_score))
+        if min_no_shows is not None:
+            query = query.where(Owner.no_show_count >= min_no_shows)
 
-        return result
+        return query.subquery("customers")
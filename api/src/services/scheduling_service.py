@@ -9,12 +9,11 @@ from datetime import datetime, timedelta, time, date
 from uuid import UUID
 
 from ..models.appointment import Appointment, AppointmentStatus
-from ..models.staff import Staff
 from ..models.service import Service
-from ..models.resource import Resource
 from ..models.pet import Pet
 from ..models.vaccination_record import VaccinationRecord
 from ..models.tenant import Tenant
+from .catalog_service import CatalogService
 
 
 class SchedulingService:
@@ -32,11 +31,8 @@ class SchedulingService:
         """
         Check if staff member is available for the given time slot
         """
-        # Get staff member
-        staff = db.query(Staff).filter(
-            Staff.id == staff_id,
-            Staff.tenant_id == tenant.id
-        ).first()
+        # Get staff member (from the catalog snapshot)
+        staff = CatalogService.get_snapshot(db, tenant.id).staff_member(staff_id)
 
         if not staff or not staff.is_available:
             return False
@@ -99,11 +95,8 @@ class SchedulingService:
         """
         Check if resource (table, van, room) is available for the given time slot
         """
-        # Get resource
-        resource = db.query(Resource).filter(
-            Resource.id == resource_id,
-            Resource.tenant_id == tenant.id
-        ).first()
+        # Get resource (from the catalog snapshot)
+        resource = CatalogService.get_snapshot(db, tenant.id).resource(resource_id)
 
         if not resource or not resource.is_bookable:
             return False
@@ -164,11 +157,8 @@ class SchedulingService:
         Validate that all pets meet vaccination requirements for the service
         Returns (is_valid, error_message)
         """
-        # Get service
-        service = db.query(Service).filter(
-            Service.id == service_id,
-            Service.tenant_id == tenant.id
-        ).first()
+        # Get service (from the catalog snapshot)
+        service = CatalogService.get_snapshot(db, tenant.id).service(service_id)
 
         if not service:
             return False, "Service not found"
@@ -216,11 +206,9 @@ class SchedulingService:
         Get all available time slots for a given date and service
         Returns list of {start_time, end_time, staff_id}
         """
-        # Get service
-        service = db.query(Service).filter(
-            Service.id == service_id,
-            Service.tenant_id == tenant.id
-        ).first()
+        # Get service (from the catalog snapshot)
+        catalog = CatalogService.get_snapshot(db, tenant.id)
+        service = catalog.service(service_id)
 
         if not service:
             return []
@@ -257,11 +245,10 @@ class SchedulingService:
                     available_staff.append(staff_id)
             else:
                 # Find any available staff
-                all_staff = db.query(Staff).filter(
-                    Staff.tenant_id == tenant.id,
-                    Staff.is_active == True,
-                    Staff.is_available == True
-                ).all()
+                all_staff = [
+                    staff_member for staff_member in catalog.staff
+                    if staff_member.is_active and staff_member.is_available
+                ]
 
                 for staff_member in all_staff:
                     if SchedulingService.check_staff_availability(
@@ -299,11 +286,8 @@ class SchedulingService:
         Comprehensive booking validation
         Returns (is_valid, error_message)
         """
-        # 1. Validate service exists
-        service = db.query(Service).filter(
-            Service.id == service_id,
-            Service.tenant_id == tenant.id
-        ).first()
+        # 1. Validate service exists (from the catalog snapshot)
+        service = CatalogService.get_snapshot(db, tenant.id).service(service_id)
 
         if not service:
             return False, "Service not found"
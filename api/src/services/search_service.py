@@ -0,0 +1,321 @@
+"""
+Front Desk Search Service
+One-round-trip search over owners, pets and upcoming appointments
+
+Features:
+- Per-tenant search_entries index, trigram matched
+- Entries kept in sync by flush hooks on owners, pets, appointments and services
+- Grouped, ranked results with a per-group limit
+"""
+from itertools import chain
+from typing import Dict, Iterable, List
+from sqlalchemy import and_, any_, delete, event, false, func, inspect, literal, null, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from ..core.search import normalize_search_terms, normalized_search_text
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.owner import Owner
+from ..models.pet import Pet
+from ..models.search_entry import SearchEntry
+from ..models.service import Service
+
+# Entity types
+OWNER = "owner"
+PET = "pet"
+APPOINTMENT = "appointment"
+
+# Result group per entity type
+RESULT_GROUPS = {
+    OWNER: "owners",
+    PET: "pets",
+    APPOINTMENT: "appointments",
+}
+
+# Appointments are indexed while they can still happen
+UPCOMING_STATUSES = (AppointmentStatus.PENDING, AppointmentStatus.CONFIRMED)
+
+_ENTRY_COLUMNS = ["id", "tenant_id", "entity_type", "entity_id", "owner_id", "title", "subtitle", "starts_at", "search_text"]
+
+
+class SearchService:
+    """Service for the front desk search index"""
+
+    DEFAULT_LIMIT = 5  # Results per group
+
+    @staticmethod
+    def search(
+        db: Session,
+        tenant_id: UUID,
+        search: str,
+        limit: int = DEFAULT_LIMIT
+    ) -> Dict[str, List[Dict]]:
+        """
+        Search owners, pets and upcoming appointments in one query
+
+        Every normalized token must match an entry; input with no token of
+        at least three characters returns no results. Each group is ranked by
+        word similarity and cut to `limit` in the database with a window
+        function.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            search: Search text (name, email, phone, breed, microchip number...)
+            limit: Maximum results per group
+
+        Returns:
+            Dictionary of result lists keyed by group (owners, pets, appointments)
+        """
+        results = {group: [] for group in RESULT_GROUPS.values()}
+
+        tokens = normalize_search_terms(search)
+        if not tokens:
+            return results
+
+        rank = func.word_similarity(normalized_search_text(search), SearchEntry.search_text)
+
+        ranked = select(
+            SearchEntry.entity_type,
+            SearchEntry.entity_id,
+            SearchEntry.owner_id,
+            SearchEntry.title,
+            SearchEntry.subtitle,
+            SearchEntry.starts_at,
+            func.row_number().over(
+                partition_by=SearchEntry.entity_type,
+                order_by=(rank.desc(), SearchEntry.title, SearchEntry.entity_id)
+            ).label("position")
+        ).where(
+            SearchEntry.tenant_id == tenant_id,
+            *[SearchEntry.search_text.contains(token, autoescape=True) for token in tokens],
+            # Appointments drop out once they have started
+            or_(SearchEntry.starts_at.is_(None), SearchEntry.starts_at >= func.now())
+        ).subquery("ranked")
+
+        rows = db.execute(
+            select(ranked).where(
+                ranked.c.position <= limit
+            ).order_by(ranked.c.entity_type, ranked.c.position)
+        ).all()
+
+        for row in rows:
+            results[RESULT_GROUPS[row.entity_type]].append({
+                "id": str(row.entity_id),
+                "owner_id": str(row.owner_id),
+                "title": row.title,
+                "subtitle": row.subtitle,
+                "starts_at": row.starts_at.isoformat() if row.starts_at else None
+            })
+
+        return results
+
+    @staticmethod
+    def refresh_entries(
+        db,
+        owner_ids: Iterable[UUID] = (),
+        pet_ids: Iterable[UUID] = (),
+        appointment_ids: Iterable[UUID] = (),
+        service_ids: Iterable[UUID] = ()
+    ) -> None:
+        """
+        Rewrite the search entries affected by changed entities
+
+        Owner changes also refresh the owner's pets and upcoming appointments
+        (their entries show the owner's name); pet and service changes
+        refresh the upcoming appointments that include them. Entities that
+        are no longer searchable (deleted, inactive, cancelled) lose their
+        entry. Runs in the caller's transaction.
+
+        Args:
+            db: Database session or connection
+            owner_ids: Changed owners
+            pet_ids: Changed pets
+            appointment_ids: Changed appointments
+            service_ids: Renamed services
+        """
+        owner_ids, pet_ids = list(owner_ids), list(pet_ids)
+        appointment_ids, service_ids = list(appointment_ids), list(service_ids)
+
+        if owner_ids:
+            SearchService._refresh(db, OWNER, Owner, Owner.id.in_(owner_ids))
+
+        if owner_ids or pet_ids:
+            SearchService._refresh(db, PET, Pet, or_(
+                Pet.id.in_(pet_ids) if pet_ids else false(),
+                Pet.owner_id.in_(owner_ids) if owner_ids else false()
+            ))
+
+        cascaded = [
+            Appointment.owner_id.in_(owner_ids) if owner_ids else None,
+            Appointment.pet_ids.overlap(pet_ids) if pet_ids else None,
+            Appointment.service_id.in_(service_ids) if service_ids else None,
+        ]
+        cascaded = [condition for condition in cascaded if condition is not None]
+
+        if appointment_ids or cascaded:
+            SearchService._refresh(db, APPOINTMENT, Appointment, or_(
+                Appointment.id.in_(appointment_ids) if appointment_ids else false(),
+                and_(Appointment.scheduled_start >= func.now(), or_(*cascaded)) if cascaded else false()
+            ))
+
+    @staticmethod
+    def remove_entries(db, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        """Delete the search entries of hard-deleted entities"""
+        entity_ids = list(entity_ids)
+        if entity_ids:
+            db.execute(
+                delete(SearchEntry).where(
+                    SearchEntry.entity_type == entity_type,
+                    SearchEntry.entity_id.in_(entity_ids)
+                ).execution_options(synchronize_session=False)
+            )
+
+    # ==================== HELPER METHODS ====================
+
+    @staticmethod
+    def _refresh(db, entity_type: str, model, condition) -> None:
+        """Delete and re-insert entries for the entities matching condition"""
+        db.execute(
+            delete(SearchEntry).where(
+                SearchEntry.entity_type == entity_type,
+                SearchEntry.entity_id.in_(select(model.id).where(condition))
+            ).execution_options(synchronize_session=False)
+        )
+
+        stmt = insert(SearchEntry).from_select(
+            _ENTRY_COLUMNS,
+            SearchService._entries(entity_type).where(condition)
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_search_entries_entity",
+                set_={
+                    "owner_id": stmt.excluded.owner_id,
+                    "title": stmt.excluded.title,
+                    "subtitle": stmt.excluded.subtitle,
+                    "starts_at": stmt.excluded.starts_at,
+                    "search_text": stmt.excluded.search_text,
+                    "updated_at": func.now()
+                }
+            )
+        )
+
+    @staticmethod
+    def _entries(entity_type: str):
+        """SELECT producing search entry rows for searchable entities of a type"""
+        owner_name = Owner.first_name + " " + Owner.last_name
+
+        if entity_type == OWNER:
+            return select(
+                func.gen_random_uuid(),
+                Owner.tenant_id,
+                literal(OWNER),
+                Owner.id,
+                Owner.id,
+                owner_name,
+                Owner.phone,
+                null(),
+                Owner.search_text
+            ).where(
+                Owner.deleted_at.is_(None)
+            )
+
+        if entity_type == PET:
+            return select(
+                func.gen_random_uuid(),
+                Pet.tenant_id,
+                literal(PET),
+                Pet.id,
+                Pet.owner_id,
+                Pet.name,
+                func.concat_ws(" · ", func.coalesce(Pet.breed, Pet.species), owner_name),
+                null(),
+                func.lower(func.concat_ws(" ", Pet.name, Pet.breed, Pet.species, Pet.microchip_number))
+            ).join(
+                Owner, Owner.id == Pet.owner_id
+            ).where(
+                Pet.is_active == True,
+                Pet.deleted_at.is_(None)
+            )
+
+        pet_names = select(
+            func.string_agg(Pet.name, ", ")
+        ).where(
+            Pet.id == any_(Appointment.pet_ids)
+        ).correlate(Appointment).scalar_subquery()
+
+        return select(
+            func.gen_random_uuid(),
+            Appointment.tenant_id,
+            literal(APPOINTMENT),
+            Appointment.id,
+            Appointment.owner_id,
+            Service.name,
+            func.concat_ws(" · ", owner_name, pet_names),
+            Appointment.scheduled_start,
+            func.lower(func.concat_ws(" ", owner_name, pet_names, Service.name))
+        ).join(
+            Owner, Owner.id == Appointment.owner_id
+        ).join(
+            Service, Service.id == Appointment.service_id
+        ).where(
+            Appointment.status.in_(UPCOMING_STATUSES),
+            Appointment.deleted_at.is_(None)
+        )
+
+
+# ==================== INDEXING ON SAVE ====================
+
+# Attributes shown in or matched by each entity's entry
+_INDEXED_ATTRS = {
+    Owner: ("first_name", "last_name", "email", "phone", "deleted_at"),
+    Pet: ("name", "breed", "species", "microchip_number", "owner_id", "is_active", "deleted_at"),
+    Appointment: ("status", "scheduled_start", "owner_id", "pet_ids", "service_id", "deleted_at"),
+    Service: ("name",),
+}
+
+_REMOVED_TYPES = {
+    Owner: OWNER,
+    Pet: PET,
+    Appointment: APPOINTMENT,
+}
+
+
+def _changed(obj, attrs) -> bool:
+    """Whether any of the attributes changed in this flush"""
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+@event.listens_for(Session, "after_flush")
+def _index_search_entries(session: Session, flush_context) -> None:
+    """Refresh search entries for entities saved or deleted in this flush"""
+    changed = {model: set() for model in _INDEXED_ATTRS}
+    for obj in chain(session.new, session.dirty):
+        model = type(obj)
+        if model not in _INDEXED_ATTRS:
+            continue
+        if obj in session.new or _changed(obj, _INDEXED_ATTRS[model]):
+            changed[model].add(obj.id)
+
+    removed = {}
+    for obj in session.deleted:
+        if type(obj) in _REMOVED_TYPES:
+            removed.setdefault(_REMOVED_TYPES[type(obj)], set()).add(obj.id)
+
+    if not (any(changed.values()) or removed):
+        return
+
+    connection = session.connection()
+    for entity_type, entity_ids in removed.items():
+        SearchService.remove_entries(connection, entity_type, entity_ids)
+
+    SearchService.refresh_entries(
+        connection,
+        owner_ids=changed[Owner],
+        pet_ids=changed[Pet],
+        appointment_ids=changed[Appointment],
+        service_ids=changed[Service]
+    )
@@ -6,9 +6,10 @@ from typing import List, Optional
 from uuid import UUID
 import uuid
 
+from ..core.serialization import response_load_only
 from ..models.service import Service
 from ..models.tenant import Tenant
-from ..schemas.service import ServiceCreate, ServiceUpdate
+from ..schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse
 
 
 class ServiceService:
@@ -75,7 +76,9 @@ class ServiceService:
         is_bookable_online: bool = None
     ) -> List[Service]:
         """List services with filters"""
-        query = db.query(Service).filter(Service.tenant_id == tenant.id)
+        query = db.query(Service).options(
+            response_load_only(Service, ServiceResponse)
+        ).filter(Service.tenant_id == tenant.id)
 
         if category:
             query = query.filter(Service.category == category)
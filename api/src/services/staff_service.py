@@ -6,9 +6,10 @@ from typing import List, Optional
 from uuid import UUID
 import uuid
 
+from ..core.serialization import response_load_only
 from ..models.staff import Staff
 from ..models.tenant import Tenant
-from ..schemas.staff import StaffCreate, StaffUpdate
+from ..schemas.staff import StaffCreate, StaffUpdate, StaffResponse
 
 
 class StaffService:
@@ -67,7 +68,9 @@ class StaffService:
         can_groom: bool = None
     ) -> List[Staff]:
         """List staff members with filters"""
-        query = db.query(Staff).filter(Staff.tenant_id == tenant.id)
+        query = db.query(Staff).options(
+            response_load_only(Staff, StaffResponse)
+        ).filter(Staff.tenant_id == tenant.id)
 
         if is_active is not None:
             query = query.filter(Staff.is_active == is_active)
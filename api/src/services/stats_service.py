@@ -0,0 +1,117 @@
+"""
+Stats Service
+Dashboard statistics computed in SQL with a short-lived per-tenant cache
+
+Daily stats are polled by every open dashboard, so results are cached per
+tenant for STATS_CACHE_TTL_SECONDS and dropped as soon as a session commits
+changes to that tenant's appointments.
+"""
+from datetime import date, datetime, time, timedelta
+from itertools import chain
+from typing import Dict
+from uuid import UUID
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.service import Service
+
+daily_stats_cache = TTLCache(ttl_seconds=settings.STATS_CACHE_TTL_SECONDS)
+
+# Session.info key holding tenant IDs whose cached stats are stale
+_STALE_TENANTS_KEY = "stats_stale_tenants"
+
+
+class StatsService:
+    """Service for dashboard statistics"""
+
+    @staticmethod
+    def get_daily_stats(
+        db: Session,
+        tenant_id: UUID,
+        target_date: date
+    ) -> Dict:
+        """
+        Get appointment counts and completed revenue for a day
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            target_date: Day to report on
+
+        Returns:
+            Daily stats dictionary
+        """
+        cached = daily_stats_cache.get(tenant_id, target_date)
+        if cached is not None:
+            return cached
+
+        day_start = datetime.combine(target_date, time.min)
+        day_end = datetime.combine(target_date + timedelta(days=1), time.min)
+
+        completed = Appointment.status == AppointmentStatus.COMPLETED
+
+        r = db.query(
+            func.count(Appointment.id).label("total_appointments"),
+            func.count(Appointment.id).filter(completed).label("completed"),
+            func.count(Appointment.id).filter(
+                Appointment.status.in_([AppointmentStatus.PENDING, AppointmentStatus.CONFIRMED])
+            ).label("pending"),
+            func.count(Appointment.id).filter(
+                Appointment.status == AppointmentStatus.CANCELLED
+            ).label("cancelled"),
+            func.count(Appointment.id).filter(
+                Appointment.status == AppointmentStatus.NO_SHOW
+            ).label("no_shows"),
+            func.coalesce(func.sum(Service.price).filter(completed), 0).label("revenue")
+        ).outerjoin(
+            Service, Service.id == Appointment.service_id
+        ).filter(
+            Appointment.tenant_id == tenant_id,
+            Appointment.scheduled_start >= day_start,
+            Appointment.scheduled_start < day_end
+        ).one()
+
+        stats = {
+            "date": target_date.isoformat(),
+            "total_appointments": r.total_appointments,
+            "completed": r.completed,
+            "pending": r.pending,
+            "cancelled": r.cancelled,
+            "no_shows": r.no_shows,
+            "revenue": r.revenue
+        }
+
+        daily_stats_cache.set(tenant_id, target_date, stats)
+
+        return stats
+
+
+# ==================== CACHE INVALIDATION ====================
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_stats(session: Session, flush_context) -> None:
+    """Record tenants whose appointments were flushed"""
+    tenant_ids = {
+        obj.tenant_id
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, Appointment)
+    }
+    if tenant_ids:
+        session.info.setdefault(_STALE_TENANTS_KEY, set()).update(tenant_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_stats(session: Session) -> None:
+    """Drop cached stats for tenants whose appointments changed"""
+    for tenant_id in session.info.pop(_STALE_TENANTS_KEY, ()):
+        daily_stats_cache.invalidate(tenant_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_stats(session: Session) -> None:
+    """Forget stale tenants from a rolled-back transaction"""
+    session.info.pop(_STALE_TENANTS_KEY, None)
@@ -3,21 +3,24 @@ Vaccination Monitoring Service
 Sprint 4 - Automated vaccination expiry monitoring and alerts
 
 Features:
-- Daily scan for expiring vaccinations
-- Automated SMS alerts (30, 14, 7 days before expiry)
+- Automated SMS alerts (30, 14, 7 days before expiry), dispatched from
+  scheduled_notifications (see NotificationScheduleService)
 - Email alerts (optional)
 - Vaccination status updates
 """
 from datetime import datetime, timedelta, date
 from typing import List, Dict, Tuple, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm.base import NEVER_SET, NO_VALUE
+from sqlalchemy import and_, case, event, func, literal, or_, select, update
 from uuid import UUID
 
-from ..models.vaccination_record import VaccinationRecord
+from ..core.pagination import paginate_keyset
+from ..models.vaccination_record import VaccinationRecord, VaccinationStatus
 from ..models.pet import Pet
 from ..models.owner import Owner
 from ..models.tenant import Tenant
+from ..integrations.notification_queue import NotificationQueue
 from ..integrations.twilio_service import TwilioService
 
 
@@ -27,6 +30,9 @@ class VaccinationMonitoringService:
     # Alert thresholds (days before expiry)
     ALERT_THRESHOLDS = [30, 14, 7]
 
+    # Records expiring within this many days are EXPIRING_SOON
+    EXPIRING_SOON_DAYS = 30
+
     @staticmethod
     def get_expiring_vaccinations(
         db: Session,
@@ -104,77 +110,115 @@ class VaccinationMonitoringService:
             return False, str(e)
 
     @staticmethod
-    def run_daily_monitoring(db: Session, tenant_id: UUID) -> Dict[str, int]:
-        """
-        Run daily vaccination monitoring for a tenant
-
-        This should be called by a scheduler once per day
-
-        Args:
-            db: Database session
-            tenant_id: Tenant ID
-
-        Returns:
-            Dictionary with counts of alerts sent
-        """
-        results = {
-            "total_checked": 0,
-            "alerts_sent": 0,
-            "alerts_failed": 0
-        }
-
-        for days_ahead in VaccinationMonitoringService.ALERT_THRESHOLDS:
-            vaccinations = VaccinationMonitoringService.get_expiring_vaccinations(
-                db, tenant_id, days_ahead
-            )
-
-            results["total_checked"] += len(vaccinations)
-
-            for vaccination in vaccinations:
-                success, error = VaccinationMonitoringService.send_expiry_alert(
-                    db, vaccination, days_ahead
-                )
-
-                if success:
-                    results["alerts_sent"] += 1
-                else:
-                    results["alerts_failed"] += 1
-
-        return results
+    def threshold_for(days_until_expiry: int) -> Optional[int]:
+        """Smallest alert threshold a record expiring in N days has reached"""
+        if days_until_expiry < 0:
+            return None
+        reached = [d for d in VaccinationMonitoringService.ALERT_THRESHOLDS if days_until_expiry <= d]
+        return min(reached) if reached else None
 
     @staticmethod
-    def run_all_tenants_monitoring(db: Session) -> Dict[str, any]:
+    def dispatch_alerts(db: Session, record_ids: List[UUID]) -> int:
         """
-        Run vaccination monitoring for all active tenants
+        Claim and queue expiry alerts for specific records
 
-        This is the main entry point for the daily cron job
+        Used by the notification dispatcher once an alert's due time has
+        passed. A record is claimed when it expires within a threshold it
+        hasn't been alerted for (reminder_sent_30d/14d/7d); only the most
+        urgent threshold reached is sent, and the flags of every reached
+        threshold are set in the same UPDATE. Records already alerted for
+        their threshold are skipped; the flags are cleared again when the
+        record's expiry date changes. The caller commits.
 
         Returns:
-            Summary of monitoring results across all tenants
+            Number of messages queued
         """
-        tenants = db.query(Tenant).filter(
+        if not record_ids:
+            return 0
+
+        today = date.today()
+        within = {d: VaccinationRecord.expiry_date <= today + timedelta(days=d)
+                  for d in VaccinationMonitoringService.ALERT_THRESHOLDS}
+        flags = {d: getattr(VaccinationRecord, f"reminder_sent_{d}d")
+                 for d in VaccinationMonitoringService.ALERT_THRESHOLDS}
+
+        # Due: the most urgent threshold reached has not been alerted
+        thresholds = sorted(VaccinationMonitoringService.ALERT_THRESHOLDS)
+        due_conditions = []
+        for i, d in enumerate(thresholds):
+            condition = and_(within[d], flags[d] == False)
+            if i:
+                condition = and_(condition, ~within[thresholds[i - 1]])
+            due_conditions.append(condition)
+
+        due = select(VaccinationRecord.id).join(
+            Pet, Pet.id == VaccinationRecord.pet_id
+        ).join(
+            Owner, Owner.id == Pet.owner_id
+        ).join(
+            Tenant, Tenant.id == VaccinationRecord.tenant_id
+        ).where(
+            VaccinationRecord.id.in_(record_ids),
+            VaccinationRecord.expiry_date >= today,
+            VaccinationRecord.deleted_at.is_(None),
+            or_(*due_conditions),
+            Owner.sms_opted_in == True,
             Tenant.is_active == True,
             Tenant.deleted_at.is_(None)
-        ).all()
-
-        overall_results = {
-            "tenants_processed": 0,
-            "total_alerts_sent": 0,
-            "total_alerts_failed": 0,
-            "tenant_results": {}
-        }
-
-        for tenant in tenants:
-            tenant_results = VaccinationMonitoringService.run_daily_monitoring(
-                db, tenant.id
+        ).with_for_update(of=VaccinationRecord, skip_locked=True)
+
+        claimed = update(VaccinationRecord).where(
+            VaccinationRecord.id.in_(due.scalar_subquery())
+        ).values({
+            flags[d]: or_(flags[d], within[d]) for d in thresholds
+        }).returning(
+            VaccinationRecord.id,
+            VaccinationRecord.tenant_id,
+            VaccinationRecord.pet_id,
+            VaccinationRecord.type,
+            VaccinationRecord.expiry_date
+        ).cte("claimed")
+
+        rows = db.execute(
+            select(
+                claimed.c.id,
+                claimed.c.tenant_id,
+                claimed.c.type,
+                claimed.c.expiry_date,
+                Pet.name.label("pet_name"),
+                Owner.first_name,
+                Owner.phone
+            ).join(
+                Pet, Pet.id == claimed.c.pet_id
+            ).join(
+                Owner, Owner.id == Pet.owner_id
             )
+        ).all()
 
-            overall_results["tenants_processed"] += 1
-            overall_results["total_alerts_sent"] += tenant_results["alerts_sent"]
-            overall_results["total_alerts_failed"] += tenant_results["alerts_failed"]
-            overall_results["tenant_results"][str(tenant.id)] = tenant_results
-
-        return overall_results
+        if not rows:
+            return 0
+
+        messages = []
+        for r in rows:
+            days_left = (r.expiry_date - today).days
+            threshold = VaccinationMonitoringService.threshold_for(days_left)
+            messages.append({
+                "tenant_id": r.tenant_id,
+                "to_phone": r.phone,
+                "message": TwilioService.render_template(
+                    "vaccination_expiring",
+                    {
+                        "owner_name": r.first_name,
+                        "pet_name": r.pet_name,
+                        "vaccination_type": r.type.value,
+                        "days": days_left,
+                        "expiry_date": r.expiry_date.strftime("%B %d, %Y")
+                    }
+                ),
+                "dedupe_key": f"vaccination_{threshold}d:{r.id}:{r.expiry_date:%Y%m%d}"
+            })
+
+        return NotificationQueue.enqueue_sms_batch(db, messages)
 
     @staticmethod
     def get_expired_vaccinations(
@@ -202,44 +246,106 @@ class VaccinationMonitoringService:
         return vaccinations
 
     @staticmethod
-    def update_vaccination_statuses(db: Session, tenant_id: UUID) -> int:
+    def refresh_vaccination_statuses(
+        db: Session,
+        tenant_id: Optional[UUID] = None
+    ) -> Dict[str, int]:
         """
-        Update vaccination statuses based on expiry dates
+        Recompute vaccination statuses from expiry dates in bulk
+
+        Record statuses (current / expiring soon / expired) and each pet's
+        vaccination_status / vaccination_expires_at (from its latest-expiring
+        record) are set with one UPDATE each; only rows whose values change
+        are written.
 
         Args:
             db: Database session
-            tenant_id: Tenant ID
+            tenant_id: Limit to one tenant (default: all active tenants)
 
         Returns:
-            Number of vaccinations updated
+            Counts of records and pets updated
         """
         today = date.today()
-        updated_count = 0
+        expiring_cutoff = today + timedelta(days=VaccinationMonitoringService.EXPIRING_SOON_DAYS)
 
-        # Get all vaccinations
-        vaccinations = db.query(VaccinationRecord).filter(
-            VaccinationRecord.tenant_id == tenant_id,
+        if tenant_id:
+            in_scope = VaccinationRecord.tenant_id == tenant_id
+        else:
+            in_scope = VaccinationRecord.tenant_id.in_(
+                select(Tenant.id).where(Tenant.is_active == True, Tenant.deleted_at.is_(None))
+            )
+
+        def status_for(expiry_date, as_value=False):
+            """Status CASE over an expiry date column"""
+            def label(status):
+                if as_value:
+                    return literal(status.value)
+                return literal(status, VaccinationRecord.status.type)
+
+            return case(
+                (expiry_date < today, label(VaccinationStatus.EXPIRED)),
+                (expiry_date <= expiring_cutoff, label(VaccinationStatus.EXPIRING_SOON)),
+                else_=label(VaccinationStatus.CURRENT)
+            )
+
+        new_status = status_for(VaccinationRecord.expiry_date)
+        records_updated = db.execute(
+            update(VaccinationRecord).where(
+                in_scope,
+                VaccinationRecord.deleted_at.is_(None),
+                VaccinationRecord.status != new_status
+            ).values(
+                status=new_status
+            ).execution_options(synchronize_session=False)
+        ).rowcount
+
+        latest = select(
+            VaccinationRecord.pet_id,
+            VaccinationRecord.expiry_date
+        ).where(
+            in_scope,
             VaccinationRecord.deleted_at.is_(None)
-        ).all()
+        ).distinct(
+            VaccinationRecord.pet_id
+        ).order_by(
+            VaccinationRecord.pet_id,
+            VaccinationRecord.expiry_date.desc()
+        ).subquery()
+
+        pet_status = status_for(latest.c.expiry_date, as_value=True)
+        pets_updated = db.execute(
+            update(Pet).where(
+                Pet.id == latest.c.pet_id,
+                or_(
+                    Pet.vaccination_status.is_distinct_from(pet_status),
+                    Pet.vaccination_expires_at.is_distinct_from(latest.c.expiry_date)
+                )
+            ).values(
+                vaccination_status=pet_status,
+                vaccination_expires_at=latest.c.expiry_date
+            ).execution_options(synchronize_session=False)
+        ).rowcount
 
-        for vaccination in vaccinations:
-            old_status = vaccination.is_current
+        db.commit()
 
-            # Determine new status
-            if vaccination.expiry_date and vaccination.expiry_date < today:
-                new_status = False  # Expired
-            else:
-                new_status = True  # Current
+        return {
+            "records_updated": records_updated,
+            "pets_updated": pets_updated
+        }
 
-            # Update if changed
-            if old_status != new_status:
-                vaccination.is_current = new_status
-                updated_count += 1
+    @staticmethod
+    def update_vaccination_statuses(db: Session, tenant_id: UUID) -> int:
+        """
+        Update vaccination statuses based on expiry dates
 
-        if updated_count > 0:
-            db.commit()
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
 
-        return updated_count
+        Returns:
+            Number of vaccinations updated
+        """
+        return VaccinationMonitoringService.refresh_vaccination_statuses(db, tenant_id)["records_updated"]
 
     @staticmethod
     def get_pets_with_expiring_vaccinations(
@@ -258,35 +364,131 @@ class VaccinationMonitoringService:
         Returns:
             List of dictionaries with pet and vaccination info
         """
-        target_date = date.today() + timedelta(days=days_ahead)
-
-        vaccinations = db.query(VaccinationRecord).filter(
-            VaccinationRecord.tenant_id == tenant_id,
-            VaccinationRecord.expiry_date <= target_date,
-            VaccinationRecord.expiry_date >= date.today(),
-            VaccinationRecord.deleted_at.is_(None)
+        rows = VaccinationMonitoringService._expiring_query(db, tenant_id, days_ahead).order_by(
+            VaccinationRecord.expiry_date, VaccinationRecord.id
         ).all()
 
-        result = []
-        for vaccination in vaccinations:
-            pet = db.query(Pet).filter(Pet.id == vaccination.pet_id).first()
-            if pet:
-                owner = db.query(Owner).filter(Owner.id == pet.owner_id).first()
+        return [VaccinationMonitoringService._expiring_item(r) for r in rows]
+
+    @staticmethod
+    def list_expiring_vaccinations(
+        db: Session,
+        tenant_id: UUID,
+        days_ahead: int = 30,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        group_by_owner: bool = False
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        List vaccinations expiring soon for outreach, soonest first
+
+        Records come from one query joined to pets and owners. With
+        group_by_owner, a page holds owners (ordered by their soonest expiry)
+        each with all their expiring pets' vaccinations, fetched in a second
+        query for the page's owners.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            days_ahead: Days to look ahead
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Page size (records, or owners when grouped)
+            group_by_owner: Return one row per owner
 
-                days_until_expiry = (vaccination.expiry_date - date.today()).days
+        Returns:
+            Tuple of (items, next_cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query = VaccinationMonitoringService._expiring_query(db, tenant_id, days_ahead)
+
+        if not group_by_owner:
+            rows, next_cursor = paginate_keyset(
+                query, [VaccinationRecord.expiry_date, VaccinationRecord.id], cursor, limit
+            )
+            return [VaccinationMonitoringService._expiring_item(r) for r in rows], next_cursor
+
+        owners = query.with_entities(
+            Owner.id.label("owner_id"),
+            func.min(VaccinationRecord.expiry_date).label("next_expiry_date")
+        ).group_by(Owner.id).subquery()
+
+        owner_rows, next_cursor = paginate_keyset(
+            db.query(owners.c.owner_id, owners.c.next_expiry_date),
+            [owners.c.next_expiry_date, owners.c.owner_id],
+            cursor,
+            limit
+        )
+        if not owner_rows:
+            return [], None
+
+        records = query.filter(
+            Owner.id.in_([r.owner_id for r in owner_rows])
+        ).order_by(VaccinationRecord.expiry_date, VaccinationRecord.id).all()
+
+        grouped: Dict[UUID, Dict] = {}
+        for r in records:
+            group = grouped.setdefault(r.owner_id, {
+                "owner_id": str(r.owner_id),
+                "owner_name": f"{r.first_name} {r.last_name}",
+                "email": r.email,
+                "phone": r.phone,
+                "sms_opted_in": r.sms_opted_in,
+                "vaccinations": []
+            })
+            group["vaccinations"].append(VaccinationMonitoringService._expiring_item(r, with_owner=False))
+
+        return [grouped[r.owner_id] for r in owner_rows if r.owner_id in grouped], next_cursor
+
+    @staticmethod
+    def _expiring_query(db: Session, tenant_id: UUID, days_ahead: int):
+        """Records expiring within days_ahead, joined with their pet and owner"""
+        today = date.today()
 
-                result.append({
-                    "pet_id": str(pet.id),
-                    "pet_name": pet.name,
-                    "owner_id": str(owner.id) if owner else None,
-                    "owner_name": f"{owner.first_name} {owner.last_name}" if owner else None,
-                    "vaccination_type": vaccination.vaccination_type,
-                    "expiry_date": vaccination.expiry_date.isoformat(),
-                    "days_until_expiry": days_until_expiry,
-                    "administered_date": vaccination.administered_date.isoformat() if vaccination.administered_date else None
-                })
+        return db.query(
+            VaccinationRecord.id,
+            VaccinationRecord.type,
+            VaccinationRecord.expiry_date,
+            VaccinationRecord.administered_date,
+            Pet.id.label("pet_id"),
+            Pet.name.label("pet_name"),
+            Owner.id.label("owner_id"),
+            Owner.first_name,
+            Owner.last_name,
+            Owner.email,
+            Owner.phone,
+            Owner.sms_opted_in
+        ).join(
+            Pet, Pet.id == VaccinationRecord.pet_id
+        ).join(
+            Owner, Owner.id == Pet.owner_id
+        ).filter(
+            VaccinationRecord.tenant_id == tenant_id,
+            VaccinationRecord.expiry_date >= today,
+            VaccinationRecord.expiry_date <= today + timedelta(days=days_ahead),
+            VaccinationRecord.deleted_at.is_(None),
+            Pet.deleted_at.is_(None)
+        )
 
-        return result
+    @staticmethod
+    def _expiring_item(row, with_owner: bool = True) -> Dict:
+        """Dashboard entry for an expiring vaccination row"""
+        item = {
+            "vaccination_id": str(row.id),
+            "pet_id": str(row.pet_id),
+            "pet_name": row.pet_name,
+            "vaccination_type": row.type.value,
+            "expiry_date": row.expiry_date.isoformat(),
+            "days_until_expiry": (row.expiry_date - date.today()).days,
+            "administered_date": row.administered_date.isoformat() if row.administered_date else None
+        }
+        if with_owner:
+            item.update({
+                "owner_id": str(row.owner_id),
+                "owner_name": f"{row.first_name} {row.last_name}"
+            })
+        return item
 
     @staticmethod
     def schedule_vaccination_alerts(db: Session, tenant_id: UUID) -> Dict:
@@ -298,27 +500,34 @@ class VaccinationMonitoringService:
         Returns:
             Summary of scheduled alerts
         """
-        scheduled = {
-            "30_days": [],
-            "14_days": [],
-            "7_days": []
-        }
-
-        for days in [30, 14, 7]:
-            vaccinations = VaccinationMonitoringService.get_expiring_vaccinations(
-                db, tenant_id, days
-            )
+        thresholds = VaccinationMonitoringService.ALERT_THRESHOLDS
+        scheduled = {f"{days}_days": [] for days in thresholds}
 
-            for vaccination in vaccinations:
-                pet = db.query(Pet).filter(Pet.id == vaccination.pet_id).first()
-                if pet:
-                    owner = db.query(Owner).filter(Owner.id == pet.owner_id).first()
-                    if owner and owner.sms_opted_in:
-                        scheduled[f"{days}_days"].append({
-                            "vaccination_id": str(vaccination.id),
-                            "pet_name": pet.name,
-                            "owner_email": owner.email,
-                            "expiry_date": vaccination.expiry_date.isoformat()
-                        })
+        today = date.today()
+        rows = VaccinationMonitoringService._expiring_query(db, tenant_id, max(thresholds)).filter(
+            VaccinationRecord.expiry_date.in_([today + timedelta(days=days) for days in thresholds]),
+            Owner.sms_opted_in == True
+        ).order_by(VaccinationRecord.expiry_date, VaccinationRecord.id).all()
+
+        for r in rows:
+            scheduled[f"{(r.expiry_date - today).days}_days"].append({
+                "vaccination_id": str(r.id),
+                "pet_name": r.pet_name,
+                "owner_email": r.email,
+                "expiry_date": r.expiry_date.isoformat()
+            })
 
         return scheduled
+
+
+# ==================== RENEWAL ====================
+
+@event.listens_for(VaccinationRecord.expiry_date, "set", active_history=True)
+def _reset_alerts_on_renewal(target: VaccinationRecord, value, oldvalue, initiator) -> None:
+    """Clear alert flags when a record's expiry date changes, so the new date is alerted"""
+    if oldvalue in (NEVER_SET, NO_VALUE) or oldvalue == value:
+        return
+
+    target.reminder_sent_30d = False
+    target.reminder_sent_14d = False
+    target.reminder_sent_7d = False
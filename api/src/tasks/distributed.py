@@ -0,0 +1,224 @@
+"""
+Distributed Job Runner
+Exactly-once scheduled jobs across scheduler replicas
+
+When a job fires, every replica enqueues one job_runs row per active tenant
+for the job's scheduled slot; the unique (job_name, scheduled_for, tenant_id)
+key makes this idempotent. Replicas then claim pending rows in batches with
+SELECT ... FOR UPDATE SKIP LOCKED, run them on the TenantJobExecutor, and
+record the outcome. Tenants are thereby partitioned across replicas and each
+(job, slot, tenant) runs once; the rows double as run history.
+
+A claim left RUNNING longer than JOB_RUN_LEASE_SECONDS (worker crashed) is
+reclaimed, up to JOB_RUN_MAX_ATTEMPTS. Failed runs are not retried, since a
+tenant job may have committed part of its work before failing.
+"""
+import json
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, bindparam, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import func
+
+from ..core.config import settings
+from ..db.base import SessionLocal
+from ..models.job_run import JobRun, JobRunStatus
+from .executor import TenantJob, TenantJobExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """Identify this process in job_runs (host:pid)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class DistributedJobRunner:
+    """Claims and runs per-tenant job slots through the job_runs table"""
+
+    def __init__(
+        self,
+        executor: Optional[TenantJobExecutor] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        session_factory: sessionmaker = SessionLocal
+    ):
+        """
+        Args:
+            executor: Tenant job executor; its max_workers is the claim batch size
+            worker_id: Identifier recorded on claimed runs (default: host:pid)
+            lease_seconds: Age after which a RUNNING claim is reclaimed (default: JOB_RUN_LEASE_SECONDS)
+            max_attempts: Claims allowed per run (default: JOB_RUN_MAX_ATTEMPTS)
+            session_factory: Session factory bound to the database engine
+        """
+        self.executor = executor or TenantJobExecutor(session_factory=session_factory)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds or settings.JOB_RUN_LEASE_SECONDS
+        self.max_attempts = max_attempts or settings.JOB_RUN_MAX_ATTEMPTS
+        self.session_factory = session_factory
+
+    def run(self, job_name: str, job: TenantJob, scheduled_for: datetime) -> Dict[str, Any]:
+        """
+        Run this replica's share of a job slot
+
+        Args:
+            job_name: Job identifier
+            job: Per-tenant function taking (db, tenant_id)
+            scheduled_for: Fire time of the slot, identical on every replica
+
+        Returns:
+            Summary of the runs this replica claimed
+        """
+        summary = {
+            "job": job_name,
+            "scheduled_for": scheduled_for.isoformat(),
+            "worker_id": self.worker_id,
+            "tenants_processed": 0,
+            "tenants_failed": 0,
+            "tenants_timed_out": 0,
+            "totals": {},
+            "errors": {}
+        }
+
+        db = self.session_factory()
+        try:
+            enqueued = self.enqueue(db, job_name, scheduled_for, TenantJobExecutor.get_active_tenant_ids(db))
+            db.commit()
+            logger.info(f"{job_name} @ {scheduled_for}: {enqueued} tenant runs enqueued by {self.worker_id}")
+
+            while True:
+                claimed = self.claim(db, job_name, scheduled_for, self.executor.max_workers)
+                db.commit()
+                if not claimed:
+                    break
+
+                run_ids = {tenant_id: run_id for run_id, tenant_id in claimed}
+                batch = self.executor.run(job_name, job, run_ids.keys())
+
+                self._record(db, run_ids, batch)
+                db.commit()
+
+                for key in ("tenants_processed", "tenants_failed", "tenants_timed_out"):
+                    summary[key] += batch[key]
+                for key, value in batch["totals"].items():
+                    summary["totals"][key] = summary["totals"].get(key, 0) + value
+                summary["errors"].update(batch["errors"])
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        logger.info(f"{job_name} @ {scheduled_for}: {summary['tenants_processed']} tenants processed "
+                    f"by {self.worker_id}, {summary['tenants_failed'] + summary['tenants_timed_out']} failed")
+
+        return summary
+
+    @staticmethod
+    def enqueue(db: Session, job_name: str, scheduled_for: datetime, tenant_ids: List[UUID]) -> int:
+        """
+        Create pending runs for a job slot, skipping tenants already enqueued
+
+        Returns:
+            Number of runs created by this call
+        """
+        if not tenant_ids:
+            return 0
+
+        stmt = insert(JobRun).values([
+            {
+                "job_name": job_name,
+                "scheduled_for": scheduled_for,
+                "tenant_id": tenant_id,
+                "status": JobRunStatus.PENDING,
+                "attempts": 0
+            }
+            for tenant_id in tenant_ids
+        ]).on_conflict_do_nothing(
+            index_elements=["job_name", "scheduled_for", "tenant_id"]
+        ).returning(JobRun.id)
+
+        return len(db.execute(stmt).all())
+
+    def claim(self, db: Session, job_name: str, scheduled_for: datetime, limit: int) -> List[Tuple[UUID, UUID]]:
+        """
+        Claim up to `limit` runnable runs of a job slot
+
+        Runnable runs are PENDING, or RUNNING with an expired lease and
+        attempts left. Rows locked by other workers are skipped.
+
+        Returns:
+            (run_id, tenant_id) pairs claimed by this worker
+        """
+        lease_expired = func.now() - timedelta(seconds=self.lease_seconds)
+
+        claimable = select(JobRun.id).where(
+            JobRun.job_name == job_name,
+            JobRun.scheduled_for == scheduled_for,
+            or_(
+                JobRun.status == JobRunStatus.PENDING,
+                and_(
+                    JobRun.status == JobRunStatus.RUNNING,
+                    JobRun.claimed_at < lease_expired,
+                    JobRun.attempts < self.max_attempts
+                )
+            )
+        ).order_by(JobRun.id).limit(limit).with_for_update(skip_locked=True)
+
+        stmt = update(JobRun).where(
+            JobRun.id.in_(claimable.scalar_subquery())
+        ).values(
+            status=JobRunStatus.RUNNING,
+            worker_id=self.worker_id,
+            attempts=JobRun.attempts + 1,
+            claimed_at=func.now()
+        ).returning(JobRun.id, JobRun.tenant_id).execution_options(synchronize_session=False)
+
+        return [(r.id, r.tenant_id) for r in db.execute(stmt)]
+
+    def _record(self, db: Session, run_ids: Dict[UUID, UUID], batch: Dict[str, Any]) -> None:
+        """Store the outcome of each claimed run"""
+        rows = []
+        for tenant_id, run_id in run_ids.items():
+            key = str(tenant_id)
+            if key in batch["tenant_results"]:
+                rows.append({
+                    "run_id": run_id,
+                    "new_status": JobRunStatus.SUCCEEDED,
+                    "new_result": self._to_json(batch["tenant_results"][key]),
+                    "new_error": None
+                })
+            else:
+                rows.append({
+                    "run_id": run_id,
+                    "new_status": JobRunStatus.FAILED,
+                    "new_result": None,
+                    "new_error": batch["errors"].get(key, "Unknown error")
+                })
+
+        # Only finish runs still claimed by this worker; a run reclaimed after
+        # its lease expired belongs to the new claimant
+        table = JobRun.__table__
+        stmt = table.update().where(
+            table.c.id == bindparam("run_id"),
+            table.c.worker_id == self.worker_id,
+            table.c.status == JobRunStatus.RUNNING
+        ).values(
+            status=bindparam("new_status"),
+            result=bindparam("new_result"),
+            error=bindparam("new_error"),
+            finished_at=func.now()
+        )
+        db.execute(stmt, rows)
+
+    @staticmethod
+    def _to_json(result: Any) -> Any:
+        """Make a job result JSON-serializable (UUIDs, dates -> str)"""
+        return json.loads(json.dumps(result, default=str))
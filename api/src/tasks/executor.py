@@ -0,0 +1,189 @@
+"""
+Tenant Job Executor
+Runs per-tenant task work in parallel
+
+Each tenant's work runs on a bounded thread pool with its own database
+connection and session, so one slow or failing tenant neither blocks nor
+breaks the others. The per-tenant time limit is enforced three ways: the
+collector stops waiting, Postgres statement_timeout cancels a running
+statement, and once the limit has passed the tenant's connection refuses to
+start new statements, so the job rolls back at its next query instead of
+running on into the next scheduled run.
+"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..core.config import settings
+from ..db.base import SessionLocal
+from ..models.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+# Per-tenant job: (db, tenant_id) -> result dict
+TenantJob = Callable[[Session, UUID], Any]
+
+
+class TenantJobTimeout(Exception):
+    """Raised when a tenant job issues a query after its time limit"""
+
+
+class TenantJobExecutor:
+    """Fans per-tenant work out to a bounded thread pool"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        tenant_timeout_seconds: Optional[float] = None,
+        session_factory: sessionmaker = SessionLocal
+    ):
+        """
+        Args:
+            max_workers: Tenants processed concurrently (default: TASK_MAX_WORKERS)
+            tenant_timeout_seconds: Time limit per tenant (default: TASK_TENANT_TIMEOUT_SECONDS)
+            session_factory: Session factory bound to the database engine
+        """
+        self.max_workers = max_workers or settings.TASK_MAX_WORKERS
+        self.tenant_timeout_seconds = tenant_timeout_seconds or settings.TASK_TENANT_TIMEOUT_SECONDS
+        self.session_factory = session_factory
+
+    @staticmethod
+    def get_active_tenant_ids(db: Session) -> List[UUID]:
+        """Get IDs of all active tenants"""
+        rows = db.query(Tenant.id).filter(
+            Tenant.is_active == True,
+            Tenant.deleted_at.is_(None)
+        ).all()
+
+        return [r.id for r in rows]
+
+    def run(
+        self,
+        job_name: str,
+        job: TenantJob,
+        tenant_ids: Iterable[UUID]
+    ) -> Dict[str, Any]:
+        """
+        Run a job for each tenant and aggregate the results
+
+        Numeric values of dict results are summed into `totals`.
+
+        Args:
+            job_name: Name used in logs and worker thread names
+            job: Per-tenant function taking (db, tenant_id)
+            tenant_ids: Tenants to process
+
+        Returns:
+            Summary with per-tenant results, summed totals and errors
+        """
+        tenant_ids = list(tenant_ids)
+        summary = {
+            "job": job_name,
+            "tenants_processed": 0,
+            "tenants_failed": 0,
+            "tenants_timed_out": 0,
+            "totals": {},
+            "tenant_results": {},
+            "errors": {}
+        }
+
+        if not tenant_ids:
+            return summary
+
+        started_at: Dict[UUID, float] = {}
+
+        def run_tenant(tenant_id: UUID) -> Any:
+            started_at[tenant_id] = time.monotonic()
+            return self._run_tenant(job, tenant_id)
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(tenant_ids)),
+            thread_name_prefix=job_name
+        )
+        pending = {pool.submit(run_tenant, tenant_id): tenant_id for tenant_id in tenant_ids}
+
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    tenant_id = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        summary["tenants_failed"] += 1
+                        summary["errors"][str(tenant_id)] = str(e)
+                        logger.error(f"{job_name} failed for tenant {tenant_id}: {e}", exc_info=True)
+                        continue
+
+                    summary["tenants_processed"] += 1
+                    summary["tenant_results"][str(tenant_id)] = result
+                    self._add_totals(summary["totals"], result)
+
+                now = time.monotonic()
+                for future, tenant_id in list(pending.items()):
+                    started = started_at.get(tenant_id)
+                    if started is not None and now - started > self.tenant_timeout_seconds:
+                        pending.pop(future)
+                        summary["tenants_timed_out"] += 1
+                        summary["errors"][str(tenant_id)] = "Timed out"
+                        logger.error(f"{job_name} timed out for tenant {tenant_id} "
+                                     f"after {self.tenant_timeout_seconds}s")
+        finally:
+            # Don't block on timed-out workers; they stop at their next statement (see _run_tenant)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(f"{job_name}: {summary['tenants_processed']} tenants processed, "
+                    f"{summary['tenants_failed']} failed, {summary['tenants_timed_out']} timed out")
+
+        return summary
+
+    def _run_tenant(self, job: TenantJob, tenant_id: UUID) -> Any:
+        """
+        Run a job for one tenant on a dedicated connection and session
+
+        Raises:
+            TenantJobTimeout: If the job queries after its time limit
+        """
+        engine = self.session_factory.kw["bind"]
+        timeout_ms = int(self.tenant_timeout_seconds * 1000)
+        deadline = time.monotonic() + self.tenant_timeout_seconds
+
+        def check_deadline(conn, cursor, statement, parameters, context, executemany):
+            if time.monotonic() > deadline:
+                raise TenantJobTimeout(f"Tenant {tenant_id} exceeded {self.tenant_timeout_seconds}s")
+
+        with engine.connect() as connection:
+            # Session-level setting on a pinned connection survives the job's commits
+            connection.exec_driver_sql(f"SET statement_timeout = {timeout_ms}")
+            connection.commit()
+
+            event.listen(connection, "before_cursor_execute", check_deadline)
+            db = self.session_factory(bind=connection)
+            try:
+                result = job(db, tenant_id)
+                db.commit()
+                return result
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+                event.remove(connection, "before_cursor_execute", check_deadline)
+                connection.exec_driver_sql("RESET statement_timeout")
+                connection.commit()
+
+    @staticmethod
+    def _add_totals(totals: Dict[str, Any], result: Any) -> None:
+        """Sum numeric values of a tenant result into totals"""
+        if not isinstance(result, dict):
+            return
+
+        for key, value in result.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                totals[key] = totals.get(key, 0) + value
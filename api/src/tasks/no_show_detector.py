@@ -10,11 +10,12 @@ Usage:
 import sys
 import logging
 from datetime import datetime
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from ..db.session import SessionLocal
-from ..models.tenant import Tenant
 from ..services.no_show_service import NoShowService
+from .executor import TenantJobExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -24,45 +25,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_no_show_detection(db: Session) -> dict:
+def run_no_show_detection(db: Session, executor: Optional[TenantJobExecutor] = None) -> dict:
     """
-    Run no-show detection for all active tenants
+    Run no-show detection for all active tenants in parallel
+
+    Args:
+        db: Database session (used to list tenants)
+        executor: Tenant job executor (default: TenantJobExecutor())
 
     Returns:
         Summary of detection results
     """
     logger.info("Starting no-show detection task")
 
+    executor = executor or TenantJobExecutor()
+    summary = executor.run(
+        "no_show_detection",
+        NoShowService.process_daily_no_show_detection,
+        executor.get_active_tenant_ids(db)
+    )
+    totals = summary["totals"]
+
     total_results = {
-        "tenants_processed": 0,
-        "total_detected": 0,
-        "total_fees_applied": 0,
-        "total_errors": 0
+        "tenants_processed": summary["tenants_processed"],
+        "tenants_failed": summary["tenants_failed"] + summary["tenants_timed_out"],
+        "total_detected": totals.get("total_detected", 0),
+        "total_fees_applied": totals.get("fees_applied", 0),
+        "total_errors": totals.get("errors", 0)
     }
 
-    tenants = db.query(Tenant).filter(
-        Tenant.is_active == True,
-        Tenant.deleted_at.is_(None)
-    ).all()
-
-    for tenant in tenants:
-        logger.info(f"Processing tenant: {tenant.name} ({tenant.subdomain})")
-
-        results = NoShowService.process_daily_no_show_detection(
-            db=db,
-            tenant_id=tenant.id
-        )
-
-        total_results["tenants_processed"] += 1
-        total_results["total_detected"] += results["total_detected"]
-        total_results["total_fees_applied"] += results["fees_applied"]
-        total_results["total_errors"] += results["errors"]
-
-        logger.info(f"  Detected: {results['total_detected']}, "
-                   f"Fees applied: {results['fees_applied']}, "
-                   f"Errors: {results['errors']}")
-
-    logger.info(f"No-show detection complete: {total_results['tenants_processed']} tenants processed")
+    logger.info(f"No-show detection complete: {total_results['tenants_processed']} tenants processed, "
+               f"{total_results['tenants_failed']} failed")
     logger.info(f"Total detected: {total_results['total_detected']}, "
                f"Fees applied: {total_results['total_fees_applied']}")
 
@@ -0,0 +1,64 @@
+"""
+Notification Dispatch Task
+Every-minute task that queues reminders and alerts whose due time has passed
+
+Due times are precomputed in scheduled_notifications when appointments and
+vaccination records are saved, so each run only touches due rows.
+
+Usage:
+    python -m src.tasks.notification_dispatcher
+    or
+    python src/tasks/notification_dispatcher.py
+"""
+import sys
+import logging
+from datetime import datetime
+from sqlalchemy.orm import Session
+
+from ..db.session import SessionLocal
+from ..services.notification_schedule_service import NotificationScheduleService
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def run_notification_dispatch(db: Session) -> dict:
+    """
+    Dispatch all due scheduled notifications
+
+    Returns:
+        Summary of dispatched notifications
+    """
+    results = NotificationScheduleService.dispatch_due(db)
+
+    if results["claimed"]:
+        logger.info(f"Dispatched {results['claimed']} notifications: "
+                    f"{results['reminders_sent']} reminders, {results['alerts_sent']} vaccination alerts queued")
+
+    return results
+
+
+def main():
+    """Main entry point for notification dispatch task"""
+    logger.info(f"Notification Dispatch Task - Started at {datetime.utcnow()}")
+
+    db = SessionLocal()
+    try:
+        run_notification_dispatch(db)
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error in notification dispatch task: {e}", exc_info=True)
+        db.rollback()
+        return 1
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Reputation Rebuild Task
+Recompute reputation scores and counters by replaying the reputation_events ledger
+
+Run after correcting ledger rows or changing point values. Not scheduled. Safe to run while
+events are being recorded: owners are locked and committed a chunk at a time.
+
+Usage:
+    python -m src.tasks.reputation_rebuild [tenant_id]
+    or
+    python src/tasks/reputation_rebuild.py [tenant_id]
+"""
+import sys
+import logging
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from ..db.session import SessionLocal
+from ..services.reputation_service import ReputationService
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def run_reputation_rebuild(db: Session, tenant_id: Optional[UUID] = None) -> dict:
+    """
+    Replay the reputation ledger for one tenant or all tenants
+
+    Returns:
+        Summary of the rebuild
+    """
+    logger.info(f"Starting reputation rebuild ({tenant_id or 'all tenants'})")
+
+    results = ReputationService.rebuild_from_ledger(db, tenant_id=tenant_id)
+
+    logger.info(f"Reputation rebuild complete: {results['owners_rebuilt']} owners rebuilt from "
+                f"{results['events_replayed']} events, {results['owners_reset']} reset to defaults")
+
+    return results
+
+
+def main():
+    """Main entry point for reputation rebuild task"""
+    logger.info("=" * 80)
+    logger.info(f"Reputation Rebuild Task - Started at {datetime.utcnow()}")
+    logger.info("=" * 80)
+
+    tenant_id = UUID(sys.argv[1]) if len(sys.argv) > 1 else None
+
+    db = SessionLocal()
+    try:
+        run_reputation_rebuild(db, tenant_id)
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error in reputation rebuild task: {e}", exc_info=True)
+        db.rollback()
+        return 1
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,10 +10,10 @@ Usage:
 import sys
 import logging
 from datetime import datetime
+from uuid import UUID
 from sqlalchemy.orm import Session
 
 from ..db.session import SessionLocal
-from ..models.tenant import Tenant
 from ..services.reputation_service import ReputationService
 
 # Configure logging
@@ -24,10 +24,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_reputation_recovery(db: Session, days_since_last_event: int = 90, recovery_points: int = 5) -> dict:
+def recover_tenant_reputation(
+    db: Session,
+    tenant_id: UUID,
+    days_since_last_event: int = 90,
+    recovery_points: int = 5
+) -> dict:
+    """Apply reputation score recovery for one tenant"""
+    return ReputationService.apply_score_decay(
+        db=db,
+        tenant_id=tenant_id,
+        days_since_last_event=days_since_last_event,
+        recovery_points=recovery_points
+    )
+
+
+def run_reputation_recovery(
+    db: Session,
+    days_since_last_event: int = 90,
+    recovery_points: int = 5
+) -> dict:
     """
     Run reputation score recovery for all active tenants
 
+    Recovery is a chunked set-based UPDATE across tenants, so run time does
+    not grow with the number of tenants.
+
     Args:
         db: Database session
         days_since_last_event: Days of good behavior required (default: 90)
@@ -39,35 +61,21 @@ def run_reputation_recovery(db: Session, days_since_last_event: int = 90, recove
     logger.info(f"Starting reputation recovery task (threshold: {days_since_last_event} days, "
                f"recovery: {recovery_points} points)")
 
+    results = ReputationService.recover_scores(
+        db,
+        days_since_last_event=days_since_last_event,
+        recovery_points=recovery_points
+    )
+
     total_results = {
-        "tenants_processed": 0,
-        "total_checked": 0,
-        "total_improved": 0
+        "tenants_improved": len(results["tenant_results"]),
+        "total_checked": results["customers_checked"],
+        "total_improved": results["scores_improved"],
+        "tenant_results": results["tenant_results"]
     }
 
-    tenants = db.query(Tenant).filter(
-        Tenant.is_active == True,
-        Tenant.deleted_at.is_(None)
-    ).all()
-
-    for tenant in tenants:
-        logger.info(f"Processing tenant: {tenant.name} ({tenant.subdomain})")
-
-        results = ReputationService.apply_score_decay(
-            db=db,
-            tenant_id=tenant.id,
-            days_since_last_event=days_since_last_event,
-            recovery_points=recovery_points
-        )
-
-        total_results["tenants_processed"] += 1
-        total_results["total_checked"] += results["customers_checked"]
-        total_results["total_improved"] += results["scores_improved"]
-
-        logger.info(f"  Checked: {results['customers_checked']}, "
-                   f"Improved: {results['scores_improved']}")
-
-    logger.info(f"Reputation recovery complete: {total_results['tenants_processed']} tenants processed")
+    logger.info(f"Reputation recovery complete: {results['chunks']} chunks, "
+               f"{total_results['tenants_improved']} tenants with improved scores")
     logger.info(f"Total checked: {total_results['total_checked']}, "
                f"Improved: {total_results['total_improved']}")
 
@@ -8,15 +8,21 @@ Usage:
     python src/tasks/scheduler.py
 """
 import logging
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Optional
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 
+from ..core.config import settings
 from ..db.session import SessionLocal
-from .vaccination_monitor import run_vaccination_monitoring, run_vaccination_status_update
+from ..services.no_show_service import NoShowService
+from .distributed import DistributedJobRunner
+from .vaccination_monitor import run_vaccination_status_update, update_tenant_vaccination_statuses
 from .no_show_detector import run_no_show_detection
-from .reputation_updater import run_reputation_recovery
-from .appointment_reminders import send_24_hour_reminders, send_2_hour_reminders
+from .reputation_updater import run_reputation_recovery, recover_tenant_reputation
+from .notification_dispatcher import run_notification_dispatch
 
 # Configure logging
 logging.basicConfig(
@@ -25,37 +31,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-tenant job functions, by job ID, used in distributed mode. Notification
+# dispatch claims rows with SKIP LOCKED, so it runs on every replica as is.
+TENANT_JOBS = {
+    'vaccination_status_update': update_tenant_vaccination_statuses,
+    'no_show_detection': NoShowService.process_daily_no_show_detection,
+    'reputation_recovery': recover_tenant_reputation,
+}
+
 
 class TaskScheduler:
     """Manages scheduled tasks for the Pet Care SaaS platform"""
 
-    def __init__(self, timezone='UTC'):
+    def __init__(self, timezone='UTC', distributed: Optional[bool] = None):
         """
         Initialize scheduler
 
         Args:
             timezone: Timezone for scheduling (default: UTC)
+            distributed: Claim per-tenant runs through job_runs so several
+                replicas can run side by side (default: SCHEDULER_DISTRIBUTED)
         """
         self.scheduler = BlockingScheduler(timezone=pytz.timezone(timezone))
         self.timezone = timezone
+        self.distributed = settings.SCHEDULER_DISTRIBUTED if distributed is None else distributed
+        self.runner = DistributedJobRunner() if self.distributed else None
+
+    def _job_func(self, job_id: str, local_func: Callable) -> Callable:
+        """Pick the job function for the scheduling mode"""
+        if self.distributed:
+            return partial(self._run_distributed, job_id)
+        return local_func
+
+    def _run_distributed(self, job_id: str):
+        """Run this replica's share of a job's current slot"""
+        job = self.scheduler.get_job(job_id)
+        scheduled_for = self._scheduled_slot(job.trigger, job.misfire_grace_time)
+
+        logger.info(f"Executing {job_id} for slot {scheduled_for} (distributed)")
+        try:
+            results = self.runner.run(job_id, TENANT_JOBS[job_id], scheduled_for)
+            logger.info(f"{job_id} completed: {results}")
+        except Exception as e:
+            logger.error(f"Error in {job_id}: {e}", exc_info=True)
+
+    @staticmethod
+    def _scheduled_slot(trigger, misfire_grace_time: Optional[int]) -> datetime:
+        """
+        Fire time being executed, identical on every replica
+
+        The earliest trigger fire time within the misfire grace window; a
+        replica firing late still maps onto the same job_runs slot.
+        """
+        now = datetime.now(pytz.utc)
+        grace = timedelta(seconds=misfire_grace_time or 0)
+        slot = trigger.get_next_fire_time(None, now - grace)
+
+        if slot is None or slot > now:
+            return now.replace(second=0, microsecond=0)
+        return slot
 
     def setup_jobs(self):
         """Configure all scheduled jobs"""
 
         # ==================== DAILY TASKS ====================
 
-        # Vaccination monitoring - Daily at 6:00 AM
-        self.scheduler.add_job(
-            func=self._run_vaccination_monitoring,
-            trigger=CronTrigger(hour=6, minute=0, timezone=self.timezone),
-            id='vaccination_monitoring',
-            name='Vaccination Expiry Monitoring',
-            misfire_grace_time=3600  # 1 hour grace period
-        )
-
         # Vaccination status updates - Daily at 6:15 AM
         self.scheduler.add_job(
-            func=self._run_vaccination_status_update,
+            func=self._job_func('vaccination_status_update', self._run_vaccination_status_update),
             trigger=CronTrigger(hour=6, minute=15, timezone=self.timezone),
             id='vaccination_status_update',
             name='Vaccination Status Update',
@@ -64,38 +107,32 @@ class TaskScheduler:
 
         # No-show detection - Daily at 6:30 AM
         self.scheduler.add_job(
-            func=self._run_no_show_detection,
+            func=self._job_func('no_show_detection', self._run_no_show_detection),
             trigger=CronTrigger(hour=6, minute=30, timezone=self.timezone),
             id='no_show_detection',
             name='No-Show Detection',
             misfire_grace_time=3600
         )
 
-        # ==================== HOURLY TASKS ====================
+        # ==================== EVERY-MINUTE TASKS ====================
 
-        # 24-hour appointment reminders - Every hour
+        # Appointment reminders and vaccination alerts - Every minute
+        # (due times are precomputed in scheduled_notifications)
         self.scheduler.add_job(
-            func=self._send_24_hour_reminders,
-            trigger=CronTrigger(minute=0, timezone=self.timezone),  # Top of every hour
-            id='reminders_24h',
-            name='24-Hour Appointment Reminders',
-            misfire_grace_time=300  # 5 minute grace period
-        )
-
-        # 2-hour appointment reminders - Every hour
-        self.scheduler.add_job(
-            func=self._send_2_hour_reminders,
-            trigger=CronTrigger(minute=30, timezone=self.timezone),  # Half past every hour
-            id='reminders_2h',
-            name='2-Hour Appointment Reminders',
-            misfire_grace_time=300
+            func=self._run_notification_dispatch,
+            trigger=CronTrigger(minute='*', timezone=self.timezone),
+            id='notification_dispatch',
+            name='Notification Dispatch',
+            misfire_grace_time=60,
+            max_instances=1,
+            coalesce=True
         )
 
         # ==================== WEEKLY TASKS ====================
 
         # Reputation score recovery - Sunday at midnight
         self.scheduler.add_job(
-            func=self._run_reputation_recovery,
+            func=self._job_func('reputation_recovery', self._run_reputation_recovery),
             trigger=CronTrigger(day_of_week='sun', hour=0, minute=0, timezone=self.timezone),
             id='reputation_recovery',
             name='Reputation Score Recovery',
@@ -105,19 +142,6 @@ class TaskScheduler:
         logger.info("All scheduled jobs configured")
         self._print_jobs()
 
-    def _run_vaccination_monitoring(self):
-        """Wrapper for vaccination monitoring task"""
-        logger.info("Executing vaccination monitoring task")
-        db = SessionLocal()
-        try:
-            results = run_vaccination_monitoring(db)
-            logger.info(f"Vaccination monitoring completed: {results}")
-        except Exception as e:
-            logger.error(f"Error in vaccination monitoring: {e}", exc_info=True)
-            db.rollback()
-        finally:
-            db.close()
-
     def _run_vaccination_status_update(self):
         """Wrapper for vaccination status update task"""
         logger.info("Executing vaccination status update task")
@@ -144,28 +168,13 @@ class TaskScheduler:
         finally:
             db.close()
 
-    def _send_24_hour_reminders(self):
-        """Wrapper for 24-hour reminder task"""
-        logger.info("Executing 24-hour reminder task")
-        db = SessionLocal()
-        try:
-            results = send_24_hour_reminders(db)
-            logger.info(f"24-hour reminders completed: {results}")
-        except Exception as e:
-            logger.error(f"Error in 24-hour reminders: {e}", exc_info=True)
-            db.rollback()
-        finally:
-            db.close()
-
-    def _send_2_hour_reminders(self):
-        """Wrapper for 2-hour reminder task"""
-        logger.info("Executing 2-hour reminder task")
+    def _run_notification_dispatch(self):
+        """Wrapper for notification dispatch task"""
         db = SessionLocal()
         try:
-            results = send_2_hour_reminders(db)
-            logger.info(f"2-hour reminders completed: {results}")
+            run_notification_dispatch(db)
         except Exception as e:
-            logger.error(f"Error in 2-hour reminders: {e}", exc_info=True)
+            logger.error(f"Error in notification dispatch: {e}", exc_info=True)
             db.rollback()
         finally:
             db.close()
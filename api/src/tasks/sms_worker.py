@@ -0,0 +1,322 @@
+"""
+SMS Outbox Worker
+Delivers queued SMS from the sms_outbox table
+
+Messages are claimed in batches with SELECT ... FOR UPDATE SKIP LOCKED, so
+several workers can run side by side, and sent concurrently on a thread pool
+under an account-wide rate limit. A recipient gets at most one message per
+SMS_PER_NUMBER_INTERVAL_SECONDS; extra messages are deferred. Transient
+failures are retried with exponential backoff up to SMS_MAX_ATTEMPTS.
+
+A claim doubles as a lease: a message left SENDING past
+SMS_SENDING_LEASE_SECONDS (worker crashed mid-send) is claimed again, so
+delivery is at-least-once in that case. If that was its last attempt, the
+message is marked FAILED instead.
+
+SIDs are stored once the whole batch has been sent, so Twilio may report a
+message first; those callbacks are parked by NotificationQueue.record_status
+and applied right after the batch is recorded.
+
+Usage:
+    python -m src.tasks.sms_worker
+    or
+    python src/tasks/sms_worker.py
+
+Set SMS_TRANSPORT=fake to exercise the pipeline without Twilio.
+"""
+import sys
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, bindparam, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import func
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..integrations.notification_queue import NotificationQueue
+from ..integrations.sms_transport import SmsSendError, get_transport
+from ..models.sms_message import SmsMessage, SmsStatus
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Thread-safe token bucket"""
+
+    def __init__(self, rate_per_second: float, burst: Optional[float] = None):
+        self.rate_per_second = rate_per_second
+        self.capacity = burst or max(rate_per_second, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds = (1 - self._tokens) / self.rate_per_second
+
+            time.sleep(wait_seconds)
+
+
+class SmsOutboxWorker:
+    """Claims, sends and records outbox messages"""
+
+    def __init__(
+        self,
+        transport=None,
+        session_factory: sessionmaker = SessionLocal,
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        rate_per_second: Optional[float] = None,
+        per_number_interval_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[int] = None,
+        sending_lease_seconds: Optional[int] = None
+    ):
+        """
+        Args default to the SMS_* settings; transport defaults to SMS_TRANSPORT
+        """
+        self.transport = transport or get_transport()
+        self.session_factory = session_factory
+        self.concurrency = concurrency or settings.SMS_WORKER_CONCURRENCY
+        self.batch_size = batch_size or settings.SMS_WORKER_BATCH_SIZE
+        self.rate_limiter = RateLimiter(rate_per_second or settings.SMS_RATE_PER_SECOND)
+        self.per_number_interval_seconds = (
+            settings.SMS_PER_NUMBER_INTERVAL_SECONDS
+            if per_number_interval_seconds is None else per_number_interval_seconds
+        )
+        self.max_attempts = max_attempts or settings.SMS_MAX_ATTEMPTS
+        self.retry_base_seconds = retry_base_seconds or settings.SMS_RETRY_BASE_SECONDS
+        self.sending_lease_seconds = sending_lease_seconds or settings.SMS_SENDING_LEASE_SECONDS
+
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="sms")
+        self._last_sent_at: Dict[str, float] = {}
+
+    def run_forever(self, poll_interval_seconds: float = 1.0) -> None:
+        """Process batches until interrupted, sleeping when the outbox is empty"""
+        logger.info(f"SMS worker started ({self.concurrency} threads, "
+                    f"{self.rate_limiter.rate_per_second}/s)")
+        while True:
+            results = self.run_once()
+            if not results["claimed"]:
+                time.sleep(poll_interval_seconds)
+
+    def run_once(self) -> Dict[str, int]:
+        """Process one batch on a fresh session"""
+        db = self.session_factory()
+        try:
+            return self.process_batch(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def process_batch(self, db: Session) -> Dict[str, int]:
+        """
+        Claim, send and record one batch of due messages
+
+        Returns:
+            Counts of claimed, sent, retried, failed and deferred messages
+        """
+        results = {"claimed": 0, "sent": 0, "retried": 0, "failed": 0, "deferred": 0}
+
+        results["failed"] = self._fail_abandoned(db)
+        claimed = self._claim(db)
+        db.commit()
+        results["claimed"] = len(claimed)
+        if not claimed:
+            return results
+
+        to_send, deferred = self._apply_per_number_limit(claimed)
+        if deferred:
+            self._defer(db, [m[0] for m in deferred])
+            results["deferred"] = len(deferred)
+
+        outcomes = list(self._pool.map(self._send, to_send))
+
+        rows = []
+        for (message_id, _, _, attempts), (sid, error, retryable) in zip(to_send, outcomes):
+            if sid:
+                rows.append(self._outcome(message_id, SmsStatus.SENT, sid=sid, sent_at=datetime.utcnow()))
+                results["sent"] += 1
+            elif retryable and attempts < self.max_attempts:
+                backoff = timedelta(seconds=self.retry_base_seconds * 2 ** (attempts - 1))
+                rows.append(self._outcome(message_id, SmsStatus.QUEUED, error=error,
+                                          next_attempt_at=datetime.utcnow() + backoff))
+                results["retried"] += 1
+            else:
+                rows.append(self._outcome(message_id, SmsStatus.FAILED, error=error))
+                results["failed"] += 1
+
+        self._record(db, rows)
+        # Status callbacks that arrived before the SIDs were stored
+        NotificationQueue.apply_pending_statuses(db)
+        db.commit()
+
+        logger.info(f"SMS batch: {results}")
+
+        return results
+
+    def _fail_abandoned(self, db: Session) -> int:
+        """Fail messages whose lease expired during their final attempt"""
+        result = db.execute(
+            update(SmsMessage).where(
+                SmsMessage.status == SmsStatus.SENDING,
+                SmsMessage.next_attempt_at <= func.now(),
+                SmsMessage.attempts >= self.max_attempts
+            ).values(
+                status=SmsStatus.FAILED,
+                last_error="Lease expired on final attempt",
+                updated_at=func.now()
+            ).execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            logger.warning(f"Failed {result.rowcount} SMS abandoned on their final attempt")
+
+        return result.rowcount
+
+    def _claim(self, db: Session) -> List[Tuple[UUID, str, str, int]]:
+        """Claim due messages, leasing them until now + SMS_SENDING_LEASE_SECONDS"""
+        now = func.now()
+
+        due = select(SmsMessage.id).where(
+            SmsMessage.next_attempt_at <= now,
+            SmsMessage.attempts < self.max_attempts,
+            or_(
+                SmsMessage.status == SmsStatus.QUEUED,
+                SmsMessage.status == SmsStatus.SENDING  # Lease expired
+            )
+        ).order_by(SmsMessage.next_attempt_at).limit(self.batch_size).with_for_update(skip_locked=True)
+
+        stmt = update(SmsMessage).where(
+            SmsMessage.id.in_(due.scalar_subquery())
+        ).values(
+            status=SmsStatus.SENDING,
+            attempts=SmsMessage.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=self.sending_lease_seconds)
+        ).returning(
+            SmsMessage.id, SmsMessage.to_phone, SmsMessage.body, SmsMessage.attempts
+        ).execution_options(synchronize_session=False)
+
+        return [(r.id, r.to_phone, r.body, r.attempts) for r in db.execute(stmt)]
+
+    def _apply_per_number_limit(self, claimed):
+        """Split a batch into messages to send now and messages to defer"""
+        to_send, deferred = [], []
+        now = time.monotonic()
+        cutoff = now - self.per_number_interval_seconds
+
+        for message in claimed:
+            to_phone = message[1]
+            if self._last_sent_at.get(to_phone, float("-inf")) > cutoff:
+                deferred.append(message)
+            else:
+                self._last_sent_at[to_phone] = now
+                to_send.append(message)
+
+        # Forget recipients outside the window
+        self._last_sent_at = {p: t for p, t in self._last_sent_at.items() if t > cutoff}
+
+        return to_send, deferred
+
+    def _defer(self, db: Session, message_ids: List[UUID]) -> None:
+        """Requeue rate-limited messages without counting an attempt"""
+        db.execute(
+            update(SmsMessage).where(
+                SmsMessage.id.in_(message_ids)
+            ).values(
+                status=SmsStatus.QUEUED,
+                attempts=SmsMessage.attempts - 1,
+                next_attempt_at=func.now() + timedelta(seconds=self.per_number_interval_seconds)
+            ).execution_options(synchronize_session=False)
+        )
+
+    def _send(self, message) -> Tuple[Optional[str], Optional[str], bool]:
+        """Send one message; returns (sid, error, retryable)"""
+        message_id, to_phone, body, _ = message
+        self.rate_limiter.acquire()
+
+        try:
+            return self.transport.send(to_phone, body), None, False
+        except SmsSendError as e:
+            logger.warning(f"SMS {message_id} to {to_phone} failed: {e}")
+            return None, str(e), e.retryable
+        except Exception as e:
+            logger.error(f"SMS {message_id} to {to_phone} failed: {e}", exc_info=True)
+            return None, str(e), True
+
+    @staticmethod
+    def _outcome(
+        message_id: UUID,
+        status: SmsStatus,
+        sid: Optional[str] = None,
+        error: Optional[str] = None,
+        sent_at: Optional[datetime] = None,
+        next_attempt_at: Optional[datetime] = None
+    ) -> Dict:
+        return {
+            "message_id": message_id,
+            "new_status": status,
+            "new_sid": sid,
+            "new_error": error,
+            "new_sent_at": sent_at,
+            "new_next_attempt_at": next_attempt_at or datetime.utcnow()
+        }
+
+    @staticmethod
+    def _record(db: Session, rows: List[Dict]) -> None:
+        """Store send outcomes for messages this worker still holds"""
+        if not rows:
+            return
+
+        table = SmsMessage.__table__
+        stmt = table.update().where(
+            and_(table.c.id == bindparam("message_id"), table.c.status == SmsStatus.SENDING)
+        ).values(
+            status=bindparam("new_status"),
+            provider_sid=bindparam("new_sid"),
+            last_error=bindparam("new_error"),
+            sent_at=bindparam("new_sent_at"),
+            next_attempt_at=bindparam("new_next_attempt_at"),
+            updated_at=func.now()
+        )
+        db.execute(stmt, rows)
+
+
+def main():
+    """Main entry point for the SMS worker"""
+    logger.info("=" * 80)
+    logger.info(f"SMS Outbox Worker - Started at {datetime.utcnow()} (transport: {settings.SMS_TRANSPORT})")
+    logger.info("=" * 80)
+
+    try:
+        SmsOutboxWorker().run_forever()
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("SMS worker stopped by user")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
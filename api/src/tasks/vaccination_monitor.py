@@ -1,6 +1,9 @@
 """
 Vaccination Monitoring Task
-Sprint 4 - Daily task to check expiring vaccinations and send alerts
+Sprint 4 - Daily task to update vaccination statuses
+
+Expiry alerts are sent by the notification dispatcher
+(notification_dispatcher.py) from precomputed due times.
 
 Usage:
     python -m src.tasks.vaccination_monitor
@@ -10,10 +13,10 @@ Usage:
 import sys
 import logging
 from datetime import datetime
+from uuid import UUID
 from sqlalchemy.orm import Session
 
 from ..db.session import SessionLocal
-from ..models.tenant import Tenant
 from ..services.vaccination_monitoring_service import VaccinationMonitoringService
 
 # Configure logging
@@ -24,49 +27,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_vaccination_monitoring(db: Session) -> dict:
-    """
-    Run vaccination monitoring for all active tenants
-
-    Returns:
-        Summary of monitoring results
-    """
-    logger.info("Starting vaccination monitoring task")
-
-    results = VaccinationMonitoringService.run_all_tenants_monitoring(db)
-
-    logger.info(f"Vaccination monitoring complete: {results['tenants_processed']} tenants processed")
-    logger.info(f"Alerts sent: {results['total_alerts_sent']}, Failed: {results['total_alerts_failed']}")
-
-    return results
+def update_tenant_vaccination_statuses(db: Session, tenant_id: UUID) -> dict:
+    """Update vaccination statuses for one tenant"""
+    return VaccinationMonitoringService.refresh_vaccination_statuses(db=db, tenant_id=tenant_id)
 
 
 def run_vaccination_status_update(db: Session) -> int:
     """
-    Update vaccination statuses for all active tenants
+    Update vaccination and pet vaccination statuses for all active tenants
+
+    Runs as a handful of set-based UPDATEs rather than per tenant.
 
     Returns:
         Total number of vaccinations updated
     """
     logger.info("Starting vaccination status update task")
 
-    total_updated = 0
-    tenants = db.query(Tenant).filter(
-        Tenant.is_active == True,
-        Tenant.deleted_at.is_(None)
-    ).all()
+    results = VaccinationMonitoringService.refresh_vaccination_statuses(db)
 
-    for tenant in tenants:
-        updated = VaccinationMonitoringService.update_vaccination_statuses(
-            db=db,
-            tenant_id=tenant.id
-        )
-        total_updated += updated
-        logger.info(f"Updated {updated} vaccinations for tenant {tenant.name}")
+    logger.info(f"Vaccination status update complete: {results['records_updated']} records, "
+                f"{results['pets_updated']} pets updated")
 
-    logger.info(f"Vaccination status update complete: {total_updated} total updated")
-
-    return total_updated
+    return results["records_updated"]
 
 
 def main():
@@ -77,16 +59,12 @@ def main():
 
     db = SessionLocal()
     try:
-        # Run monitoring
-        monitoring_results = run_vaccination_monitoring(db)
-
         # Run status updates
         status_updates = run_vaccination_status_update(db)
 
         logger.info("=" * 80)
         logger.info("Task completed successfully")
-        logger.info(f"Summary: {monitoring_results['total_alerts_sent']} alerts sent, "
-                   f"{status_updates} statuses updated")
+        logger.info(f"Summary: {status_updates} statuses updated")
         logger.info("=" * 80)
 
         return 0
@@ -0,0 +1,108 @@
+"""
+Tests for the appointment calendar feed
+Eager resolution of owners, pets, services and staff, and ETag revalidation
+"""
+import pytest
+from datetime import datetime, timedelta
+from fastapi import Request, Response
+from sqlalchemy import event
+
+from src.core.serialization import etag_json_response, etag_matches
+from src.models.appointment import AppointmentStatus
+from src.services.appointment_service import AppointmentService
+
+
+@pytest.fixture
+def day_start():
+    """Start of tomorrow, the day appointment_factory books into by default"""
+    return datetime.combine(datetime.utcnow().date() + timedelta(days=1), datetime.min.time())
+
+
+def _request(if_none_match=None):
+    """Bare ASGI request carrying an optional If-None-Match header"""
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestGetCalendar:
+    """Test building the calendar feed"""
+
+    def test_related_data_resolved(self, db, tenant, owner, staff, service, pet_factory, appointment_factory, day_start):
+        """Test owner, pets (in booking order), service and staff are included"""
+        rex = pet_factory(tenant.id, owner.id, name="Rex")
+        ada = pet_factory(tenant.id, owner.id, name="Ada")
+        appointment_factory(tenant.id, owner.id, staff.id, service.id, pet_ids=[rex.id, ada.id])
+
+        entries = AppointmentService.get_calendar(db, tenant, day_start, day_start + timedelta(days=2))
+
+        assert len(entries) == 1
+        assert entries[0]["owner"]["last_name"] == owner.last_name
+        assert [pet["name"] for pet in entries[0]["pets"]] == ["Rex", "Ada"]
+        assert entries[0]["service"]["name"] == service.name
+        assert entries[0]["staff"]["id"] == staff.id
+
+    def test_fixed_query_count(self, db, tenant, owner, staff, service, pet, appointment_factory, day_start):
+        """Test the feed takes two queries however many appointments it holds"""
+        for hours in range(5):
+            start = day_start + timedelta(days=1, hours=8 + hours)
+            appointment_factory(
+                tenant.id, owner.id, staff.id, service.id, pet_ids=[pet.id],
+                scheduled_start=start, scheduled_end=start + timedelta(hours=1)
+            )
+
+        db.refresh(tenant)  # Reload after the factory's commits, outside the count
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.bind, "before_cursor_execute", listener)
+        try:
+            entries = AppointmentService.get_calendar(db, tenant, day_start, day_start + timedelta(days=2))
+        finally:
+            event.remove(db.bind, "before_cursor_execute", listener)
+
+        assert len(entries) == 5
+        assert len(statements) == 2
+
+    def test_cancelled_excluded_by_default(self, db, tenant, owner, staff, service, pet, appointment_factory, day_start):
+        """Test cancelled appointments only appear when asked for"""
+        appointment_factory(tenant.id, owner.id, staff.id, service.id, pet_ids=[pet.id], status=AppointmentStatus.CANCELLED)
+        end = day_start + timedelta(days=2)
+
+        assert AppointmentService.get_calendar(db, tenant, day_start, end) == []
+        assert len(AppointmentService.get_calendar(db, tenant, day_start, end, include_cancelled=True)) == 1
+
+    def test_range_too_wide_rejected(self, db, tenant, day_start):
+        """Test ranges beyond CALENDAR_MAX_DAYS raise ValueError"""
+        with pytest.raises(ValueError):
+            AppointmentService.get_calendar(db, tenant, day_start, day_start + timedelta(days=90))
+
+
+class TestEtagResponse:
+    """Test ETag tagging and If-None-Match revalidation"""
+
+    def test_matching_etag_returns_304(self):
+        """Test a request echoing the ETag gets an empty 304"""
+        first = etag_json_response([{"a": 1}], _request(), Response())
+
+        second = etag_json_response([{"a": 1}], _request(first.headers["etag"]), Response())
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.body == b""
+
+    def test_changed_content_returns_200(self):
+        """Test a stale ETag gets the new body"""
+        first = etag_json_response([{"a": 1}], _request(), Response())
+
+        second = etag_json_response([{"a": 2}], _request(first.headers["etag"]), Response())
+
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+
+    def test_weak_and_listed_tags_match(self):
+        """Test If-None-Match lists and weak validators"""
+        assert etag_matches('"x", W/"abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+        assert not etag_matches('"x"', '"abc"')
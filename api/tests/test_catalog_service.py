@@ -0,0 +1,75 @@
+"""
+Tests for Catalog Service
+Per-tenant in-memory snapshots of services, staff and resources
+"""
+from sqlalchemy import update
+
+from src.core.config import settings
+from src.models.service import Service
+from src.services import catalog_service
+from src.services.catalog_service import CatalogService
+from src.services.entity_version_service import SERVICES, EntityVersionService
+
+
+def _rename_elsewhere(db, tenant, service, name):
+    """Change a service the way another worker would: no flush in this session"""
+    db.execute(update(Service).where(Service.id == service.id).values(name=name))
+    EntityVersionService.bump(db, [(tenant.id, SERVICES)])
+
+
+class TestGetSnapshot:
+    """Test loading, sharing and refreshing snapshots"""
+
+    def test_snapshot_shared_between_calls(self, db, tenant, service):
+        """Test an unchanged catalog is served from memory"""
+        first = CatalogService.get_snapshot(db, tenant.id)
+        second = CatalogService.get_snapshot(db, tenant.id)
+
+        assert second is first
+        assert first.service(service.id).name == service.name
+
+    def test_commit_replaces_snapshot(self, db, tenant, service, service_factory):
+        """Test committing a catalog change drops this worker's snapshot"""
+        before = CatalogService.get_snapshot(db, tenant.id)
+
+        added = service_factory(tenant.id, name="Nail Trim")
+        after = CatalogService.get_snapshot(db, tenant.id)
+
+        assert before.service(added.id) is None
+        assert after.service(added.id) is not None
+        assert after.version > before.version
+
+    def test_uncommitted_changes_not_shared(self, db, tenant, service):
+        """Test a session sees its own flushed changes without caching them"""
+        shared = CatalogService.get_snapshot(db, tenant.id)
+
+        service.name = "Renamed"
+        db.flush()
+        own = CatalogService.get_snapshot(db, tenant.id)
+
+        assert own.service(service.id).name == "Renamed"
+        assert catalog_service._snapshots[tenant.id][1] is shared
+
+    def test_version_poll_picks_up_other_workers(self, db, tenant, service, monkeypatch):
+        """Test a moved version reloads the snapshot once the poll interval passes"""
+        CatalogService.get_snapshot(db, tenant.id)
+        _rename_elsewhere(db, tenant, service, "Deluxe Groom")
+        monkeypatch.setattr(settings, "CATALOG_SNAPSHOT_POLL_SECONDS", 0)
+
+        assert CatalogService.get_snapshot(db, tenant.id).service(service.id).name == "Deluxe Groom"
+
+    def test_newer_seen_version_reloads_early(self, db, tenant, service):
+        """Test a version already read by the request (e.g. for an ETag) forces a reload"""
+        CatalogService.get_snapshot(db, tenant.id)
+        _rename_elsewhere(db, tenant, service, "Deluxe Groom")
+
+        EntityVersionService.get_versions(db, tenant.id, [SERVICES])
+
+        assert CatalogService.get_snapshot(db, tenant.id).service(service.id).name == "Deluxe Groom"
+
+    def test_other_tenant_isolated(self, db, tenant, tenant_factory, service_factory):
+        """Test snapshots only hold their tenant's rows"""
+        other = tenant_factory()
+        foreign = service_factory(other.id)
+
+        assert CatalogService.get_snapshot(db, tenant.id).service(foreign.id) is None
@@ -0,0 +1,100 @@
+"""
+Tests for Customer Value Service
+Per-owner revenue aggregates and the customer_values materialization
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from src.core.config import settings
+from src.models.appointment import AppointmentStatus
+from src.models.customer_value import CustomerValue
+from src.models.payment import PaymentStatus
+from src.services.customer_value_service import CustomerValueService
+
+
+@pytest.fixture
+def materialized(monkeypatch):
+    """Serve customer value from the customer_values table"""
+    monkeypatch.setattr(settings, "CUSTOMER_VALUE_MATERIALIZED", True)
+
+
+class TestListCustomersByValue:
+    """Test customers-by-value ranking"""
+
+    def test_totals_not_multiplied_by_appointments(self, db, tenant, owner, staff, service,
+                                                    appointment_factory, payment_factory):
+        """Test revenue and visit counts are independent aggregates"""
+        for _ in range(3):
+            appointment_factory(tenant.id, owner.id, staff.id, service.id, status=AppointmentStatus.COMPLETED)
+        payment_factory(tenant.id, owner.id, amount=5000)
+        payment_factory(tenant.id, owner.id, amount=2500)
+
+        customers, _ = CustomerValueService.list_customers_by_value(db, tenant.id)
+
+        assert len(customers) == 1
+        assert customers[0]["lifetime_revenue"] == 7500
+        assert customers[0]["appointment_count"] == 3
+
+    def test_paginates_by_revenue_descending(self, db, tenant, owner_factory, payment_factory):
+        """Test pages walk customers from highest to lowest revenue"""
+        for i in range(5):
+            customer = owner_factory(tenant.id, email=f"value{i}@test.com")
+            payment_factory(tenant.id, customer.id, amount=(i + 1) * 1000)
+
+        first_page, cursor = CustomerValueService.list_customers_by_value(db, tenant.id, limit=3)
+        second_page, last_cursor = CustomerValueService.list_customers_by_value(db, tenant.id, cursor=cursor, limit=3)
+
+        revenues = [c["lifetime_revenue"] for c in first_page + second_page]
+        assert revenues == [5000, 4000, 3000, 2000, 1000]
+        assert last_cursor is None
+
+    def test_invalid_cursor(self, db, tenant):
+        """Test malformed cursor raises ValueError"""
+        with pytest.raises(ValueError):
+            CustomerValueService.list_customers_by_value(db, tenant.id, cursor="garbage")
+
+
+class TestCustomerValueMaterialization:
+    """Test incremental refresh of customer_values"""
+
+    def test_refreshed_on_payment_commit(self, db, tenant, owner, payment_factory, materialized):
+        """Test committing a payment refreshes its owner's row"""
+        payment_factory(tenant.id, owner.id, amount=4000)
+
+        value = db.query(CustomerValue).filter(CustomerValue.owner_id == owner.id).one()
+        assert value.lifetime_revenue == 4000
+
+    def test_refreshed_on_status_change(self, db, tenant, owner, payment_factory, materialized):
+        """Test failed payments drop out of lifetime revenue"""
+        payment = payment_factory(tenant.id, owner.id, amount=4000)
+
+        payment.status = PaymentStatus.FAILED
+        db.commit()
+
+        assert CustomerValueService.get_lifetime_revenue(db, owner.id) == 0
+
+    def test_last_visit_tracks_completed_appointments(self, db, tenant, owner, staff, service,
+                                                      appointment_factory, materialized):
+        """Test last visit is the latest completed appointment"""
+        visit = datetime.utcnow() - timedelta(days=3)
+        appointment_factory(
+            tenant.id, owner.id, staff.id, service.id,
+            status=AppointmentStatus.COMPLETED,
+            scheduled_start=visit, scheduled_end=visit + timedelta(hours=1)
+        )
+        appointment_factory(tenant.id, owner.id, staff.id, service.id)  # Upcoming
+
+        value = db.query(CustomerValue).filter(CustomerValue.owner_id == owner.id).one()
+        assert value.appointment_count == 2
+        assert value.last_visit_at.replace(tzinfo=None) == visit
+
+    def test_rebuild_backfills_existing_data(self, db, tenant, owner, payment_factory, monkeypatch):
+        """Test rebuild materializes data written before it was enabled"""
+        payment_factory(tenant.id, owner.id, amount=6000)
+        assert db.query(CustomerValue).count() == 0
+
+        monkeypatch.setattr(settings, "CUSTOMER_VALUE_MATERIALIZED", True)
+        CustomerValueService.rebuild_customer_values(db, tenant.id)
+
+        customers, _ = CustomerValueService.list_customers_by_value(db, tenant.id)
+        assert customers[0]["lifetime_revenue"] == 6000
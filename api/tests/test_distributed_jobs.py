@@ -0,0 +1,78 @@
+"""
+Tests for Distributed Job Runner
+Slot enqueueing, claiming and lease expiry on the job_runs table
+"""
+from datetime import datetime, timedelta, timezone
+
+from src.models.job_run import JobRun, JobRunStatus
+from src.tasks.distributed import DistributedJobRunner
+
+SLOT = datetime(2026, 10, 19, 6, 30, tzinfo=timezone.utc)
+
+
+class TestEnqueue:
+    """Test per-tenant run creation"""
+
+    def test_replicas_enqueue_once(self, db, tenant):
+        """Test enqueueing the same slot twice creates one run per tenant"""
+        first = DistributedJobRunner.enqueue(db, "no_show_detection", SLOT, [tenant.id])
+        second = DistributedJobRunner.enqueue(db, "no_show_detection", SLOT, [tenant.id])
+
+        assert first == 1
+        assert second == 0
+        assert db.query(JobRun).filter(JobRun.job_name == "no_show_detection").count() == 1
+
+    def test_new_slot_gets_new_run(self, db, tenant):
+        """Test a later slot is enqueued separately"""
+        DistributedJobRunner.enqueue(db, "no_show_detection", SLOT, [tenant.id])
+        created = DistributedJobRunner.enqueue(db, "no_show_detection", SLOT + timedelta(days=1), [tenant.id])
+
+        assert created == 1
+
+
+class TestClaim:
+    """Test claiming runs"""
+
+    def test_claimed_run_is_not_claimed_again(self, db, tenant):
+        """Test a run is handed to one worker only"""
+        DistributedJobRunner.enqueue(db, "reminders_24h", SLOT, [tenant.id])
+        worker_a = DistributedJobRunner(worker_id="a")
+        worker_b = DistributedJobRunner(worker_id="b")
+
+        claimed = worker_a.claim(db, "reminders_24h", SLOT, limit=10)
+        assert [tenant_id for _, tenant_id in claimed] == [tenant.id]
+        assert worker_b.claim(db, "reminders_24h", SLOT, limit=10) == []
+
+        run = db.query(JobRun).filter(JobRun.job_name == "reminders_24h").one()
+        db.refresh(run)
+        assert run.status == JobRunStatus.RUNNING
+        assert run.worker_id == "a"
+        assert run.attempts == 1
+
+    def test_expired_lease_is_reclaimed(self, db, tenant):
+        """Test a run stuck RUNNING past its lease goes to another worker"""
+        DistributedJobRunner.enqueue(db, "reminders_2h", SLOT, [tenant.id])
+        DistributedJobRunner(worker_id="a").claim(db, "reminders_2h", SLOT, limit=10)
+
+        db.query(JobRun).filter(JobRun.job_name == "reminders_2h").update(
+            {"claimed_at": datetime.now(timezone.utc) - timedelta(hours=1)},
+            synchronize_session=False
+        )
+
+        claimed = DistributedJobRunner(worker_id="b", lease_seconds=60).claim(db, "reminders_2h", SLOT, limit=10)
+
+        assert len(claimed) == 1
+
+    def test_attempts_are_capped(self, db, tenant):
+        """Test a run is not reclaimed after max attempts"""
+        DistributedJobRunner.enqueue(db, "reputation_recovery", SLOT, [tenant.id])
+        DistributedJobRunner(worker_id="a").claim(db, "reputation_recovery", SLOT, limit=10)
+
+        db.query(JobRun).filter(JobRun.job_name == "reputation_recovery").update(
+            {"claimed_at": datetime.now(timezone.utc) - timedelta(hours=1)},
+            synchronize_session=False
+        )
+
+        worker_b = DistributedJobRunner(worker_id="b", lease_seconds=60, max_attempts=1)
+
+        assert worker_b.claim(db, "reputation_recovery", SLOT, limit=10) == []
@@ -0,0 +1,93 @@
+"""
+Tests for HTTP caching of read endpoints
+Entity version counters and conditional GETs
+"""
+import pytest
+
+from src.services.entity_version_service import APPOINTMENTS, SERVICES, STAFF, EntityVersionService
+from src.services.no_show_service import NoShowService
+
+
+@pytest.fixture
+def widget_headers(tenant):
+    """Headers of a booking widget request resolved to the test tenant"""
+    return {"host": f"{tenant.subdomain}.petcare.local"}
+
+
+class TestEntityVersions:
+    """Test version counters bumped on save"""
+
+    def test_unwritten_kind_is_zero(self, db, tenant):
+        """Test kinds with no writes report version 0"""
+        assert EntityVersionService.get_versions(db, tenant.id, [SERVICES]) == {SERVICES: 0}
+
+    def test_insert_and_update_bump(self, db, tenant, service_factory):
+        """Test creating then changing a service bumps only the services version"""
+        service = service_factory(tenant.id)
+        created = EntityVersionService.get_versions(db, tenant.id, [SERVICES, STAFF])
+
+        service.price = service.price + 500
+        db.commit()
+        updated = EntityVersionService.get_versions(db, tenant.id, [SERVICES, STAFF])
+
+        assert created == {SERVICES: 1, STAFF: 0}
+        assert updated == {SERVICES: 2, STAFF: 0}
+
+    def test_other_tenant_unaffected(self, db, tenant, tenant_factory, service_factory):
+        """Test writes only bump the writing tenant's versions"""
+        other = tenant_factory()
+        service_factory(other.id)
+
+        assert EntityVersionService.get_versions(db, tenant.id, [SERVICES]) == {SERVICES: 0}
+
+    def test_core_no_show_marking_bumps(self, db, tenant, past_appointment_no_show):
+        """Test the bulk no-show update bumps the appointments version"""
+        before = EntityVersionService.get_versions(db, tenant.id, [APPOINTMENTS])[APPOINTMENTS]
+        NoShowService.mark_no_shows_batch(db, tenant.id)
+
+        assert EntityVersionService.get_versions(db, tenant.id, [APPOINTMENTS])[APPOINTMENTS] == before + 1
+
+
+class TestConditionalGet:
+    """Test ETag and Cache-Control on public widget reads"""
+
+    def test_public_list_tagged_and_cacheable(self, client, tenant, service_factory, widget_headers):
+        """Test the services list carries an ETag and public Cache-Control"""
+        service_factory(tenant.id)
+
+        response = client.get("/api/v1/services/", headers=widget_headers)
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+    def test_unchanged_returns_304(self, client, tenant, service_factory, widget_headers):
+        """Test echoing the ETag gets an empty 304"""
+        service_factory(tenant.id)
+        etag = client.get("/api/v1/services/", headers=widget_headers).headers["etag"]
+
+        response = client.get("/api/v1/services/", headers={**widget_headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_write_invalidates_etag(self, client, tenant, service_factory, widget_headers):
+        """Test a service change makes the old ETag stale"""
+        service_factory(tenant.id)
+        etag = client.get("/api/v1/services/", headers=widget_headers).headers["etag"]
+
+        service_factory(tenant.id, name="Nail Trim")
+        response = client.get("/api/v1/services/", headers={**widget_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+
+    def test_query_string_in_etag(self, client, tenant, service_factory, widget_headers):
+        """Test differently filtered lists get different ETags"""
+        service_factory(tenant.id)
+
+        all_services = client.get("/api/v1/services/", headers=widget_headers)
+        active = client.get("/api/v1/services/?is_active=true", headers=widget_headers)
+
+        assert all_services.headers["etag"] != active.headers["etag"]
@@ -14,6 +14,7 @@ from src.models.staff import Staff
 from src.models.service import Service
 from src.models.payment import Payment, PaymentStatus, PaymentType
 from src.services.no_show_service import NoShowService
+from src.models.sms_message import SmsMessage, SmsStatus
 
 
 @pytest.fixture
@@ -373,6 +374,32 @@ class TestGetNoShowHistory:
         assert len(history["recent_no_shows"]) == 0
 
 
+class TestUnpaidFeeBalance:
+    """Test the owner's stored unpaid no-show fee balance"""
+
+    def test_fee_added_and_waived(self, db, owner, past_appointment_no_arrival):
+        """Test the balance follows the fee payment through waiving"""
+        NoShowService.mark_as_no_show(db=db, appointment_id=past_appointment_no_arrival.id)
+
+        db.refresh(owner)
+        assert owner.unpaid_no_show_fees == NoShowService.PENALTY_SCHEDULE[1]
+        assert NoShowService.get_no_show_history(db=db, owner_id=owner.id)["unpaid_fees"] == owner.unpaid_no_show_fees
+
+        NoShowService.waive_no_show_fee(
+            db=db, appointment_id=past_appointment_no_arrival.id, reason="Emergency"
+        )
+
+        db.refresh(owner)
+        assert owner.unpaid_no_show_fees == 0
+
+    def test_batch_fees_counted(self, db, tenant, owner, past_appointment_no_arrival):
+        """Test bulk-inserted fees are included in the balance"""
+        NoShowService.mark_no_shows_batch(db, tenant.id)
+
+        db.refresh(owner)
+        assert owner.unpaid_no_show_fees == NoShowService.PENALTY_SCHEDULE[1]
+
+
 class TestCalculateNoShowRate:
     """Test no-show rate calculation"""
 
@@ -496,6 +523,78 @@ class TestGetHighRiskCustomers:
         assert len(high_risk) == 0
 
 
+class TestMarkNoShowsBatch:
+    """Test set-based no-show processing"""
+
+    def _past_appointment(self, db, tenant, owner, staff, service, hours_ago, **kwargs):
+        scheduled_time = datetime.utcnow() - timedelta(hours=hours_ago)
+        appointment = Appointment(
+            id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+            staff_id=staff.id, service_id=service.id,
+            status=AppointmentStatus.CONFIRMED,
+            scheduled_start=scheduled_time,
+            scheduled_end=scheduled_time + timedelta(hours=1),
+            is_no_show=False,
+            **kwargs
+        )
+        db.add(appointment)
+        db.commit()
+        return appointment
+
+    def test_escalating_fees_within_batch(self, db, tenant, owner, staff, service):
+        """Test each new no-show in the batch moves up the penalty schedule"""
+        owner.no_show_count = 1
+        db.commit()
+
+        earlier = self._past_appointment(db, tenant, owner, staff, service, hours_ago=5)
+        later = self._past_appointment(db, tenant, owner, staff, service, hours_ago=3)
+
+        results = NoShowService.mark_no_shows_batch(db, tenant.id)
+
+        assert results["total_detected"] == 2
+        assert results["fees_applied"] == 2
+        assert results["errors"] == 0
+
+        db.expire_all()
+        assert earlier.is_no_show is True
+        assert earlier.status == AppointmentStatus.NO_SHOW
+        assert earlier.no_show_fee_charged == NoShowService.PENALTY_SCHEDULE[2]
+        assert later.no_show_fee_charged == NoShowService.PENALTY_SCHEDULE[3]
+        assert owner.no_show_count == 3
+
+        fees = db.query(Payment).filter(
+            Payment.owner_id == owner.id,
+            Payment.type == PaymentType.NO_SHOW_FEE
+        ).all()
+        assert sorted(p.amount for p in fees) == [3500, 5000]
+
+    def test_arrived_and_upcoming_excluded(self, db, tenant, owner, staff, service):
+        """Test arrivals and appointments within grace period are untouched"""
+        self._past_appointment(
+            db, tenant, owner, staff, service, hours_ago=2,
+            arrived_at=datetime.utcnow() - timedelta(hours=2)
+        )
+        self._past_appointment(db, tenant, owner, staff, service, hours_ago=0)
+
+        results = NoShowService.mark_no_shows_batch(db, tenant.id)
+
+        assert results["total_detected"] == 0
+        assert db.query(SmsMessage).count() == 0
+
+    def test_notifications_written_to_outbox(self, db, tenant, owner, staff, service):
+        """Test opted-in owners get a queued SMS with their fee"""
+        appointment = self._past_appointment(db, tenant, owner, staff, service, hours_ago=2)
+
+        results = NoShowService.mark_no_shows_batch(db, tenant.id)
+
+        assert results["notifications_sent"] == 1
+        sms = db.query(SmsMessage).one()
+        assert sms.to_phone == owner.phone
+        assert sms.status == SmsStatus.QUEUED
+        assert sms.dedupe_key == f"no_show:{appointment.id}"
+        assert "$25.00" in sms.body
+
+
 class TestProcessDailyNoShowDetection:
     """Test daily no-show detection task"""
 
@@ -0,0 +1,151 @@
+"""
+Tests for Notification Schedule Service
+Precomputed reminder/alert due times and their dispatch
+"""
+import pytest
+from datetime import date, datetime, timedelta, timezone
+
+from src.models.appointment import AppointmentStatus
+from src.models.scheduled_notification import ScheduledNotification, ScheduledNotificationStatus
+from src.models.sms_message import SmsMessage
+from src.models.vaccination_record import VaccinationRecord, VaccinationType
+from src.services.notification_schedule_service import NotificationScheduleService
+
+
+@pytest.fixture
+def appointment_in(db, tenant, owner, staff, service, appointment_factory):
+    """Create an appointment starting the given number of hours from now"""
+    def _create(hours, **kwargs):
+        start = datetime.utcnow() + timedelta(hours=hours)
+        return appointment_factory(
+            tenant.id, owner.id, staff.id, service.id,
+            scheduled_start=start, scheduled_end=start + timedelta(hours=1), **kwargs
+        )
+    return _create
+
+
+@pytest.fixture
+def vaccination_expiring_in(db, tenant, pet):
+    """Create a vaccination record expiring the given number of days from today"""
+    def _create(days):
+        record = VaccinationRecord(
+            tenant_id=tenant.id,
+            pet_id=pet.id,
+            type=VaccinationType.RABIES,
+            administered_date=date.today() - timedelta(days=365 - days),
+            expiry_date=date.today() + timedelta(days=days)
+        )
+        db.add(record)
+        db.commit()
+        db.refresh(record)
+        return record
+    return _create
+
+
+def _scheduled(db, subject_id, status=ScheduledNotificationStatus.PENDING):
+    """Scheduled notifications of a subject by kind"""
+    rows = db.query(ScheduledNotification).filter(
+        ScheduledNotification.subject_id == subject_id,
+        ScheduledNotification.status == status
+    ).all()
+    return {row.kind: row for row in rows}
+
+
+class TestScheduling:
+    """Test due times written on save"""
+
+    def test_new_appointment_scheduled(self, db, appointment_in):
+        """Test both reminders are scheduled lead time before the start"""
+        appointment = appointment_in(48)
+
+        scheduled = _scheduled(db, appointment.id)
+
+        assert set(scheduled) == {"reminder_24h", "reminder_2h"}
+        due_24h = scheduled["reminder_24h"].due_at.replace(tzinfo=None)
+        assert abs(due_24h - (appointment.scheduled_start - timedelta(hours=24))) < timedelta(seconds=1)
+
+    def test_close_appointment_skips_24h(self, db, appointment_in):
+        """Test an appointment inside the 24h reminder's min lead only gets the 2h reminder"""
+        appointment = appointment_in(6)
+
+        assert set(_scheduled(db, appointment.id)) == {"reminder_2h"}
+
+    def test_reschedule_moves_due_time(self, db, appointment_in):
+        """Test rescheduling updates pending due times"""
+        appointment = appointment_in(48)
+
+        appointment.scheduled_start = appointment.scheduled_start + timedelta(days=1)
+        db.commit()
+
+        due_2h = _scheduled(db, appointment.id)["reminder_2h"].due_at.replace(tzinfo=None)
+        assert abs(due_2h - (appointment.scheduled_start - timedelta(hours=2))) < timedelta(seconds=1)
+
+    def test_cancel_cancels_pending(self, db, appointment_in):
+        """Test cancelling an appointment cancels its reminders"""
+        appointment = appointment_in(48)
+
+        appointment.status = AppointmentStatus.CANCELLED
+        db.commit()
+
+        assert _scheduled(db, appointment.id) == {}
+        assert len(_scheduled(db, appointment.id, ScheduledNotificationStatus.CANCELLED)) == 2
+
+    def test_vaccination_thresholds_scheduled(self, db, vaccination_expiring_in):
+        """Test a passed threshold is caught up now and later ones scheduled"""
+        record = vaccination_expiring_in(20)
+
+        scheduled = _scheduled(db, record.id)
+
+        assert set(scheduled) == {"vaccination_30d", "vaccination_14d", "vaccination_7d"}
+        assert scheduled["vaccination_30d"].due_at <= datetime.now(timezone.utc)
+
+    def test_only_nearest_passed_threshold_caught_up(self, db, vaccination_expiring_in):
+        """Test a record saved inside several thresholds gets one alert now"""
+        record = vaccination_expiring_in(5)
+
+        assert set(_scheduled(db, record.id)) == {"vaccination_7d"}
+
+    def test_expired_vaccination_not_scheduled(self, db, vaccination_expiring_in):
+        """Test records already expired get no alerts"""
+        record = vaccination_expiring_in(-1)
+
+        assert _scheduled(db, record.id) == {}
+
+
+class TestDispatchDue:
+    """Test dispatching due notifications"""
+
+    def test_due_reminder_queued_and_marked(self, db, appointment_in):
+        """Test a due reminder is queued once and marked dispatched"""
+        appointment = appointment_in(1)
+
+        first = NotificationScheduleService.dispatch_due(db)
+        second = NotificationScheduleService.dispatch_due(db)
+
+        assert first["reminders_sent"] == 1
+        assert second["claimed"] == 0
+        assert db.query(SmsMessage).count() == 1
+        assert "reminder_2h" in _scheduled(db, appointment.id, ScheduledNotificationStatus.DISPATCHED)
+
+    def test_future_reminder_not_dispatched(self, db, appointment_in):
+        """Test reminders not yet due are left pending"""
+        appointment_in(48)
+
+        results = NotificationScheduleService.dispatch_due(db)
+
+        assert results["claimed"] == 0
+        assert db.query(SmsMessage).count() == 0
+
+    def test_due_vaccination_alert_queued(self, db, vaccination_expiring_in):
+        """Test a due expiry alert is queued and flags the record"""
+        record = vaccination_expiring_in(7)
+        db.query(ScheduledNotification).filter(
+            ScheduledNotification.subject_id == record.id
+        ).update({"due_at": datetime.utcnow() - timedelta(minutes=1)})
+        db.commit()
+
+        results = NotificationScheduleService.dispatch_due(db)
+
+        assert results["alerts_sent"] == 1
+        db.refresh(record)
+        assert record.reminder_sent_7d is True
@@ -0,0 +1,100 @@
+"""
+Tests for owner search
+Normalized trigram matching for list and staff typeahead search
+"""
+from datetime import datetime, timezone
+
+from src.core.search import normalize_search_terms
+from src.services.owner_service import OwnerService
+
+
+class TestNormalizeSearchTerms:
+    """Test search term normalization"""
+
+    def test_words_lowercased_and_split(self):
+        """Test names become lowercase tokens"""
+        assert normalize_search_terms("  John SMITH ") == ["john", "smith"]
+
+    def test_phone_reduced_to_digits(self):
+        """Test formatted phone numbers become one digits token"""
+        assert normalize_search_terms("(555) 123-4567") == ["5551234567"]
+
+    def test_short_number_not_searched(self):
+        """Test too few digits are neither a phone number nor a token"""
+        assert normalize_search_terms("12") == []
+
+    def test_short_tokens_dropped(self):
+        """Test tokens too short for a trigram are dropped"""
+        assert normalize_search_terms("Jo Smith") == ["smith"]
+
+    def test_blank_has_no_tokens(self):
+        """Test blank input yields no tokens"""
+        assert normalize_search_terms("   ") == []
+
+
+class TestSearchOwners:
+    """Test typeahead owner search"""
+
+    def test_matches_name_prefix(self, db, tenant, owner_factory):
+        """Test a partial first name finds the owner"""
+        match = owner_factory(tenant.id, first_name="Jonathan", last_name="Reyes")
+        owner_factory(tenant.id, first_name="Maria", last_name="Lopez")
+
+        results = OwnerService.search_owners(db, tenant, "jon")
+
+        assert [r.id for r in results] == [match.id]
+
+    def test_matches_phone_ignoring_format(self, db, tenant, owner_factory):
+        """Test phone search matches on digits regardless of punctuation"""
+        match = owner_factory(tenant.id, phone="+1 (555) 867-5309")
+
+        results = OwnerService.search_owners(db, tenant, "555-867")
+
+        assert [r.id for r in results] == [match.id]
+
+    def test_all_tokens_must_match(self, db, tenant, owner_factory):
+        """Test multi-word searches narrow results"""
+        match = owner_factory(tenant.id, first_name="Ann", last_name="Baker")
+        owner_factory(tenant.id, first_name="Ann", last_name="Carter")
+
+        results = OwnerService.search_owners(db, tenant, "ann bak")
+
+        assert [r.id for r in results] == [match.id]
+
+    def test_other_tenant_excluded(self, db, tenant, tenant_factory, owner_factory):
+        """Test results are limited to the tenant"""
+        other = tenant_factory()
+        owner_factory(other.id, first_name="Zelda")
+
+        assert OwnerService.search_owners(db, tenant, "zelda") == []
+
+    def test_limit_applied(self, db, tenant, owner_factory):
+        """Test the result count is capped"""
+        for _ in range(5):
+            owner_factory(tenant.id, last_name="Nguyen")
+
+        assert len(OwnerService.search_owners(db, tenant, "nguyen", limit=3)) == 3
+
+    def test_short_input_returns_nothing(self, db, tenant, owner_factory):
+        """Test input with no trigram-sized token matches nothing"""
+        owner_factory(tenant.id, first_name="John")
+
+        assert OwnerService.search_owners(db, tenant, "jo") == []
+
+    def test_deleted_owner_excluded(self, db, tenant, owner_factory):
+        """Test soft-deleted owners are not returned"""
+        owner_factory(tenant.id, last_name="Okafor", deleted_at=datetime.now(timezone.utc))
+
+        assert OwnerService.search_owners(db, tenant, "okafor") == []
+
+
+class TestSearchOwnersEndpoint:
+    """Test access to the typeahead endpoint"""
+
+    def test_requires_authentication(self, client, tenant, owner_factory):
+        """Test unauthenticated callers cannot search customers"""
+        owner_factory(tenant.id, last_name="Nguyen")
+
+        response = client.get("/api/v1/owners/search?q=nguyen")
+
+        assert response.status_code == 403
@@ -0,0 +1,140 @@
+"""
+Tests for keyset pagination
+Cursor encoding and seek-based paging used by list endpoints
+"""
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+from fastapi import Response
+
+from src.core.pagination import (
+    NEXT_CURSOR_HEADER, encode_cursor, decode_cursor, paginate_keyset, paginate_rows, row_sort_key
+)
+from src.models.appointment import Appointment
+from src.models.payment import Payment
+from src.models.resource import Resource
+
+
+class TestCursorEncoding:
+    """Test opaque cursor round-tripping"""
+
+    def test_round_trip_preserves_types(self):
+        """Test decoded values match the column types"""
+        scheduled = datetime(2025, 11, 15, 10, 30)
+        appointment_id = uuid4()
+
+        cursor = encode_cursor([scheduled, appointment_id])
+        values = decode_cursor(cursor, [Appointment.scheduled_start, Appointment.id])
+
+        assert values == [scheduled, appointment_id]
+
+    def test_cursor_is_url_safe(self):
+        """Test cursor can be passed as a query parameter unescaped"""
+        cursor = encode_cursor([datetime.utcnow(), uuid4()])
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_invalid_cursor_rejected(self):
+        """Test garbage cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", [Appointment.scheduled_start, Appointment.id])
+
+    def test_cursor_for_different_keys_rejected(self):
+        """Test cursor with wrong number of values raises ValueError"""
+        cursor = encode_cursor([uuid4()])
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, [Appointment.scheduled_start, Appointment.id])
+
+
+class TestPaginateKeyset:
+    """Test seek-based paging"""
+
+    def test_pages_cover_all_rows_without_duplicates(self, db, tenant, owner, staff, service, appointment_factory):
+        """Test walking all pages returns every row exactly once in order"""
+        base = datetime.utcnow() + timedelta(days=1)
+        created = [
+            appointment_factory(
+                tenant.id, owner.id, staff.id, service.id,
+                scheduled_start=base + timedelta(hours=i),
+                scheduled_end=base + timedelta(hours=i, minutes=30)
+            )
+            for i in range(7)
+        ]
+
+        query = db.query(Appointment).filter(Appointment.tenant_id == tenant.id)
+        keys = [Appointment.scheduled_start, Appointment.id]
+
+        seen = []
+        cursor = None
+        while True:
+            rows, cursor = paginate_keyset(query, keys, cursor, limit=3)
+            seen.extend(rows)
+            if not cursor:
+                break
+
+        assert [a.id for a in seen] == [a.id for a in created]
+
+    def test_descending_pages(self, db, tenant, owner, payment_factory):
+        """Test descending pagination returns newest first"""
+        now = datetime.utcnow()
+        for i in range(5):
+            payment_factory(tenant.id, owner.id, created_at=now - timedelta(minutes=i))
+
+        query = db.query(Payment).filter(Payment.tenant_id == tenant.id)
+        keys = [Payment.created_at, Payment.id]
+
+        first_page, cursor = paginate_keyset(query, keys, None, limit=2, descending=True)
+        second_page, _ = paginate_keyset(query, keys, cursor, limit=2, descending=True)
+
+        assert first_page[0].created_at > first_page[1].created_at
+        assert first_page[1].created_at > second_page[0].created_at
+
+    def test_last_page_has_no_cursor(self, db, tenant, owner, payment_factory):
+        """Test next cursor is None when no rows remain"""
+        payment_factory(tenant.id, owner.id)
+
+        query = db.query(Payment).filter(Payment.tenant_id == tenant.id)
+        rows, cursor = paginate_keyset(query, [Payment.created_at, Payment.id], None, limit=10)
+
+        assert len(rows) == 1
+        assert cursor is None
+
+
+class TestPaginateRows:
+    """Test cursor paging over in-memory rows"""
+
+    KEYS = [Resource.display_order, Resource.name, Resource.id]
+
+    def _rows(self):
+        rows = [
+            SimpleNamespace(display_order=order, name=name, id=uuid4())
+            for order, name in [(1, "Van"), (0, "Table B"), (0, "Table A"), (2, "Room")]
+        ]
+        return sorted(rows, key=row_sort_key(self.KEYS))
+
+    def test_pages_cover_all_rows_without_duplicates(self):
+        """Test following X-Next-Cursor visits every row once, in key order"""
+        rows = self._rows()
+        seen, cursor = [], None
+
+        while True:
+            response = Response()
+            page = paginate_rows(rows, self.KEYS, response, cursor=cursor, limit=3)
+            seen.extend(page)
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                break
+
+        assert [row.name for row in seen] == ["Table A", "Table B", "Van", "Room"]
+
+    def test_nulls_sort_last(self):
+        """Test None keys order after values, as in Postgres"""
+        rows = [SimpleNamespace(display_order=None, name="Cage", id=uuid4())] + self._rows()
+
+        ordered = sorted(rows, key=row_sort_key(self.KEYS))
+
+        assert ordered[-1].name == "Cage"
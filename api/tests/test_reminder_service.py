@@ -0,0 +1,97 @@
+"""
+Tests for Reminder Service
+Claiming due reminders and queueing them in the SMS outbox
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from src.models.sms_message import SmsMessage
+from src.services.reminder_service import ReminderService
+
+
+@pytest.fixture
+def appointment_in(db, tenant, owner, staff, service, appointment_factory):
+    """Create an appointment starting the given number of hours from now"""
+    def _create(hours, **kwargs):
+        start = datetime.utcnow() + timedelta(hours=hours)
+        return appointment_factory(
+            kwargs.pop("tenant_id", tenant.id), kwargs.pop("owner_id", owner.id), staff.id, service.id,
+            scheduled_start=start, scheduled_end=start + timedelta(hours=1),
+            pet_ids=kwargs.pop("pet_ids", []), **kwargs
+        )
+    return _create
+
+
+class TestDispatchReminders:
+    """Test claiming and queueing reminders of due appointments"""
+
+    def test_appointment_reminded_once(self, db, appointment_in):
+        """Test a second dispatch does not queue the same reminder again"""
+        appointment = appointment_in(20)
+
+        first = ReminderService.dispatch_reminders(db, "24h", [appointment.id])
+        second = ReminderService.dispatch_reminders(db, "24h", [appointment.id])
+        db.commit()
+
+        assert first == 1
+        assert second == 0
+        db.refresh(appointment)
+        assert appointment.reminder_24h_sent_at is not None
+        assert db.query(SmsMessage).count() == 1
+
+    def test_within_min_lead_skipped(self, db, appointment_in):
+        """Test appointments too close for the reminder are skipped"""
+        appointment = appointment_in(6)
+
+        assert ReminderService.dispatch_reminders(db, "24h", [appointment.id]) == 0
+
+    def test_opted_out_owner_skipped(self, db, tenant, owner_factory, appointment_in):
+        """Test owners without SMS consent are not claimed"""
+        opted_out = owner_factory(tenant.id, sms_opted_in=False)
+        appointment = appointment_in(1, owner_id=opted_out.id)
+
+        queued = ReminderService.dispatch_reminders(db, "2h", [appointment.id])
+        db.commit()
+
+        assert queued == 0
+        db.refresh(appointment)
+        assert appointment.reminder_2h_sent_at is None
+
+    def test_several_tenants(self, db, tenant_factory, owner_factory, appointment_in):
+        """Test one dispatch covers appointments of every tenant"""
+        appointment_ids = []
+        for _ in range(3):
+            other = tenant_factory()
+            other_owner = owner_factory(other.id)
+            appointment_ids.append(appointment_in(1, tenant_id=other.id, owner_id=other_owner.id).id)
+
+        assert ReminderService.dispatch_reminders(db, "2h", appointment_ids) == 3
+
+    def test_message_includes_pet_names(self, db, tenant, owner, pet_factory, appointment_in):
+        """Test pet names are rendered from the appointment's pets"""
+        buddy = pet_factory(tenant.id, owner.id, name="Buddy")
+        max_ = pet_factory(tenant.id, owner.id, name="Max")
+        appointment = appointment_in(1, pet_ids=[buddy.id, max_.id])
+
+        ReminderService.dispatch_reminders(db, "2h", [appointment.id])
+        db.commit()
+
+        body = db.query(SmsMessage).one().body
+        assert "Buddy" in body and "Max" in body
+
+    def test_reschedule_clears_stamp(self, db, appointment_in):
+        """Test moving an appointment makes it due for reminders again"""
+        appointment = appointment_in(1)
+        ReminderService.dispatch_reminders(db, "2h", [appointment.id])
+        db.commit()
+        db.refresh(appointment)
+
+        appointment.scheduled_start = appointment.scheduled_start + timedelta(minutes=30)
+        db.commit()
+
+        assert ReminderService.dispatch_reminders(db, "2h", [appointment.id]) == 1
+
+    def test_unknown_kind(self, db):
+        """Test unknown reminder kinds are rejected"""
+        with pytest.raises(ValueError):
+            ReminderService.dispatch_reminders(db, "1w", [])
@@ -476,6 +476,27 @@ class TestGetTopCustomers:
         assert top_customers[1]["total_spent"] == 20000  # $200
         assert top_customers[2]["total_spent"] == 15000  # $150
 
+    def test_top_customers_not_inflated_by_appointments(self, db, tenant, owner):
+        """Test multiple appointments don't multiply payment totals"""
+        for _ in range(3):
+            db.add(Appointment(
+                id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+                scheduled_start=datetime.utcnow(),
+                scheduled_end=datetime.utcnow() + timedelta(hours=1),
+                status=AppointmentStatus.COMPLETED
+            ))
+        for amount in (5000, 3000):
+            db.add(Payment(
+                id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+                amount=amount, status=PaymentStatus.SUCCEEDED, method="card"
+            ))
+        db.commit()
+
+        top_customers = ReportingService.get_top_customers(db=db, tenant_id=tenant.id)
+
+        assert top_customers[0]["total_spent"] == 8000
+        assert top_customers[0]["appointment_count"] == 3
+
 
 class TestGetCustomerRetentionReport:
     """Test customer retention reporting"""
@@ -525,6 +546,87 @@ class TestGetCustomerRetentionReport:
         assert report["repeat_customers"] >= 1  # At least the one we created
         assert report["total_customers"] >= 4
 
+    def test_retained_and_churned_customers(self, db, tenant):
+        """Test customers seen before the period are split into retained and churned"""
+        last_month = datetime.utcnow() - timedelta(days=45)
+        owners = []
+        for i in range(2):
+            owner = Owner(
+                id=uuid4(), tenant_id=tenant.id,
+                first_name=f"Returning{i}", last_name="Customer",
+                email=f"returning{i}@test.com", phone=f"+222222222{i}",
+                created_at=last_month
+            )
+            db.add(owner)
+            db.add(Appointment(
+                id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+                scheduled_start=last_month,
+                scheduled_end=last_month + timedelta(hours=1),
+                status=AppointmentStatus.COMPLETED
+            ))
+            owners.append(owner)
+
+        # Only the first returns during the period
+        db.add(Appointment(
+            id=uuid4(), tenant_id=tenant.id, owner_id=owners[0].id,
+            scheduled_start=datetime.utcnow(),
+            scheduled_end=datetime.utcnow() + timedelta(hours=1),
+            status=AppointmentStatus.COMPLETED
+        ))
+        db.commit()
+
+        today = date.today()
+        report = ReportingService.get_customer_retention_report(
+            db=db,
+            tenant_id=tenant.id,
+            start_date=today - timedelta(days=7),
+            end_date=today
+        )
+
+        assert report["new_customers"] == 0
+        assert report["active_customers"] == 1
+        assert report["retained_customers"] == 1
+        assert report["churned_customers"] == 1
+        assert report["retention_rate"] == 50.0
+
+
+class TestGetCohortRetentionReport:
+    """Test cohort retention by signup month"""
+
+    def test_cohort_retention(self, db, tenant):
+        """Test signup month cohorts and month-0 activity"""
+        for i in range(4):
+            owner = Owner(
+                id=uuid4(), tenant_id=tenant.id,
+                first_name=f"Cohort{i}", last_name="Customer",
+                email=f"cohort{i}@test.com", phone=f"+333333333{i}",
+                created_at=datetime.utcnow()
+            )
+            db.add(owner)
+            if i < 3:
+                db.add(Appointment(
+                    id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+                    scheduled_start=datetime.utcnow(),
+                    scheduled_end=datetime.utcnow() + timedelta(hours=1),
+                    status=AppointmentStatus.COMPLETED
+                ))
+        db.commit()
+
+        today = date.today()
+        report = ReportingService.get_cohort_retention_report(
+            db=db,
+            tenant_id=tenant.id,
+            start_date=today.replace(day=1),
+            end_date=today
+        )
+
+        assert len(report["cohorts"]) == 1
+        cohort = report["cohorts"][0]
+        assert cohort["cohort"] == today.strftime("%Y-%m")
+        assert cohort["customers"] == 4
+        assert cohort["retention"][0]["active_customers"] == 3
+        assert cohort["retention"][0]["retention_rate"] == 75.0
+
 
 class TestGetStaffPerformance:
     """Test staff performance reporting"""
@@ -605,6 +707,74 @@ class TestGetStaffPerformance:
 
 
 # Integration tests
+class TestGetTeamPerformance:
+    """Test team-wide staff performance reporting"""
+
+    def test_team_performance(self, db, tenant, owner, service, staff_factory):
+        """Test per-staff totals, revenue and no-show rate"""
+        busy = staff_factory(tenant.id, first_name="Busy")
+        idle = staff_factory(tenant.id, first_name="Idle")
+
+        statuses = [AppointmentStatus.COMPLETED] * 3 + [AppointmentStatus.NO_SHOW]
+        for i, appt_status in enumerate(statuses):
+            scheduled = datetime.utcnow() - timedelta(days=i + 1)
+            appt = Appointment(
+                id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+                staff_id=busy.id, service_id=service.id, status=appt_status,
+                scheduled_start=scheduled,
+                scheduled_end=scheduled + timedelta(hours=1)
+            )
+            db.add(appt)
+            if appt_status == AppointmentStatus.COMPLETED:
+                db.add(Payment(
+                    id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+                    appointment_id=appt.id, amount=6000,
+                    status=PaymentStatus.SUCCEEDED, method="card"
+                ))
+        db.commit()
+
+        team = ReportingService.get_team_performance(
+            db=db,
+            tenant_id=tenant.id,
+            start_date=(datetime.utcnow() - timedelta(days=7)).date(),
+            end_date=datetime.utcnow().date()
+        )
+
+        by_id = {t["staff_id"]: t for t in team}
+        assert team[0]["staff_id"] == str(busy.id)
+        assert by_id[str(busy.id)]["total_appointments"] == 4
+        assert by_id[str(busy.id)]["completion_rate"] == 75.0
+        assert by_id[str(busy.id)]["no_show_rate"] == 25.0
+        assert by_id[str(busy.id)]["total_revenue"] == 18000
+        assert by_id[str(busy.id)]["average_ticket"] == 6000
+        assert by_id[str(idle.id)]["total_appointments"] == 0
+
+    def test_team_utilization(self, db, tenant, owner, service, staff_factory):
+        """Test utilization compares booked minutes to scheduled minutes"""
+        monday = date(2025, 11, 3)
+        groomer = staff_factory(tenant.id, schedule={
+            "monday": {"start": "09:00", "end": "17:00", "breaks": [{"start": "12:00", "end": "13:00"}]}
+        })
+
+        start = datetime.combine(monday, datetime.min.time()).replace(hour=9)
+        db.add(Appointment(
+            id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+            staff_id=groomer.id, service_id=service.id,
+            status=AppointmentStatus.COMPLETED,
+            scheduled_start=start,
+            scheduled_end=start + timedelta(minutes=210)
+        ))
+        db.commit()
+
+        team = ReportingService.get_team_performance(
+            db=db, tenant_id=tenant.id, start_date=monday, end_date=monday
+        )
+
+        assert team[0]["scheduled_minutes"] == 420
+        assert team[0]["booked_minutes"] == 210
+        assert team[0]["utilization_rate"] == 50.0
+
+
 class TestReportingServiceIntegration:
     """Integration tests for reporting service"""
 
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from src.models.owner import Owner
 from src.models.appointment import Appointment, AppointmentStatus
+from src.models.reputation_event import ReputationEvent
 from src.models.tenant import Tenant
 from src.services.reputation_service import ReputationService, ReputationEventType
 
@@ -190,6 +191,119 @@ class TestUpdateReputationAfterEvent:
             )
 
 
+class TestReputationLedger:
+    """Test the append-only event ledger"""
+
+    def test_event_appended(self, db, owner):
+        """Test each event is written to the ledger with its points"""
+        ReputationService.update_reputation_after_event(
+            db=db, owner_id=owner.id, event_type=ReputationEventType.NO_SHOW
+        )
+
+        event = db.query(ReputationEvent).filter(ReputationEvent.owner_id == owner.id).one()
+        assert event.event_type == ReputationEventType.NO_SHOW
+        assert event.points == -20
+        assert event.tenant_id == owner.tenant_id
+
+    def test_same_appointment_event_counted_once(self, db, tenant, owner):
+        """Test recording an appointment's event twice has no further effect"""
+        appointment = Appointment(
+            id=uuid4(),
+            tenant_id=tenant.id,
+            owner_id=owner.id,
+            scheduled_start=datetime.utcnow() - timedelta(days=1),
+            scheduled_end=datetime.utcnow() - timedelta(days=1, hours=-1),
+            status=AppointmentStatus.NO_SHOW
+        )
+        db.add(appointment)
+        db.commit()
+
+        for _ in range(2):
+            ReputationService.update_reputation_after_event(
+                db=db, owner_id=owner.id, event_type=ReputationEventType.NO_SHOW, appointment_id=appointment.id
+            )
+
+        db.refresh(owner)
+        assert owner.no_show_count == 1
+        assert owner.reputation_score == 80
+
+    def test_batch_applies_per_owner(self, db, tenant, owner):
+        """Test a batch updates each owner's score and counters once"""
+        recorded = ReputationService.record_events_batch(db, [
+            {"tenant_id": tenant.id, "owner_id": owner.id, "event_type": ReputationEventType.NO_SHOW},
+            {"tenant_id": tenant.id, "owner_id": owner.id, "event_type": ReputationEventType.LATE_CANCELLATION},
+        ])
+        db.commit()
+
+        assert recorded == 2
+        db.refresh(owner)
+        assert owner.reputation_score == 70
+        assert owner.no_show_count == 1
+        assert owner.late_cancellation_count == 1
+
+    def test_rebuild_replays_ledger(self, db, owner):
+        """Test a rebuild reproduces scores and counters from the events"""
+        for event_type in (ReputationEventType.NO_SHOW, ReputationEventType.NO_SHOW,
+                           ReputationEventType.COMPLETED_APPOINTMENT):
+            ReputationService.update_reputation_after_event(db=db, owner_id=owner.id, event_type=event_type)
+        ReputationService.record_event(db, owner.id, ReputationEventType.RECOVERY, points=5)
+        db.commit()
+
+        owner.reputation_score = 0
+        owner.no_show_count = 9
+        db.commit()
+
+        results = ReputationService.rebuild_from_ledger(db, tenant_id=owner.tenant_id)
+
+        assert results["events_replayed"] == 4
+        db.refresh(owner)
+        assert owner.reputation_score == 67  # 100 - 40 + 2 + 5
+        assert owner.no_show_count == 2
+        assert owner.completed_appointment_count == 1
+
+    def test_rebuild_resets_owners_without_events(self, db, owner):
+        """Test owners with no ledger history return to the defaults"""
+        owner.reputation_score = 40
+        db.commit()
+
+        results = ReputationService.rebuild_from_ledger(db)
+
+        assert results["owners_reset"] == 1
+        db.refresh(owner)
+        assert owner.reputation_score == ReputationService.DEFAULT_SCORE
+
+    def test_rebuild_across_chunks(self, db, tenant, owner_factory):
+        """Test every owner is rebuilt when the owners span several chunks"""
+        penalized = owner_factory(tenant.id)
+        untouched = owner_factory(tenant.id, reputation_score=40)
+        ReputationService.record_event(db, penalized.id, ReputationEventType.NO_SHOW)
+        db.commit()
+
+        results = ReputationService.rebuild_from_ledger(db, tenant_id=tenant.id, chunk_size=1)
+
+        assert results["owners_rebuilt"] == 1
+        assert results["owners_reset"] == 1
+        db.refresh(penalized)
+        db.refresh(untouched)
+        assert penalized.reputation_score == 80
+        assert untouched.reputation_score == ReputationService.DEFAULT_SCORE
+
+    def test_history_newest_first(self, db, owner):
+        """Test history lists events newest first"""
+        ReputationService.update_reputation_after_event(
+            db=db, owner_id=owner.id, event_type=ReputationEventType.NO_SHOW
+        )
+        ReputationService.update_reputation_after_event(
+            db=db, owner_id=owner.id, event_type=ReputationEventType.COMPLETED_APPOINTMENT
+        )
+
+        history = ReputationService.get_reputation_history(db, owner.id)
+
+        assert [e["event_type"] for e in history] == [
+            ReputationEventType.COMPLETED_APPOINTMENT, ReputationEventType.NO_SHOW
+        ]
+
+
 class TestCanBookAppointment:
     """Test booking restriction logic"""
 
@@ -244,6 +358,61 @@ class TestCanBookAppointment:
         assert can_book is False
         assert "not found" in reason.lower()
 
+    def test_cannot_book_when_blocked(self, db, owner):
+        """Test blocked customer cannot book regardless of score"""
+        owner.is_blocked = True
+        db.commit()
+
+        can_book, reason = ReputationService.can_book_appointment(db=db, owner_id=owner.id)
+
+        assert can_book is False
+        assert "blocked" in reason.lower()
+
+    def test_cannot_book_with_unpaid_fees(self, db, owner):
+        """Test customer with an unpaid no-show fee balance cannot book"""
+        owner.unpaid_no_show_fees = 2500
+        db.commit()
+
+        can_book, reason = ReputationService.can_book_appointment(db=db, owner_id=owner.id)
+
+        assert can_book is False
+        assert "$25.00" in reason
+
+    def test_eligibility_from_loaded_owner(self, owner):
+        """Test the gate reads only the loaded owner's columns"""
+        owner.reputation_score = 20
+
+        can_book, reason = ReputationService.check_booking_eligibility(owner)
+
+        assert can_book is False
+        assert "too low" in reason.lower()
+
+
+class TestPublicBookingGate:
+    """Test what the booking widget learns when the gate refuses a booking"""
+
+    def test_reason_not_disclosed(self, client, db, tenant, owner):
+        """Test the public endpoint returns a generic refusal without score or balance"""
+        owner.reputation_score = 20
+        owner.unpaid_no_show_fees = 2500
+        db.commit()
+        start = datetime.utcnow() + timedelta(days=1)
+
+        response = client.post(
+            "/api/v1/appointments/",
+            headers={"host": f"{tenant.subdomain}.petcare.local"},
+            json={
+                "owner_id": str(owner.id),
+                "pet_ids": [],
+                "service_id": str(uuid4()),
+                "scheduled_start": start.isoformat(),
+                "scheduled_end": (start + timedelta(hours=1)).isoformat()
+            }
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == ReputationService.BOOKING_DENIED_MESSAGE
+
 
 class TestGetReputationSummary:
     """Test getting reputation summary"""
@@ -397,6 +566,65 @@ class TestApplyScoreDecay:
         assert owner.reputation_score == 100  # Capped at max
 
 
+class TestRecoverScores:
+    """Test set-based recovery across tenants"""
+
+    @pytest.fixture
+    def recoverable(self, owner_factory):
+        """Create an owner due for recovery"""
+        def _create(tenant_id, score=60):
+            return owner_factory(
+                tenant_id,
+                reputation_score=score,
+                last_reputation_update=datetime.utcnow() - timedelta(days=100)
+            )
+        return _create
+
+    def test_all_tenants_counted_per_tenant(self, db, tenant_factory, recoverable):
+        """Test one run recovers every tenant and reports counts per tenant"""
+        first, second = tenant_factory(), tenant_factory()
+        recoverable(first.id)
+        recoverable(first.id)
+        recoverable(second.id)
+
+        results = ReputationService.recover_scores(db)
+
+        assert results["scores_improved"] == 3
+        assert results["tenant_results"] == {str(first.id): 2, str(second.id): 1}
+
+    def test_chunks_cover_everyone_once(self, db, tenant, recoverable):
+        """Test small chunks still improve each owner exactly once"""
+        owners = [recoverable(tenant.id) for _ in range(5)]
+
+        results = ReputationService.recover_scores(db, tenant_id=tenant.id, chunk_size=2)
+
+        assert results["chunks"] == 3
+        assert results["scores_improved"] == 5
+        for owner in owners:
+            db.refresh(owner)
+            assert owner.reputation_score == 65
+
+    def test_resume_after_owner(self, db, tenant, recoverable):
+        """Test start_after skips owners at or before the given ID"""
+        owners = sorted((recoverable(tenant.id) for _ in range(3)), key=lambda o: o.id)
+
+        results = ReputationService.recover_scores(db, tenant_id=tenant.id, start_after=owners[0].id)
+
+        assert results["scores_improved"] == 2
+        assert results["last_owner_id"] == owners[-1].id
+        db.refresh(owners[0])
+        assert owners[0].reputation_score == 60
+
+    def test_rerun_is_noop(self, db, tenant, recoverable):
+        """Test recovered owners are not eligible again right away"""
+        recoverable(tenant.id)
+        ReputationService.recover_scores(db, tenant_id=tenant.id)
+
+        results = ReputationService.recover_scores(db, tenant_id=tenant.id)
+
+        assert results["customers_checked"] == 0
+
+
 class TestGetCustomersByReputation:
     """Test filtering customers by reputation category"""
 
@@ -456,6 +684,64 @@ class TestGetCustomersByReputation:
         assert len(customers) == 0
 
 
+class TestListCustomerRisk:
+    """Test the grouped, paginated customer risk list"""
+
+    def _owner(self, db, tenant, **kwargs):
+        owner = Owner(
+            id=uuid4(), tenant_id=tenant.id, first_name="Risk", last_name="Customer",
+            email=f"risk{uuid4().hex[:8]}@test.com", phone="+4444444444", **kwargs
+        )
+        db.add(owner)
+        db.commit()
+        return owner
+
+    def _appointments(self, db, tenant, owner, total, no_shows):
+        for i in range(total):
+            start = datetime.utcnow() - timedelta(days=i + 1)
+            db.add(Appointment(
+                id=uuid4(), tenant_id=tenant.id, owner_id=owner.id,
+                status=AppointmentStatus.NO_SHOW if i < no_shows else AppointmentStatus.COMPLETED,
+                scheduled_start=start, scheduled_end=start + timedelta(hours=1),
+                is_no_show=i < no_shows
+            ))
+        db.commit()
+
+    def test_counts_and_rate(self, db, tenant):
+        """Test totals and rate come back with the owner"""
+        owner = self._owner(db, tenant, no_show_count=1)
+        self._appointments(db, tenant, owner, total=4, no_shows=1)
+
+        customers, next_cursor = ReputationService.list_customer_risk(db=db, tenant_id=tenant.id)
+
+        assert next_cursor is None
+        assert customers[0]["total_appointments"] == 4
+        assert customers[0]["no_show_appointments"] == 1
+        assert customers[0]["no_show_rate"] == 25.0
+
+    def test_sorted_by_rate_across_pages(self, db, tenant):
+        """Test rate sort is applied in the database across pages"""
+        low = self._owner(db, tenant)
+        high = self._owner(db, tenant)
+        self._appointments(db, tenant, low, total=4, no_shows=1)
+        self._appointments(db, tenant, high, total=2, no_shows=1)
+
+        first, cursor = ReputationService.list_customer_risk(
+            db=db, tenant_id=tenant.id, sort_by="no_show_rate", limit=1
+        )
+        second, _ = ReputationService.list_customer_risk(
+            db=db, tenant_id=tenant.id, sort_by="no_show_rate", cursor=cursor, limit=1
+        )
+
+        assert first[0]["owner_id"] == str(high.id)
+        assert second[0]["owner_id"] == str(low.id)
+
+    def test_invalid_sort_rejected(self, db, tenant):
+        """Test unknown sort columns raise ValueError"""
+        with pytest.raises(ValueError):
+            ReputationService.list_customer_risk(db=db, tenant_id=tenant.id, sort_by="email")
+
+
 class TestReputationEventType:
     """Test reputation event types and points"""
 
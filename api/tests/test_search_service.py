@@ -0,0 +1,89 @@
+"""
+Tests for Search Service
+Front desk search over owners, pets and upcoming appointments
+"""
+from datetime import datetime, timedelta
+
+from src.models.appointment import AppointmentStatus
+from src.services.search_service import SearchService
+
+
+class TestSearch:
+    """Test grouped cross-entity search"""
+
+    def test_pet_name_finds_pet_and_appointment(self, db, tenant, owner, staff, service, pet_factory, appointment_factory):
+        """Test a pet name matches the pet and its upcoming appointment"""
+        pet = pet_factory(tenant.id, owner.id, name="Biscuit")
+        appointment = appointment_factory(tenant.id, owner.id, staff.id, service.id, pet_ids=[pet.id])
+
+        results = SearchService.search(db, tenant.id, "bisc")
+
+        assert [r["id"] for r in results["pets"]] == [str(pet.id)]
+        assert [r["id"] for r in results["appointments"]] == [str(appointment.id)]
+        assert results["owners"] == []
+
+    def test_microchip_number_matches(self, db, tenant, owner, pet_factory):
+        """Test pets are found by microchip number"""
+        pet = pet_factory(tenant.id, owner.id, microchip_number="985112003456789")
+
+        results = SearchService.search(db, tenant.id, "985112003")
+
+        assert [r["id"] for r in results["pets"]] == [str(pet.id)]
+
+    def test_owner_rename_reindexes_pets(self, db, tenant, owner, pet_factory):
+        """Test pet entries follow their owner's name"""
+        pet = pet_factory(tenant.id, owner.id)
+
+        owner.last_name = "Featherstone"
+        db.commit()
+
+        results = SearchService.search(db, tenant.id, "featherstone")
+
+        assert [r["id"] for r in results["owners"]] == [str(owner.id)]
+        assert "Featherstone" in results["pets"][0]["subtitle"]
+        assert results["pets"][0]["id"] == str(pet.id)
+
+    def test_cancelled_and_past_appointments_excluded(self, db, tenant, owner, staff, service, pet, appointment_factory):
+        """Test only upcoming, active appointments are returned"""
+        cancelled = appointment_factory(tenant.id, owner.id, staff.id, service.id, pet_ids=[pet.id])
+        cancelled.status = AppointmentStatus.CANCELLED
+        db.commit()
+        past = datetime.utcnow() - timedelta(days=1)
+        appointment_factory(
+            tenant.id, owner.id, staff.id, service.id, pet_ids=[pet.id],
+            scheduled_start=past, scheduled_end=past + timedelta(hours=1)
+        )
+
+        results = SearchService.search(db, tenant.id, "grooming")
+
+        assert results["appointments"] == []
+
+    def test_limit_per_group(self, db, tenant, owner, pet_factory):
+        """Test each group is cut to the limit"""
+        for _ in range(4):
+            pet_factory(tenant.id, owner.id, name="Luna")
+
+        results = SearchService.search(db, tenant.id, "luna", limit=2)
+
+        assert len(results["pets"]) == 2
+
+    def test_other_tenant_excluded(self, db, tenant, tenant_factory, owner_factory):
+        """Test results are limited to the tenant"""
+        other = tenant_factory()
+        owner_factory(other.id, first_name="Zelda")
+
+        results = SearchService.search(db, tenant.id, "zelda")
+
+        assert results["owners"] == []
+
+
+class TestSearchEndpoint:
+    """Test GET /search"""
+
+    def test_requires_authentication(self, client, tenant, owner_factory):
+        """Test unauthenticated callers cannot search customers"""
+        owner_factory(tenant.id, last_name="Nguyen")
+
+        response = client.get("/api/v1/search/?q=nguyen")
+
+        assert response.status_code == 403
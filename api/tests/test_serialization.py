@@ -0,0 +1,90 @@
+"""
+Tests for list response serialization
+Column projection from response schemas and the orjson fast path
+"""
+import json
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+from src.core.pagination import NEXT_CURSOR_HEADER
+from src.core.serialization import fast_json_response, response_columns, response_load_only
+from src.models.appointment import Appointment, AppointmentStatus
+from src.models.owner import Owner
+from src.schemas.owner import OwnerResponse
+from src.schemas.appointment import AppointmentResponse
+
+
+class TestResponseColumns:
+    """Test selecting columns from a response schema"""
+
+    def test_columns_follow_schema_fields(self):
+        """Test one column per schema field, in schema order"""
+        columns = response_columns(Owner, OwnerResponse)
+
+        assert [c.key for c in columns] == list(OwnerResponse.model_fields)
+
+    def test_unknown_field_rejected(self):
+        """Test schema fields without a column raise ValueError"""
+        class BadResponse(BaseModel):
+            id: str
+            nickname: str
+
+        with pytest.raises(ValueError):
+            response_columns(Owner, BadResponse)
+
+
+class TestColumnLoading:
+    """Test entity queries skip columns responses never return"""
+
+    def test_heavy_columns_deferred(self, db, tenant, owner, staff, service, appointment_factory):
+        """Test photos and custom fields are not loaded with the appointment"""
+        appointment = appointment_factory(tenant.id, owner.id, staff.id, service.id, pet_ids=[uuid4()])
+        db.expunge_all()
+
+        loaded = db.query(Appointment).filter(Appointment.id == appointment.id).one()
+
+        unloaded = inspect(loaded).unloaded
+        assert {"before_photos", "after_photos", "custom_fields", "staff_notes"} <= unloaded
+
+    def test_load_only_response_columns(self, db, tenant, owner, staff, service, appointment_factory):
+        """Test response_load_only loads just the schema's columns"""
+        appointment = appointment_factory(tenant.id, owner.id, staff.id, service.id, pet_ids=[uuid4()])
+        db.expunge_all()
+
+        loaded = db.query(Appointment).options(
+            response_load_only(Appointment, AppointmentResponse)
+        ).filter(Appointment.id == appointment.id).one()
+
+        unloaded = inspect(loaded).unloaded
+        assert "cancellation_reason" in unloaded
+        assert not unloaded & set(AppointmentResponse.model_fields)
+
+
+class TestFastJsonResponse:
+    """Test encoding column rows with orjson"""
+
+    def test_rows_encoded_with_native_types(self, db, tenant, owner, staff, service, appointment_factory):
+        """Test UUIDs, datetimes and enums encode like the response_model path"""
+        appointment = appointment_factory(tenant.id, owner.id, staff.id, service.id, pet_ids=[uuid4()])
+        rows = db.query(Appointment.id, Appointment.status, Appointment.scheduled_start).filter(
+            Appointment.id == appointment.id
+        ).all()
+
+        body = json.loads(fast_json_response(rows, Response()).body)
+
+        assert body[0]["id"] == str(appointment.id)
+        assert body[0]["status"] == AppointmentStatus.CONFIRMED.value
+        assert datetime.fromisoformat(body[0]["scheduled_start"])
+
+    def test_headers_carried_over(self):
+        """Test headers set on the injected response are kept"""
+        response = Response()
+        response.headers[NEXT_CURSOR_HEADER] = "abc"
+
+        result = fast_json_response([], response)
+
+        assert result.headers[NEXT_CURSOR_HEADER] == "abc"
@@ -0,0 +1,212 @@
+"""
+Tests for the SMS outbox
+Enqueueing, worker delivery with the fake transport, retries and status callbacks
+"""
+from src.core.config import settings
+from src.integrations.notification_queue import NotificationQueue
+from src.integrations.sms_transport import FakeSmsTransport, SmsSendError
+from src.models.sms_message import SmsMessage, SmsStatus
+from src.models.sms_status_callback import SmsStatusCallback
+from src.tasks.sms_worker import SmsOutboxWorker
+
+
+class FixedSidTransport:
+    """Transport that accepts every message with the same SID"""
+
+    def __init__(self, sid: str):
+        self.sid = sid
+
+    def send(self, to_phone, body):
+        return self.sid
+
+
+class FailingTransport:
+    """Transport that always fails"""
+
+    def __init__(self, retryable: bool):
+        self.retryable = retryable
+
+    def send(self, to_phone, body):
+        raise SmsSendError("provider down", retryable=self.retryable)
+
+
+def make_worker(transport, **kwargs):
+    kwargs.setdefault("rate_per_second", 1000)
+    kwargs.setdefault("per_number_interval_seconds", 0)
+    return SmsOutboxWorker(transport=transport, concurrency=4, batch_size=50, **kwargs)
+
+
+class TestEnqueueSms:
+    """Test writing to the outbox"""
+
+    def test_dedupe_key_queues_once(self, db, tenant):
+        """Test a second message with the same key is dropped"""
+        first = NotificationQueue.enqueue_sms(db, "+15550000001", "Hi", tenant_id=tenant.id, dedupe_key="k1")
+        second = NotificationQueue.enqueue_sms(db, "+15550000001", "Hi", tenant_id=tenant.id, dedupe_key="k1")
+
+        assert first is not None
+        assert second is None
+        assert db.query(SmsMessage).count() == 1
+
+    def test_batch_enqueue(self, db, tenant):
+        """Test batch enqueue counts only new messages"""
+        messages = [
+            {"to_phone": f"+1555000000{i}", "message": "Hi", "tenant_id": tenant.id, "dedupe_key": f"b{i}"}
+            for i in range(3)
+        ]
+
+        assert NotificationQueue.enqueue_sms_batch(db, messages) == 3
+        assert NotificationQueue.enqueue_sms_batch(db, messages) == 0
+
+
+class TestSmsOutboxWorker:
+    """Test outbox delivery"""
+
+    def test_sends_queued_messages(self, db, tenant):
+        """Test queued messages are sent and marked SENT with the provider SID"""
+        for i in range(5):
+            NotificationQueue.enqueue_sms(db, f"+1555000001{i}", f"Message {i}", tenant_id=tenant.id)
+        db.commit()
+
+        transport = FakeSmsTransport(latency_seconds=0)
+        results = make_worker(transport).process_batch(db)
+
+        assert results["sent"] == 5
+        assert len(transport.sent) == 5
+        db.expire_all()
+        messages = db.query(SmsMessage).all()
+        assert all(m.status == SmsStatus.SENT and m.provider_sid for m in messages)
+
+    def test_transient_failure_is_retried_later(self, db, tenant):
+        """Test a retryable failure requeues with backoff"""
+        NotificationQueue.enqueue_sms(db, "+15550000020", "Hi", tenant_id=tenant.id)
+        db.commit()
+
+        results = make_worker(FailingTransport(retryable=True)).process_batch(db)
+
+        assert results["retried"] == 1
+        db.expire_all()
+        message = db.query(SmsMessage).one()
+        assert message.status == SmsStatus.QUEUED
+        assert message.attempts == 1
+        assert message.last_error == "provider down"
+
+        # Not due yet
+        assert make_worker(FakeSmsTransport(latency_seconds=0)).process_batch(db)["claimed"] == 0
+
+    def test_permanent_failure_fails(self, db, tenant):
+        """Test a non-retryable failure is final"""
+        NotificationQueue.enqueue_sms(db, "+15550000030", "Hi", tenant_id=tenant.id)
+        db.commit()
+
+        results = make_worker(FailingTransport(retryable=False)).process_batch(db)
+
+        assert results["failed"] == 1
+        db.expire_all()
+        assert db.query(SmsMessage).one().status == SmsStatus.FAILED
+
+    def test_per_number_limit_defers_extra_messages(self, db, tenant):
+        """Test one recipient gets one message per interval"""
+        NotificationQueue.enqueue_sms(db, "+15550000040", "First", tenant_id=tenant.id)
+        NotificationQueue.enqueue_sms(db, "+15550000040", "Second", tenant_id=tenant.id)
+        db.commit()
+
+        results = make_worker(FakeSmsTransport(latency_seconds=0), per_number_interval_seconds=60).process_batch(db)
+
+        assert results["sent"] == 1
+        assert results["deferred"] == 1
+        db.expire_all()
+        deferred = db.query(SmsMessage).filter(SmsMessage.status == SmsStatus.QUEUED).one()
+        assert deferred.attempts == 0
+
+    def test_expired_lease_reclaimed(self, db, tenant):
+        """Test a message abandoned mid-send is claimed again"""
+        message_id = NotificationQueue.enqueue_sms(db, "+15550000070", "Hi", tenant_id=tenant.id)
+        message = db.query(SmsMessage).get(message_id)
+        message.status = SmsStatus.SENDING
+        message.attempts = 1
+        db.commit()
+
+        results = make_worker(FakeSmsTransport(latency_seconds=0), max_attempts=3).process_batch(db)
+
+        assert results["sent"] == 1
+
+    def test_expired_final_attempt_fails(self, db, tenant):
+        """Test a message abandoned on its last attempt is failed, not left SENDING"""
+        message_id = NotificationQueue.enqueue_sms(db, "+15550000080", "Hi", tenant_id=tenant.id)
+        message = db.query(SmsMessage).get(message_id)
+        message.status = SmsStatus.SENDING
+        message.attempts = 3
+        db.commit()
+
+        transport = FakeSmsTransport(latency_seconds=0)
+        results = make_worker(transport, max_attempts=3).process_batch(db)
+
+        assert results["failed"] == 1
+        assert transport.sent == []
+        db.expire_all()
+        assert db.query(SmsMessage).one().status == SmsStatus.FAILED
+
+
+class TestRecordStatus:
+    """Test Twilio status callbacks"""
+
+    def test_delivery_status_recorded(self, db, tenant):
+        """Test delivered callback marks the message delivered"""
+        NotificationQueue.enqueue_sms(db, "+15550000050", "Hi", tenant_id=tenant.id)
+        db.commit()
+        make_worker(FakeSmsTransport(latency_seconds=0)).process_batch(db)
+        db.expire_all()
+        message = db.query(SmsMessage).one()
+
+        assert NotificationQueue.record_status(db, message.provider_sid, "delivered") is True
+
+        db.expire_all()
+        assert message.status == SmsStatus.DELIVERED
+        assert message.delivered_at is not None
+
+    def test_out_of_order_callback_ignored(self, db, tenant):
+        """Test a late 'sent' callback does not undo delivery"""
+        NotificationQueue.enqueue_sms(db, "+15550000060", "Hi", tenant_id=tenant.id)
+        db.commit()
+        make_worker(FakeSmsTransport(latency_seconds=0)).process_batch(db)
+        db.expire_all()
+        message = db.query(SmsMessage).one()
+
+        NotificationQueue.record_status(db, message.provider_sid, "delivered")
+
+        assert NotificationQueue.record_status(db, message.provider_sid, "sent") is False
+        db.expire_all()
+        assert message.status == SmsStatus.DELIVERED
+
+    def test_callback_before_sid_recorded(self, db, tenant):
+        """Test a callback arriving before the worker stores the SID is applied once it does"""
+        NotificationQueue.enqueue_sms(db, "+15550000090", "Hi", tenant_id=tenant.id)
+        db.commit()
+
+        assert NotificationQueue.record_status(db, "SMearly", "delivered") is False
+        db.commit()
+
+        make_worker(FixedSidTransport("SMearly")).process_batch(db)
+
+        db.expire_all()
+        message = db.query(SmsMessage).one()
+        assert message.status == SmsStatus.DELIVERED
+        assert message.delivered_at is not None
+        assert db.query(SmsStatusCallback).count() == 0
+
+
+class TestTwilioWebhook:
+    """Test status callback authentication"""
+
+    def test_unsigned_callback_rejected_without_validation(self, client, monkeypatch):
+        """Test callbacks are refused when signature validation is not configured"""
+        monkeypatch.setattr(settings, "SMS_STATUS_CALLBACK_URL", None)
+        monkeypatch.setattr(settings, "SMS_STATUS_CALLBACK_ALLOW_UNSIGNED", False)
+
+        response = client.post(
+            "/webhooks/twilio",
+            data={"MessageSid": "SM123", "MessageStatus": "delivered"}
+        )
+
+        assert response.status_code == 403
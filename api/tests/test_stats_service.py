@@ -0,0 +1,82 @@
+"""
+Tests for Stats Service
+Daily dashboard statistics and their per-tenant cache
+"""
+import pytest
+from datetime import datetime, date, timedelta
+
+from src.models.appointment import AppointmentStatus
+from src.services.stats_service import StatsService, daily_stats_cache
+
+
+@pytest.fixture
+def today_at():
+    """Datetime today at the given hour"""
+    def _at(hour):
+        return datetime.combine(date.today(), datetime.min.time()).replace(hour=hour)
+    return _at
+
+
+class TestGetDailyStats:
+    """Test daily stats aggregation"""
+
+    def test_status_counts_and_revenue(self, db, tenant, owner, staff, service_factory,
+                                       appointment_factory, today_at):
+        """Test counts by status and revenue from completed appointments"""
+        service = service_factory(tenant.id, price=4500)
+        statuses = [
+            AppointmentStatus.COMPLETED,
+            AppointmentStatus.COMPLETED,
+            AppointmentStatus.CONFIRMED,
+            AppointmentStatus.CANCELLED,
+            AppointmentStatus.NO_SHOW
+        ]
+        for hour, appt_status in enumerate(statuses, start=8):
+            appointment_factory(
+                tenant.id, owner.id, staff.id, service.id, status=appt_status,
+                scheduled_start=today_at(hour), scheduled_end=today_at(hour) + timedelta(minutes=45)
+            )
+
+        stats = StatsService.get_daily_stats(db, tenant.id, date.today())
+
+        assert stats["total_appointments"] == 5
+        assert stats["completed"] == 2
+        assert stats["pending"] == 1
+        assert stats["cancelled"] == 1
+        assert stats["no_shows"] == 1
+        assert stats["revenue"] == 9000
+
+    def test_other_days_excluded(self, db, tenant, owner, staff, service, appointment_factory, today_at):
+        """Test appointments on other days are not counted"""
+        tomorrow = today_at(10) + timedelta(days=1)
+        appointment_factory(
+            tenant.id, owner.id, staff.id, service.id,
+            scheduled_start=tomorrow, scheduled_end=tomorrow + timedelta(hours=1)
+        )
+
+        stats = StatsService.get_daily_stats(db, tenant.id, date.today())
+
+        assert stats["total_appointments"] == 0
+        assert stats["revenue"] == 0
+
+
+class TestDailyStatsCache:
+    """Test per-tenant caching"""
+
+    def test_cached_until_appointment_changes(self, db, tenant, owner, staff, service,
+                                              appointment_factory, today_at):
+        """Test status change invalidates the tenant's cached stats"""
+        appointment = appointment_factory(
+            tenant.id, owner.id, staff.id, service.id,
+            scheduled_start=today_at(9), scheduled_end=today_at(10)
+        )
+
+        first = StatsService.get_daily_stats(db, tenant.id, date.today())
+        assert daily_stats_cache.get(tenant.id, date.today()) == first
+        assert first["completed"] == 0
+
+        appointment.status = AppointmentStatus.COMPLETED
+        db.commit()
+
+        assert daily_stats_cache.get(tenant.id, date.today()) is None
+        assert StatsService.get_daily_stats(db, tenant.id, date.today())["completed"] == 1
@@ -0,0 +1,95 @@
+"""
+Tests for Tenant Job Executor
+Parallel per-tenant task execution, error isolation and timeouts
+"""
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from src.tasks.executor import TenantJobExecutor, TenantJobTimeout
+
+
+class InlineExecutor(TenantJobExecutor):
+    """Executor that runs jobs without opening a dedicated connection"""
+
+    def _run_tenant(self, job, tenant_id):
+        return job(None, tenant_id)
+
+
+class TestTenantJobExecutor:
+    """Test fan-out and result aggregation"""
+
+    def test_sums_numeric_results(self):
+        """Test totals are summed across tenants"""
+        tenant_ids = [uuid4() for _ in range(5)]
+        executor = InlineExecutor(max_workers=3, tenant_timeout_seconds=10)
+
+        summary = executor.run("test", lambda db, tenant_id: {"detected": 2, "label": "x"}, tenant_ids)
+
+        assert summary["tenants_processed"] == 5
+        assert summary["tenants_failed"] == 0
+        assert summary["totals"] == {"detected": 10}
+        assert set(summary["tenant_results"]) == {str(t) for t in tenant_ids}
+
+    def test_failing_tenant_does_not_stop_others(self):
+        """Test one tenant's exception is recorded and others complete"""
+        bad, good = uuid4(), uuid4()
+
+        def job(db, tenant_id):
+            if tenant_id == bad:
+                raise RuntimeError("boom")
+            return {"detected": 1}
+
+        summary = InlineExecutor(max_workers=2, tenant_timeout_seconds=10).run("test", job, [bad, good])
+
+        assert summary["tenants_processed"] == 1
+        assert summary["tenants_failed"] == 1
+        assert summary["errors"] == {str(bad): "boom"}
+        assert summary["totals"] == {"detected": 1}
+
+    def test_slow_tenant_times_out(self):
+        """Test a tenant exceeding its time limit is reported without blocking"""
+        slow, fast = uuid4(), uuid4()
+
+        def job(db, tenant_id):
+            if tenant_id == slow:
+                time.sleep(3)
+            return {"detected": 1}
+
+        summary = InlineExecutor(max_workers=2, tenant_timeout_seconds=0.5).run("test", job, [slow, fast])
+
+        assert summary["tenants_processed"] == 1
+        assert summary["tenants_timed_out"] == 1
+        assert str(slow) in summary["errors"]
+
+    def test_no_tenants(self):
+        """Test empty tenant list returns an empty summary"""
+        summary = InlineExecutor().run("test", lambda db, tenant_id: {}, [])
+
+        assert summary["tenants_processed"] == 0
+        assert summary["totals"] == {}
+
+
+class TestTenantTimeoutEnforced:
+    """Test timed-out tenant jobs stop instead of running on in the background"""
+
+    def test_query_after_deadline_refused(self, db):
+        """Test a job cannot start a new statement once its time limit has passed"""
+        executor = TenantJobExecutor(
+            tenant_timeout_seconds=0.2,
+            session_factory=sessionmaker(bind=db.get_bind().engine)
+        )
+        statements = []
+
+        def job(job_db, tenant_id):
+            statements.append(job_db.execute(text("SELECT 1")).scalar())
+            time.sleep(0.4)
+            statements.append(job_db.execute(text("SELECT 2")).scalar())
+
+        with pytest.raises(TenantJobTimeout):
+            executor._run_tenant(job, uuid4())
+
+        assert statements == [1]
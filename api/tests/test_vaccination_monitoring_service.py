@@ -7,10 +7,11 @@ from datetime import date, datetime, timedelta
 from uuid import uuid4
 from sqlalchemy.orm import Session
 
-from src.models.vaccination_record import VaccinationRecord
+from src.models.vaccination_record import VaccinationRecord, VaccinationStatus, VaccinationType
 from src.models.pet import Pet
 from src.models.owner import Owner
 from src.models.tenant import Tenant
+from src.models.sms_message import SmsMessage
 from src.services.vaccination_monitoring_service import VaccinationMonitoringService
 
 
@@ -205,22 +206,25 @@ class TestGetExpiredVaccinations:
 class TestUpdateVaccinationStatuses:
     """Test updating vaccination statuses"""
 
-    def test_update_expired_status(self, db, tenant, pet):
-        """Test updating status for expired vaccination"""
-        # Create vaccination that expired yesterday
-        expired_date = date.today() - timedelta(days=1)
-        vaccination = VaccinationRecord(
+    @staticmethod
+    def _record(db, tenant, pet, expires_in_days, status=VaccinationStatus.CURRENT):
+        record = VaccinationRecord(
             id=uuid4(),
             tenant_id=tenant.id,
             pet_id=pet.id,
-            vaccination_type="Rabies",
-            expiry_date=expired_date,
-            is_current=True  # Still marked as current
+            type=VaccinationType.RABIES,
+            administered_date=date.today() - timedelta(days=365),
+            expiry_date=date.today() + timedelta(days=expires_in_days),
+            status=status
         )
-        db.add(vaccination)
+        db.add(record)
         db.commit()
+        return record
+
+    def test_update_expired_status(self, db, tenant, pet):
+        """Test updating status for expired vaccination"""
+        vaccination = self._record(db, tenant, pet, -1)  # Still marked as current
 
-        # Update statuses
         updated_count = VaccinationMonitoringService.update_vaccination_statuses(
             db=db,
             tenant_id=tenant.id
@@ -228,21 +232,11 @@ class TestUpdateVaccinationStatuses:
 
         assert updated_count == 1
         db.refresh(vaccination)
-        assert vaccination.is_current is False
+        assert vaccination.status == VaccinationStatus.EXPIRED
 
     def test_update_current_status(self, db, tenant, pet):
         """Test vaccination remains current if not expired"""
-        future_date = date.today() + timedelta(days=30)
-        vaccination = VaccinationRecord(
-            id=uuid4(),
-            tenant_id=tenant.id,
-            pet_id=pet.id,
-            vaccination_type="Rabies",
-            expiry_date=future_date,
-            is_current=True
-        )
-        db.add(vaccination)
-        db.commit()
+        vaccination = self._record(db, tenant, pet, 90)
 
         updated_count = VaccinationMonitoringService.update_vaccination_statuses(
             db=db,
@@ -250,8 +244,135 @@ class TestUpdateVaccinationStatuses:
         )
 
         # No updates needed
+        assert updated_count == 0
         db.refresh(vaccination)
-        assert vaccination.is_current is True
+        assert vaccination.status == VaccinationStatus.CURRENT
+
+    def test_refresh_all_statuses(self, db, tenant, pet):
+        """Test each record gets the status for its expiry date"""
+        expired = self._record(db, tenant, pet, -5)
+        expiring = self._record(db, tenant, pet, 10)
+        current = self._record(db, tenant, pet, 200, status=VaccinationStatus.UNKNOWN)
+
+        results = VaccinationMonitoringService.refresh_vaccination_statuses(db)
+
+        assert results["records_updated"] == 3
+        for record in (expired, expiring, current):
+            db.refresh(record)
+        assert expired.status == VaccinationStatus.EXPIRED
+        assert expiring.status == VaccinationStatus.EXPIRING_SOON
+        assert current.status == VaccinationStatus.CURRENT
+
+    def test_pet_follows_latest_record(self, db, tenant, pet):
+        """Test the pet's status comes from its latest-expiring record"""
+        self._record(db, tenant, pet, -5)
+        latest = self._record(db, tenant, pet, 10)
+
+        results = VaccinationMonitoringService.refresh_vaccination_statuses(db)
+
+        assert results["pets_updated"] == 1
+        db.refresh(pet)
+        assert pet.vaccination_status == VaccinationStatus.EXPIRING_SOON.value
+        assert pet.vaccination_expires_at == latest.expiry_date
+
+        # Nothing changes on a second run
+        again = VaccinationMonitoringService.refresh_vaccination_statuses(db)
+        assert again == {"records_updated": 0, "pets_updated": 0}
+
+    def test_deleted_records_ignored(self, db, tenant, pet):
+        """Test soft-deleted records are not updated"""
+        record = self._record(db, tenant, pet, -5)
+        record.deleted_at = datetime.utcnow()
+        db.commit()
+
+        results = VaccinationMonitoringService.refresh_vaccination_statuses(db, tenant.id)
+
+        assert results == {"records_updated": 0, "pets_updated": 0}
+
+
+class TestDispatchAlerts:
+    """Test claiming and queueing alerts of due records"""
+
+    @pytest.fixture
+    def expiring_in(self, db, tenant, pet):
+        """Create a vaccination record expiring the given number of days from today"""
+        def _create(days, **kwargs):
+            record = VaccinationRecord(
+                id=uuid4(),
+                tenant_id=tenant.id,
+                pet_id=pet.id,
+                type=VaccinationType.RABIES,
+                administered_date=date.today() - timedelta(days=365 - days),
+                expiry_date=date.today() + timedelta(days=days),
+                **kwargs
+            )
+            db.add(record)
+            db.commit()
+            return record
+        return _create
+
+    def test_alert_queued_once(self, db, expiring_in):
+        """Test a second dispatch does not queue the same alert again"""
+        record = expiring_in(14)
+
+        first = VaccinationMonitoringService.dispatch_alerts(db, [record.id])
+        second = VaccinationMonitoringService.dispatch_alerts(db, [record.id])
+        db.commit()
+
+        assert first == 1
+        assert second == 0
+        db.refresh(record)
+        assert record.reminder_sent_30d and record.reminder_sent_14d
+        assert not record.reminder_sent_7d
+        assert db.query(SmsMessage).one().dedupe_key.startswith(f"vaccination_14d:{record.id}")
+
+    def test_missed_threshold_caught_up(self, db, expiring_in):
+        """Test a record past a threshold it was never alerted for is alerted"""
+        record = expiring_in(10)  # 14-day alert day was missed
+
+        assert VaccinationMonitoringService.dispatch_alerts(db, [record.id]) == 1
+        assert "10 days" in db.query(SmsMessage).one().body
+
+    def test_alerted_threshold_skipped(self, db, expiring_in):
+        """Test records already alerted for their threshold, not yet in one or expired are skipped"""
+        records = [expiring_in(20, reminder_sent_30d=True), expiring_in(60), expiring_in(-1)]
+
+        assert VaccinationMonitoringService.dispatch_alerts(db, [r.id for r in records]) == 0
+
+    def test_opted_out_owner_skipped(self, db, owner, expiring_in):
+        """Test records of owners without SMS consent are not claimed"""
+        owner.sms_opted_in = False
+        db.commit()
+        record = expiring_in(7)
+
+        VaccinationMonitoringService.dispatch_alerts(db, [record.id])
+        db.commit()
+
+        db.refresh(record)
+        assert record.reminder_sent_7d is False
+
+    def test_renewed_record_alerted_again(self, db, expiring_in):
+        """Test changing the expiry date re-arms the alerts the old date used up"""
+        record = expiring_in(5)
+        VaccinationMonitoringService.dispatch_alerts(db, [record.id])
+        db.commit()
+
+        record.expiry_date = date.today() + timedelta(days=6)
+        db.commit()
+
+        assert record.reminder_sent_7d is False
+        assert VaccinationMonitoringService.dispatch_alerts(db, [record.id]) == 1
+
+    def test_only_given_records_claimed(self, db, expiring_in):
+        """Test records not passed in are left for their own due time"""
+        record = expiring_in(3)
+        other = expiring_in(5)
+
+        VaccinationMonitoringService.dispatch_alerts(db, [record.id])
+        db.commit()
+
+        db.refresh(other)
+        assert other.reminder_sent_7d is False
 
 
 class TestGetPetsWithExpiringVaccinations:
@@ -305,32 +426,86 @@ class TestGetPetsWithExpiringVaccinations:
         assert "Dog2" in pet_names
 
 
-class TestRunDailyMonitoring:
-    """Test daily monitoring task"""
+class TestListExpiringVaccinations:
+    """Test the paginated expiring-vaccination dashboard"""
 
-    def test_run_daily_monitoring_with_expiring_vaccinations(
-        self, db, tenant, vaccination_expiring_30_days, vaccination_expiring_14_days
-    ):
-        """Test daily monitoring detects expiring vaccinations"""
-        results = VaccinationMonitoringService.run_daily_monitoring(
-            db=db,
-            tenant_id=tenant.id
+    @pytest.fixture
+    def expiring_for(self, db, tenant):
+        """Create a pet with a vaccination expiring the given number of days from today"""
+        def _create(owner, days, pet_name="Buddy"):
+            pet = Pet(id=uuid4(), tenant_id=tenant.id, owner_id=owner.id, name=pet_name, species="Dog")
+            db.add(pet)
+            db.add(VaccinationRecord(
+                id=uuid4(),
+                tenant_id=tenant.id,
+                pet_id=pet.id,
+                type=VaccinationType.RABIES,
+                administered_date=date.today() - timedelta(days=365 - days),
+                expiry_date=date.today() + timedelta(days=days)
+            ))
+            db.commit()
+            return pet
+        return _create
+
+    @pytest.fixture
+    def second_owner(self, db, tenant):
+        owner = Owner(
+            id=uuid4(), tenant_id=tenant.id, first_name="Jane", last_name="Roe",
+            email="jane@example.com", phone="+1234567891", sms_opted_in=True
+        )
+        db.add(owner)
+        db.commit()
+        return owner
+
+    def test_pages_soonest_first(self, db, tenant, owner, expiring_for):
+        """Test keyset pages cover every record once, soonest expiry first"""
+        for days in (20, 3, 11, 7, 28):
+            expiring_for(owner, days)
+        expiring_for(owner, 45)  # Outside the window
+
+        first_page, cursor = VaccinationMonitoringService.list_expiring_vaccinations(db, tenant.id, limit=3)
+        second_page, last_cursor = VaccinationMonitoringService.list_expiring_vaccinations(
+            db, tenant.id, cursor=cursor, limit=3
         )
 
-        # Should check all 3 thresholds (30, 14, 7 days)
-        assert results["total_checked"] == 2  # Found 2 expiring vaccinations
-        assert "alerts_sent" in results
-        assert "alerts_failed" in results
+        days = [item["days_until_expiry"] for item in first_page + second_page]
+        assert days == [3, 7, 11, 20, 28]
+        assert last_cursor is None
 
-    def test_run_daily_monitoring_no_expiring(self, db, tenant):
-        """Test daily monitoring with no expiring vaccinations"""
-        results = VaccinationMonitoringService.run_daily_monitoring(
-            db=db,
-            tenant_id=tenant.id
+    def test_group_by_owner(self, db, tenant, owner, second_owner, expiring_for):
+        """Test one row per owner, ordered by their soonest expiry"""
+        expiring_for(owner, 25, pet_name="Buddy")
+        expiring_for(owner, 10, pet_name="Max")
+        expiring_for(second_owner, 5, pet_name="Luna")
+
+        owners, next_cursor = VaccinationMonitoringService.list_expiring_vaccinations(
+            db, tenant.id, group_by_owner=True
+        )
+
+        assert [o["owner_id"] for o in owners] == [str(second_owner.id), str(owner.id)]
+        assert [v["pet_name"] for v in owners[1]["vaccinations"]] == ["Max", "Buddy"]
+        assert next_cursor is None
+
+    def test_group_by_owner_pages(self, db, tenant, owner, second_owner, expiring_for):
+        """Test grouped pages are cut by owner, not by record"""
+        expiring_for(owner, 4)
+        expiring_for(owner, 6)
+        expiring_for(second_owner, 5)
+
+        first_page, cursor = VaccinationMonitoringService.list_expiring_vaccinations(
+            db, tenant.id, limit=1, group_by_owner=True
+        )
+        second_page, _ = VaccinationMonitoringService.list_expiring_vaccinations(
+            db, tenant.id, cursor=cursor, limit=1, group_by_owner=True
         )
 
-        assert results["total_checked"] == 0
-        assert results["alerts_sent"] == 0
+        assert len(first_page[0]["vaccinations"]) == 2
+        assert second_page[0]["owner_id"] == str(second_owner.id)
+
+    def test_invalid_cursor(self, db, tenant):
+        """Test malformed cursors are rejected"""
+        with pytest.raises(ValueError):
+            VaccinationMonitoringService.list_expiring_vaccinations(db, tenant.id, cursor="garbage")
 
 
 class TestAlertScheduling:
@@ -369,30 +544,6 @@ class TestAlertThresholds:
         """Test that alert thresholds are correctly configured"""
         assert VaccinationMonitoringService.ALERT_THRESHOLDS == [30, 14, 7]
 
-    def test_all_thresholds_checked(self, db, tenant, pet):
-        """Test that all thresholds are checked in daily monitoring"""
-        # Create vaccinations at each threshold
-        for days in [30, 14, 7]:
-            expiry_date = date.today() + timedelta(days=days)
-            vaccination = VaccinationRecord(
-                id=uuid4(),
-                tenant_id=tenant.id,
-                pet_id=pet.id,
-                vaccination_type=f"Vaccine_{days}",
-                expiry_date=expiry_date,
-                is_current=True
-            )
-            db.add(vaccination)
-        db.commit()
-
-        results = VaccinationMonitoringService.run_daily_monitoring(
-            db=db,
-            tenant_id=tenant.id
-        )
-
-        # Should find all 3 vaccinations
-        assert results["total_checked"] == 3
-
 
 # Integration tests
 class TestVaccinationMonitoringIntegration:
@@ -414,13 +565,10 @@ class TestVaccinationMonitoringIntegration:
         db.add(vaccination)
         db.commit()
 
-        # 2. Run monitoring
-        results = VaccinationMonitoringService.run_daily_monitoring(
-            db=db,
-            tenant_id=tenant.id
-        )
+        # 2. Dispatch the alert once due
+        queued = VaccinationMonitoringService.dispatch_alerts(db, [vaccination.id])
 
-        assert results["total_checked"] > 0
+        assert queued == 1
 
         # 3. Get expiring vaccinations report
         pets = VaccinationMonitoringService.get_pets_with_expiring_vaccinations(